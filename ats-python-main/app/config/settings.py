@@ -15,10 +15,17 @@ class Settings:
     
     # Database Configuration
     DATABASE_URL: str = os.getenv("DATABASE_URL", "")
+    DB_COPY_THRESHOLD: int = int(os.getenv("DB_COPY_THRESHOLD", "500"))  # Batch size at which inserts switch to COPY
     
     # JWT Configuration (SAME as Node.js backend)
     JWT_SECRET: str = os.getenv("JWT_SECRET", "ats-super-secure-jwt-secret-2024-production-ready")
     
+    # Redis Configuration (queues, job state and rate limiting share one pool per database)
+    REDIS_HOST: str = os.getenv("REDIS_HOST", "147.93.155.233")
+    REDIS_PORT: int = int(os.getenv("REDIS_PORT", "6379"))
+    REDIS_MAX_CONNECTIONS: int = int(os.getenv("REDIS_MAX_CONNECTIONS", "64"))  # Per database and decoding mode
+    REDIS_POOL_TIMEOUT: int = int(os.getenv("REDIS_POOL_TIMEOUT", "10"))  # Seconds to wait for a free pooled connection
+    
     # Node.js Backend Configuration
     NODE_API_URL: str = os.getenv("NODE_API_URL", "http://147.93.155.233:5000/api")
     
@@ -53,6 +60,8 @@ class Settings:
     # Performance Optimization Settings
     PARALLEL_PROCESSING: bool = os.getenv("PARALLEL_PROCESSING", "True").lower() == "true"
     MAX_WORKERS: int = int(os.getenv("MAX_WORKERS", "4"))
+    EXTRACTION_PROCESSES: int = int(os.getenv("EXTRACTION_PROCESSES", "2"))  # Per app process; 0 extracts every file in threads
+    EXTRACTION_PROCESS_MIN_BYTES: int = int(os.getenv("EXTRACTION_PROCESS_MIN_BYTES", "2097152"))  # Smaller files are extracted in a thread
     BATCH_SIZE: int = int(os.getenv("BATCH_SIZE", "50"))
     ENABLE_SMART_OCR: bool = os.getenv("ENABLE_SMART_OCR", "True").lower() == "true"
     OCR_TEXT_THRESHOLD: int = int(os.getenv("OCR_TEXT_THRESHOLD", "200"))
@@ -70,6 +79,7 @@ class Settings:
     PORT: int = int(os.getenv("PORT", "8000"))
     API_PREFIX: str = "/api/v1"
     DEBUG: bool = os.getenv("DEBUG", "False").lower() == "true"
+    WORKERS: int = int(os.getenv("WORKERS", "1"))  # Uvicorn worker processes; >1 only with Redis, since job state falls back to per-process memory
     
     # File Upload Configuration
     UPLOAD_FOLDER: str = os.getenv("UPLOAD_FOLDER", "uploads")
@@ -78,9 +88,14 @@ class Settings:
     MAX_CONCURRENT_FILES: int = int(os.getenv("MAX_CONCURRENT_FILES", "10"))  # Reduced for 8GB RAM
     MAX_CONCURRENT_API_CALLS: int = int(os.getenv("MAX_CONCURRENT_API_CALLS", "5"))  # Reduced for stability
     ULTRA_FAST_BATCH_SIZE: int = int(os.getenv("ULTRA_FAST_BATCH_SIZE", "50"))  # Smaller batches
+    ULTRA_FAST_FLUSH_SIZE: int = int(os.getenv("ULTRA_FAST_FLUSH_SIZE", "500"))  # Completed results saved per DB write
     MEMORY_LIMIT_MB: int = int(os.getenv("MEMORY_LIMIT_MB", "2048"))  # 2GB limit for 8GB system
     ENABLE_ULTRA_FAST_PROCESSING: bool = os.getenv("ENABLE_ULTRA_FAST_PROCESSING", "True").lower() == "true"
     
+    # In-memory bulk job tracking
+    MAX_TRACKED_JOBS: int = int(os.getenv("MAX_TRACKED_JOBS", "1000"))  # Oldest finished jobs are evicted past this many (running jobs never are)
+    JOB_RETENTION_SECONDS: int = int(os.getenv("JOB_RETENTION_SECONDS", "3600"))  # Finished jobs are dropped this long after they finish
+    
     @classmethod
     def validate_settings(cls) -> bool:
         """
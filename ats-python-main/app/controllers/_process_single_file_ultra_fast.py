@@ -7,10 +7,27 @@ import time
 import logging
 import asyncio
 import os
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
+
+from app.config.settings import settings
 
 logger = logging.getLogger(__name__)
 
+# Caps in-flight embedding requests independently of the file-level semaphore
+_EMBED_SEMAPHORE: Optional[asyncio.Semaphore] = None
+
+def _get_embed_semaphore() -> asyncio.Semaphore:
+    """Lazily create the embedding semaphore inside the running event loop."""
+    global _EMBED_SEMAPHORE
+    if _EMBED_SEMAPHORE is None:
+        _EMBED_SEMAPHORE = asyncio.Semaphore(max(1, settings.MAX_CONCURRENT_API_CALLS))
+    return _EMBED_SEMAPHORE
+
+async def _generate_embedding_bounded(openai_service, text: str):
+    """Generate an embedding while holding the shared embedding semaphore."""
+    async with _get_embed_semaphore():
+        return await openai_service.generate_embedding(text)
+
 async def _process_single_file_ultra_fast(file_data: Dict, company_id: int) -> Dict:
     """Ultra-optimized single file processing."""
     try:
@@ -27,7 +44,7 @@ async def _process_single_file_ultra_fast(file_data: Dict, company_id: int) -> D
         
         # Parse and generate embedding simultaneously
         parse_task = openai_service.parse_resume_text(extracted_text)
-        embedding_task = openai_service.generate_embedding(extracted_text[:1000])  # Truncate for speed
+        embedding_task = _generate_embedding_bounded(openai_service, extracted_text[:1000])  # Truncate for speed
         
         # Wait for both to complete
         parsed_data, embedding = await asyncio.gather(parse_task, embedding_task)
@@ -61,8 +78,7 @@ async def _stream_files_ultra_fast(files) -> List[Dict]:
         if file_extension == '.zip':
             # Extract zip files
             from app.controllers.resume_controller import _extract_resume_files_from_zip
-            extracted_files = await _extract_resume_files_from_zip(file)
-            for extracted_file in extracted_files:
+            async for extracted_file in _extract_resume_files_from_zip(file):
                 all_files.append({
                     "filename": extracted_file["filename"],
                     "content": extracted_file["content"],
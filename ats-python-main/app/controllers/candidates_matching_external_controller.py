@@ -45,7 +45,7 @@ from pydantic import BaseModel
 import numpy as np
 from sklearn.metrics.pairwise import cosine_similarity
 from app.services.database_service import DatabaseService
-from app.services.openai_service import OpenAIService
+from app.services.openai_service import openai_service
 from app.config.settings import settings
 from app.utils.explanation_utils import (
     get_skills_explanation, 
@@ -63,7 +63,6 @@ router = APIRouter(prefix="/api/v1/candidates-matching", tags=["candidates-match
 
 # Initialize services
 database_service = DatabaseService()
-openai_service = OpenAIService()
 
 # Simple in-memory cache for GPT responses (in production, use Redis)
 gpt_cache = {}
@@ -580,9 +579,6 @@ async def analyze_skills_with_gpt(job_skills: List[str], candidate_skills: List[
     GPT understands skill synonyms, variations, and industry context.
     """
     try:
-        from app.services.openai_service import OpenAIService
-        openai_service = OpenAIService()
-        
         # Create dynamic skills analysis prompt
         skills_prompt = f"""
 You are an expert HR recruiter analyzing skills alignment. Analyze the following with HIGH ACCURACY and FAIR SCORING:
@@ -670,9 +666,6 @@ async def analyze_experience_with_gpt(job_experience_level: str, candidate_exper
     GPT understands industry context, role requirements, and experience interpretation.
     """
     try:
-        from app.services.openai_service import OpenAIService
-        openai_service = OpenAIService()
-        
         # Create dynamic experience analysis prompt
         experience_prompt = f"""
 You are an expert HR recruiter analyzing experience fit. Analyze the following with HIGH ACCURACY and FAIR SCORING:
@@ -858,9 +851,6 @@ async def analyze_semantic_similarity_with_gpt(
     Analyzes skills, titles, experience, and context semantically.
     """
     try:
-        from app.services.openai_service import OpenAIService
-        openai_service = OpenAIService()
-        
         # Create comprehensive analysis prompt with better understanding
         analysis_prompt = f"""
 You are an expert HR recruiter with deep understanding of technical skills, job requirements, and candidate evaluation. Analyze this job-candidate match with HIGH ACCURACY and FAIR SCORING.
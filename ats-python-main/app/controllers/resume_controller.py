@@ -6,17 +6,26 @@ Simplified version with only essential endpoints.
 import time
 import logging
 import uuid
+import hashlib
 import os
 import json
 import zipfile
 import tempfile
 import shutil
+import mimetypes
 import asyncio
+import random
 import httpx
-from typing import Dict, Any, List, Optional
+import xxhash
+import aiofiles
+import orjson
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Dict, Any, List, Optional, AsyncIterator
 
-from fastapi import APIRouter, File, UploadFile, HTTPException, status, BackgroundTasks, Request, Query
-from fastapi.responses import JSONResponse
+from fastapi import APIRouter, File, UploadFile, HTTPException, status, BackgroundTasks, Request, Query, Depends
+from fastapi.responses import JSONResponse, ORJSONResponse, FileResponse
 from slowapi import Limiter, _rate_limit_exceeded_handler
 from slowapi.util import get_remote_address
 from slowapi.errors import RateLimitExceeded
@@ -27,14 +36,22 @@ from app.models.schemas import (
     HealthResponse
 )
 from app.services.file_processor import FileProcessor
-from app.services.openai_service import OpenAIService
+from app.services.openai_service import openai_service, EMBEDDING_BATCH_SIZE
 from app.services.database_service import DatabaseService
 from app.services.enhanced_resume_processor import enhanced_resume_processor
+from app.services.bulk_job_state import JobState, BulkJobStore, load_bulk_job, update_bulk_job, count_bulk_jobs_by_status
 from app.config.settings import settings
 from app.controllers._process_single_file import _process_single_file
+from app.controllers._process_single_file_ultra_fast import _process_single_file_ultra_fast, _stream_files_ultra_fast
 
-# Global tracking for bulk processing jobs
-bulk_processing_jobs = {}
+# Global tracking for bulk processing jobs, bounded so finished jobs' results don't stay resident forever
+# and indexed by status so the status endpoints don't rescan every job.
+# Running jobs are never evicted. Only touched from the event loop, so no extra locking is needed here.
+bulk_processing_jobs = BulkJobStore(maxsize=settings.MAX_TRACKED_JOBS, ttl=settings.JOB_RETENTION_SECONDS)
+
+# Supported extensions as a set for per-file membership checks, and the rejection message built once
+_ALLOWED_EXTENSIONS = frozenset(ext.lower() for ext in settings.ALLOWED_EXTENSIONS)
+_UNSUPPORTED_FORMAT_ERROR = f"Unsupported file format. Supported formats: {', '.join(settings.ALLOWED_EXTENSIONS)}"
 
 async def create_candidates_from_resume_data(resume_data_ids: List[int], company_id: int, job_id: int = None, auth_token: str = None) -> Dict[str, Any]:
     """
@@ -50,7 +67,7 @@ async def create_candidates_from_resume_data(resume_data_ids: List[int], company
         Dict with success status and results
     """
     try:
-        print(f"🔍 Creating candidates from resume data IDs: {resume_data_ids}")
+        logger.debug(f"Creating candidates from {len(resume_data_ids)} resume data IDs")
         
         # Prepare the request payload
         payload = {
@@ -69,7 +86,7 @@ async def create_candidates_from_resume_data(resume_data_ids: List[int], company
         if auth_token:
             headers["Authorization"] = f"Bearer {auth_token}"
         else:
-            print("⚠️ Warning: No authentication token provided for candidate creation")
+            logger.warning("⚠️ No authentication token provided for candidate creation")
             
         # Make HTTP request to Node.js API
         async with httpx.AsyncClient(timeout=30.0) as client:
@@ -81,13 +98,13 @@ async def create_candidates_from_resume_data(resume_data_ids: List[int], company
             
             if response.status_code == 200:
                 result = response.json()
-                print(f"🔍 Candidate creation successful: {result.get('summary', {})}")
+                logger.debug(f"Candidate creation successful: {result.get('summary', {})}")
                 return {
                     "success": True,
                     "data": result
                 }
             elif response.status_code == 401:
-                print(f"🔍 Candidate creation failed: Authentication error - {response.text}")
+                logger.warning(f"⚠️ Candidate creation failed: Authentication error - {response.text}")
                 return {
                     "success": False,
                     "error": "Authentication failed. Please check your token.",
@@ -95,7 +112,7 @@ async def create_candidates_from_resume_data(resume_data_ids: List[int], company
                     "suggested_action": "Please login again to refresh your authentication token."
                 }
             elif response.status_code == 403:
-                print(f"🔍 Candidate creation failed: Access denied - {response.text}")
+                logger.warning(f"⚠️ Candidate creation failed: Access denied - {response.text}")
                 return {
                     "success": False,
                     "error": "Access denied. Insufficient permissions.",
@@ -103,7 +120,7 @@ async def create_candidates_from_resume_data(resume_data_ids: List[int], company
                     "suggested_action": "Please contact your administrator for access."
                 }
             elif response.status_code == 500:
-                print(f"🔍 Candidate creation failed: Server error - {response.text}")
+                logger.warning(f"⚠️ Candidate creation failed: Server error - {response.text}")
                 return {
                     "success": False,
                     "error": "Server error occurred during candidate creation.",
@@ -111,7 +128,7 @@ async def create_candidates_from_resume_data(resume_data_ids: List[int], company
                     "suggested_action": "Please try again later or contact support."
                 }
             else:
-                print(f"🔍 Candidate creation failed: {response.status_code} - {response.text}")
+                logger.warning(f"⚠️ Candidate creation failed: {response.status_code} - {response.text}")
                 return {
                     "success": False,
                     "error": f"API error: {response.status_code}",
@@ -120,13 +137,13 @@ async def create_candidates_from_resume_data(resume_data_ids: List[int], company
                 }
                 
     except httpx.TimeoutException:
-        print("🔍 Candidate creation timeout")
+        logger.warning("⚠️ Candidate creation timeout")
         return {
             "success": False,
             "error": "Request timeout"
         }
     except Exception as e:
-        print(f"🔍 Candidate creation error: {str(e)}")
+        logger.warning(f"⚠️ Candidate creation error: {str(e)}")
         return {
             "success": False,
             "error": str(e)
@@ -146,60 +163,206 @@ def _normalize_skills(skills_text: str) -> str:
     # No normalization - trust GPT's natural understanding
     return skills_text
 
-async def _extract_resume_files_from_zip(zip_file: UploadFile) -> List[Dict[str, Any]]:
+async def _extract_resume_files_from_zip(zip_file: UploadFile) -> AsyncIterator[Dict[str, Any]]:
     """
-    Extract resume files from a zip file containing folders.
+    Lazily extract resume files from a zip file containing folders.
+    
+    Members are read one at a time straight from the uploaded file, so only
+    the resume currently being yielded is held in memory. Member reads
+    (decompression, plus disk I/O once the upload has spilled to a temp file)
+    go through a worker thread so they don't block the event loop.
     
     Args:
         zip_file: Uploaded zip file
         
-    Returns:
-        List of file data and metadata
+    Yields:
+        File data and metadata for each supported resume file
     """
-    extracted_files = []
+    extracted_count = 0
     
     try:
-        # Create temporary directory for extraction
-        with tempfile.TemporaryDirectory() as temp_dir:
-            # Save zip file to temp directory
-            zip_path = os.path.join(temp_dir, zip_file.filename)
-            with open(zip_path, "wb") as f:
-                content = await zip_file.read()
-                f.write(content)
-            
-            # Extract zip file
-            with zipfile.ZipFile(zip_path, 'r') as zip_ref:
-                zip_ref.extractall(temp_dir)
-            
-            # Recursively find all resume files
-            for root, dirs, files in os.walk(temp_dir):
-                for file in files:
-                    file_path = os.path.join(root, file)
-                    file_extension = os.path.splitext(file)[1].lower()
+        await zip_file.seek(0)
+        with zipfile.ZipFile(zip_file.file, 'r') as zip_ref:
+            for member in zip_ref.infolist():
+                if member.is_dir():
+                    continue
+                
+                file_extension = os.path.splitext(member.filename)[1].lower()
+                
+                # Check if it's a supported resume file
+                if file_extension in _ALLOWED_EXTENSIONS:
+                    file_content = await asyncio.to_thread(zip_ref.read, member)
                     
-                    # Check if it's a supported resume file
-                    if file_extension in settings.ALLOWED_EXTENSIONS:
-                        # Read file content
-                        with open(file_path, "rb") as f:
-                            file_content = f.read()
-                        
-                        # Get relative path from zip root
-                        rel_path = os.path.relpath(file_path, temp_dir)
-                        
-                        extracted_files.append({
-                            "filename": rel_path,  # Keep folder structure in filename
-                            "content": file_content,
-                            "size": len(file_content),
-                            "extension": file_extension
-                        })
-            
-            logger.info(f"Extracted {len(extracted_files)} resume files from zip: {zip_file.filename}")
-            return extracted_files
+                    extracted_count += 1
+                    yield {
+                        "filename": member.filename,  # Keep folder structure in filename
+                        "content": file_content,
+                        "size": len(file_content),
+                        "extension": file_extension
+                    }
+        
+        logger.info(f"Extracted {extracted_count} resume files from zip: {zip_file.filename}")
             
     except Exception as e:
         logger.error(f"Error extracting zip file {zip_file.filename}: {str(e)}")
         raise Exception(f"Failed to extract zip file: {str(e)}")
 
+def _count_resume_files_in_zip(zip_file: UploadFile) -> int:
+    """Count supported resume files in a zip from its central directory, without reading member data."""
+    try:
+        zip_file.file.seek(0)
+        with zipfile.ZipFile(zip_file.file, 'r') as zip_ref:
+            return sum(
+                1 for member in zip_ref.infolist()
+                if not member.is_dir() and os.path.splitext(member.filename)[1].lower() in _ALLOWED_EXTENSIONS
+            )
+    except Exception:
+        return 0
+
+async def _iter_all_files(files: List[UploadFile]) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Yield every file to process from the upload, expanding zip files lazily.
+    
+    A zip that cannot be read yields a single entry carrying "extraction_error"
+    so the caller can record it as a failed result.
+    """
+    for file in files:
+        file_extension = os.path.splitext(file.filename)[1].lower()
+        if file_extension == '.zip':
+            try:
+                async for extracted_file in _extract_resume_files_from_zip(file):
+                    extracted_file["is_from_zip"] = True
+                    extracted_file["original_zip"] = file.filename
+                    yield extracted_file
+            except Exception as e:
+                yield {"filename": file.filename, "extraction_error": str(e)}
+        else:
+            content = await file.read()
+            yield {
+                "filename": file.filename,
+                "content": content,
+                "size": len(content),
+                "extension": file_extension,
+                "is_from_zip": False,
+                "original_zip": None
+            }
+
+@dataclass(slots=True)
+class Counters:
+    """Running per-upload file counters shared by the bulk processing coroutines."""
+    success: int = 0
+    failed: int = 0
+    duplicate: int = 0
+
+def _content_duplicate_result(file_data: Dict[str, Any], first_filename: str, file_index: int) -> Dict[str, Any]:
+    """Build the result entry for a file whose bytes match an earlier file in the same upload."""
+    return {
+        "filename": file_data["filename"],
+        "status": "duplicate",
+        "error": f"Duplicate file content: identical to {first_filename}",
+        "parsed_data": None,
+        "file_type": file_data["extension"].lstrip('.'),
+        "processing_time": 0,
+        "file_index": file_index,
+        "is_from_zip": file_data.get("is_from_zip", False),
+        "original_zip": file_data.get("original_zip"),
+        "failure_type": "duplicate_content"
+    }
+
+def _queue_unique_file(file_data: Dict[str, Any], queue: List[Dict[str, Any]], seen_hashes: Dict[int, str], results: List[Dict], counters: Counters) -> None:
+    """
+    Queue a file for parsing unless identical bytes were already queued in this upload.
+    
+    Byte-identical files are recorded as duplicates straight away so they never
+    reach text extraction, the AI parser or embedding generation. file_data
+    carries the file's 1-based position in the upload as "file_index".
+    """
+    content_hash = xxhash.xxh3_64_intdigest(file_data["content"])
+    first_filename = seen_hashes.get(content_hash)
+    if first_filename is None:
+        seen_hashes[content_hash] = file_data["filename"]
+        queue.append(file_data)
+        return
+    results.append(_content_duplicate_result(file_data, first_filename, file_data["file_index"]))
+    counters.duplicate += 1
+
+# Shared file-level concurrency gate for ultra-fast bulk processing (created lazily inside the event loop)
+_FILE_CONCURRENCY = min(settings.MAX_CONCURRENT_FILES, 2 * (os.cpu_count() or 1))
+_FILE_SEMAPHORE: Optional[asyncio.Semaphore] = None
+
+def _get_file_semaphore() -> asyncio.Semaphore:
+    """
+    Return the bulk file semaphore, capped by the host's CPU count.
+    
+    Text extraction is CPU-bound, so running more files than ~2x cores only
+    makes the parser threads fight each other.
+    """
+    global _FILE_SEMAPHORE
+    if _FILE_SEMAPHORE is None:
+        _FILE_SEMAPHORE = asyncio.Semaphore(_FILE_CONCURRENCY)
+    return _FILE_SEMAPHORE
+
+# Candidate fields reset on every non-duplicate result before/after auto candidate creation
+_CANDIDATE_FAIL_TEMPLATE = {
+    "candidate_created": False,
+    "candidate_creation_error": None,
+    "candidate_id": None,
+    "resume_id": None
+}
+
+
+def _apply_candidate_status(results, **overrides) -> None:
+    """
+    Merge the candidate-creation failure template (plus overrides) into each result.
+    
+    Args:
+        results: Iterable of per-file result dicts to update in place
+        **overrides: Template fields to replace, e.g. candidate_creation_error
+    """
+    candidate_status = _CANDIDATE_FAIL_TEMPLATE | overrides
+    for result in results:
+        result.update(candidate_status)
+
+
+def _resolve_company_id(request: Request, company_id: Optional[int]) -> Optional[int]:
+    """
+    Resolve the company for a bulk request once and memoize it on request.state.
+    
+    Prefers the company_id argument, then the company_id query param, then the
+    company set by the auth middleware.
+    
+    Args:
+        request: Incoming request
+        company_id: Company ID from the endpoint signature
+        
+    Returns:
+        Optional[int]: Resolved company ID, or None if none is usable
+    """
+    if hasattr(request.state, 'resolved_company_id'):
+        return request.state.resolved_company_id
+
+    resolved_company_id = None
+    for candidate in (company_id, request.query_params.get('company_id'), getattr(request.state, 'company_id', None)):
+        if candidate is None or candidate == '':
+            continue
+        try:
+            resolved_company_id = int(candidate)
+            break
+        except (TypeError, ValueError):
+            continue
+
+    request.state.resolved_company_id = resolved_company_id
+    return resolved_company_id
+
+async def get_company_id(request: Request, company_id: Optional[int] = Query(None, description="Company ID for data isolation")) -> Optional[int]:
+    """
+    FastAPI dependency resolving the request's company (query param, then auth middleware) once per request.
+    
+    Returns:
+        Optional[int]: Resolved company ID, or None if none is usable
+    """
+    return _resolve_company_id(request, company_id)
+
 # Create router
 router = APIRouter(prefix="/api/v1", tags=["resume"])
 
@@ -208,7 +371,6 @@ limiter = Limiter(key_func=get_remote_address)
 
 # Initialize services
 file_processor = FileProcessor()
-openai_service = OpenAIService()
 database_service = DatabaseService()
 
 @router.get("/health", response_model=HealthResponse)
@@ -315,7 +477,7 @@ async def get_resume_embeddings_status():
                 # Handle parsed_data that might be a JSON string
                 if isinstance(parsed_data, str):
                     try:
-                        parsed_data = json.loads(parsed_data)
+                        parsed_data = orjson.loads(parsed_data)
                     except (json.JSONDecodeError, TypeError):
                         continue
                 
@@ -482,7 +644,7 @@ async def parse_resume_enhanced(request: Request, file: UploadFile = File(...),
     Raises:
         HTTPException: If file processing or parsing fails
     """
-    start_time = time.time()
+    start_time = time.perf_counter()
     
     if not file:
         raise HTTPException(
@@ -528,7 +690,7 @@ async def parse_resume_enhanced(request: Request, file: UploadFile = File(...),
                     "attempts": result.attempts,
                     "contact_extraction_confidence": result.parsed_data.get('_processing_metadata', {}).get('contact_extraction_confidence', 0.0)
                 }],
-                processing_time=time.time() - start_time
+                processing_time=time.perf_counter() - start_time
             )
         else:
             # Handle processing failure
@@ -554,7 +716,7 @@ async def parse_resume_enhanced(request: Request, file: UploadFile = File(...),
                     "processing_time": result.processing_time,
                     "attempts": result.attempts or []
                 }],
-                processing_time=time.time() - start_time
+                processing_time=time.perf_counter() - start_time
             )
             
     except Exception as e:
@@ -582,7 +744,7 @@ async def parse_resume(request: Request, file: UploadFile = File(...), backgroun
     Raises:
         HTTPException: If file processing or parsing fails
     """
-    start_time = time.time()
+    start_time = time.perf_counter()
     
     # Debug logging
     logger.info(f"🔍 Resume Parse Debug - File received: {file.filename if file else 'None'}")
@@ -616,7 +778,7 @@ async def parse_resume(request: Request, file: UploadFile = File(...), backgroun
     
     try:
         # Process single file
-        file_start_time = time.time()
+        file_start_time = time.perf_counter()
         file_result = {
             "filename": file.filename,
             "status": "failed",
@@ -633,8 +795,8 @@ async def parse_resume(request: Request, file: UploadFile = File(...), backgroun
             else:
                 # Check file extension
                 file_extension = os.path.splitext(file.filename)[1].lower()
-                if file_extension not in settings.ALLOWED_EXTENSIONS:
-                    file_result["error"] = f"Unsupported file format. Supported formats: {', '.join(settings.ALLOWED_EXTENSIONS)}"
+                if file_extension not in _ALLOWED_EXTENSIONS:
+                    file_result["error"] = _UNSUPPORTED_FORMAT_ERROR
                     file_result["file_type"] = file_extension.lstrip('.')
                 else:
                     # Check file size
@@ -648,7 +810,7 @@ async def parse_resume(request: Request, file: UploadFile = File(...), backgroun
                         await _process_single_file(file, file_content, file_size, file_extension, file_result, batch_data_to_save, results, company_id)
         
         except Exception as e:
-            file_processing_time = time.time() - file_start_time
+            file_processing_time = time.perf_counter() - file_start_time
             file_result.update({
                 "error": f"Failed to process file: {str(e)}",
                 "processing_time": file_processing_time
@@ -661,15 +823,10 @@ async def parse_resume(request: Request, file: UploadFile = File(...), backgroun
         successful_files = len([r for r in results if r.get("status") == "success"])
         failed_files = len([r for r in results if r.get("status") == "failed"])
         
-        print(f"🔍 Debug - Results: {results}")
-        print(f"🔍 Debug - Successful files: {successful_files}")
-        print(f"🔍 Debug - Failed files: {failed_files}")
-        print(f"🔍 Debug - Batch data to save: {len(batch_data_to_save)} items")
+        logger.debug(f"Parsed {len(results)} files: {successful_files} successful, {failed_files} failed, {len(batch_data_to_save)} to save")
         
         # Save successful files to database in batch
         if batch_data_to_save:
-            print(f"🔍 Debug - About to save batch data: {len(batch_data_to_save)} items")
-            print(f"🔍 Debug - Batch data content: {batch_data_to_save}")
             try:
                 # Get company_id from request query parameters
                 company_id = request.query_params.get('company_id')
@@ -681,22 +838,10 @@ async def parse_resume(request: Request, file: UploadFile = File(...), backgroun
                 record_ids = await database_service.save_batch_resume_data(batch_data_to_save, company_id)
                 logger.info(f"Successfully saved {len(record_ids)} resume records to database for company: {company_id}")
                 
-                # Save embeddings immediately for resumes that have them
-                for i, (resume_data, db_id) in enumerate(zip(batch_data_to_save, record_ids)):
-                    if 'embedding' in resume_data and resume_data['embedding']:
-                        try:
-                            await database_service.update_resume_embedding_column(
-                                db_id, 
-                                resume_data['embedding']
-                            )
-                            logger.info(f"✅ Embedding saved immediately for resume {i+1}/{len(batch_data_to_save)} (DB ID: {db_id})")
-                        except Exception as e:
-                            logger.error(f"❌ Error saving embedding for resume {i+1} (DB ID: {db_id}): {str(e)}")
-                
             except Exception as e:
                 logger.error(f"Error saving batch data to database: {str(e)}")
         
-        total_processing_time = time.time() - start_time
+        total_processing_time = time.perf_counter() - start_time
         
         return BatchResumeParseResponse(
             total_files=1,
@@ -771,7 +916,7 @@ async def _check_resume_uniqueness(parsed_data: Dict[str, Any]) -> Dict[str, Any
             existing_parsed_data = existing_resume.get('parsed_data', {})
             if isinstance(existing_parsed_data, str):
                 try:
-                    existing_parsed_data = json.loads(existing_parsed_data)
+                    existing_parsed_data = orjson.loads(existing_parsed_data)
                 except:
                     continue
             
@@ -872,7 +1017,7 @@ async def _retry_failed_embeddings():
                 
                 if isinstance(parsed_data, str):
                     try:
-                        parsed_data = json.loads(parsed_data)
+                        parsed_data = orjson.loads(parsed_data)
                     except (json.JSONDecodeError, TypeError):
                         continue
                 
@@ -923,22 +1068,44 @@ async def _generate_embedding_background(parsed_data: Dict[str, Any], resume_id:
             logger.error(f"❌ Embedding generation failed permanently for resume {resume_id} after {max_retries} attempts")
             return False
 
-async def _process_single_file_from_data(file_data: Dict[str, Any], file_result: Dict[str, Any], batch_data_to_save: List[Dict], results: List[Dict], successful_files: int, failed_files: int, duplicate_files: int):
+def _store_resume_file(folder: str, filename: str, content: bytes, metadata: Optional[Dict[str, Any]] = None) -> str:
+    """
+    Write a resume (and optionally its metadata sidecar) to disk.
+    
+    Runs in a worker thread so the directory creation and file writes cost one
+    thread hop instead of blocking the event loop.
+    
+    Args:
+        folder: Destination folder, created if missing
+        filename: Stored filename ("<uuid><extension>")
+        content: Raw file bytes
+        metadata: Optional failure metadata written next to the file as "<uuid>.metadata.json"
+        
+    Returns:
+        str: Path of the stored file
+    """
+    os.makedirs(folder, exist_ok=True)
+    file_path = os.path.join(folder, filename)
+    with open(file_path, "wb") as f:
+        f.write(content)
+    if metadata is not None:
+        metadata_file = os.path.join(folder, f"{os.path.splitext(filename)[0]}.metadata.json")
+        with open(metadata_file, "wb") as f:
+            f.write(orjson.dumps(metadata, option=orjson.OPT_INDENT_2, default=str))
+    return file_path
+
+async def _process_single_file_from_data(file_data: Dict[str, Any], file_result: Dict[str, Any], batch_data_to_save: List[Dict], results: List[Dict], counters: Counters):
     """Process a single file from extracted data (zip or regular file) with uniqueness check."""
-    file_start_time = time.time()  # Start timing the file processing
+    file_start_time = time.perf_counter()  # Start timing the file processing
     try:
-        # Create upload and failed folders
-        os.makedirs(settings.UPLOAD_FOLDER, exist_ok=True)
-        os.makedirs(os.path.join(settings.UPLOAD_FOLDER, "failed"), exist_ok=True)
-        
         # Process file and extract text
         extracted_text = await file_processor.process_file(file_data["content"], file_data["filename"])
         
         if not extracted_text or not extracted_text.strip():
             file_result["error"] = "No text could be extracted from the file"
             file_result["file_type"] = file_data["extension"].lstrip('.')
-            file_result["processing_time"] = time.time() - file_start_time
-            failed_files[0] += 1
+            file_result["processing_time"] = time.perf_counter() - file_start_time
+            counters.failed += 1
             return
         
         # Parse resume with AI
@@ -966,12 +1133,8 @@ async def _process_single_file_from_data(file_data: Dict[str, Any], file_result:
             # Save to failed folder
             file_uuid = str(uuid.uuid4())
             unique_filename = f"{file_uuid}{file_data['extension']}"
-            failed_file_path = os.path.join(settings.UPLOAD_FOLDER, "failed", unique_filename)
             
-            with open(failed_file_path, "wb") as f:
-                f.write(file_data["content"])
-            
-            # Save failure metadata
+            # Save the file with its failure metadata
             metadata = {
                 "failure_reason": uniqueness_check["error"],
                 "failure_type": uniqueness_check["reason"],
@@ -979,36 +1142,36 @@ async def _process_single_file_from_data(file_data: Dict[str, Any], file_result:
                 "failed_at": time.time(),
                 "uniqueness_check": uniqueness_check
             }
-            
-            metadata_file = os.path.join(settings.UPLOAD_FOLDER, "failed", f"{file_uuid}.metadata.json")
-            with open(metadata_file, "w", encoding="utf-8") as f:
-                json.dump(metadata, f, indent=2, ensure_ascii=False)
+            failed_file_path = await asyncio.to_thread(
+                _store_resume_file,
+                os.path.join(settings.UPLOAD_FOLDER, "failed"),
+                unique_filename,
+                file_data["content"],
+                metadata
+            )
             
             file_result.update({
                 "status": "duplicate",
                 "error": uniqueness_check["error"],
                 "file_type": file_data["extension"].lstrip('.'),
-                "processing_time": time.time() - file_start_time,
+                "processing_time": time.perf_counter() - file_start_time,
                 "uniqueness_check": uniqueness_check,
                 "failed_file_path": failed_file_path,
                 "resume_id": file_uuid,
                 "failure_reason": uniqueness_check["error"],
                 "failure_type": uniqueness_check["reason"]
             })
-            duplicate_files[0] += 1
+            counters.duplicate += 1
             logger.warning(f"Duplicate resume rejected: {file_data['filename']} - {uniqueness_check['error']}")
             return
         
         # Resume is unique, save to upload folder
         file_uuid = str(uuid.uuid4())
         unique_filename = f"{file_uuid}{file_data['extension']}"
-        file_path = os.path.join(settings.UPLOAD_FOLDER, unique_filename)
-        
-        with open(file_path, "wb") as f:
-            f.write(file_data["content"])
+        file_path = await asyncio.to_thread(_store_resume_file, settings.UPLOAD_FOLDER, unique_filename, file_data["content"])
         
         # Calculate processing time
-        file_processing_time = time.time() - file_start_time
+        file_processing_time = time.perf_counter() - file_start_time
         
         # Determine final status based on validation
         final_status = "success"
@@ -1043,14 +1206,18 @@ async def _process_single_file_from_data(file_data: Dict[str, Any], file_result:
             "embedding": embedding  # Include embedding in batch data
         })
         
-        successful_files[0] += 1
+        # Keep the running counters in step with the final status so callers never rescan results
+        if final_status == "failed":
+            counters.failed += 1
+        else:
+            counters.success += 1
         logger.info(f"Successfully parsed unique resume: {file_data['filename']}")
         
     except Exception as e:
         file_result.update({
             "error": f"Failed to process file: {str(e)}"
         })
-        failed_files[0] += 1
+        counters.failed += 1
         logger.error(f"Error processing file {file_data['filename']}: {str(e)}")
 
 async def _process_with_queue(files: List[UploadFile], start_time: float) -> BatchResumeParseResponse:
@@ -1100,11 +1267,11 @@ async def _process_with_queue(files: List[UploadFile], start_time: float) -> Bat
             
             # Check file extension
             file_extension = os.path.splitext(file.filename)[1].lower()
-            if file_extension not in settings.ALLOWED_EXTENSIONS:
+            if file_extension not in _ALLOWED_EXTENSIONS:
                 results.append({
                     "filename": file.filename,
                     "status": "failed",
-                    "error": f"Unsupported file format. Supported formats: {', '.join(settings.ALLOWED_EXTENSIONS)}",
+                    "error": _UNSUPPORTED_FORMAT_ERROR,
                     "parsed_data": None,
                     "file_type": file_extension.lstrip('.'),
                     "processing_time": 0,
@@ -1142,7 +1309,7 @@ async def _process_with_queue(files: List[UploadFile], start_time: float) -> Bat
                     "job_id": None
                 })
         
-        total_processing_time = time.time() - start_time
+        total_processing_time = time.perf_counter() - start_time
         successful_files = len([r for r in results if r["status"] == "queued"])
         failed_files = len([r for r in results if r["status"] == "failed"])
         
@@ -1245,7 +1412,7 @@ async def get_queue_status():
             "redis_status": "error"
         }
 
-@router.post("/bulk-parse-resumes")
+@router.post("/bulk-parse-resumes", response_class=ORJSONResponse)
 @limiter.limit("5/minute")  # Rate limit: 5 bulk requests per minute per IP
 async def bulk_parse_resumes(request: Request, files: List[UploadFile] = File(...), company_id: int = Query(None, description="Company ID for data isolation")):
     """
@@ -1272,7 +1439,7 @@ async def bulk_parse_resumes(request: Request, files: List[UploadFile] = File(..
     Raises:
         HTTPException: If file processing or parsing fails
     """
-    start_time = time.time()
+    start_time = time.perf_counter()
     
     # Extract authentication token from request headers
     auth_token = request.headers.get("authorization", "").replace("Bearer ", "") if request.headers.get("authorization") else None
@@ -1281,21 +1448,8 @@ async def bulk_parse_resumes(request: Request, files: List[UploadFile] = File(..
     bulk_job_id = str(uuid.uuid4())
     user_id = getattr(request.client, 'host', 'unknown') if hasattr(request, 'client') else 'unknown'
     
-    # Track the bulk processing job
-    bulk_processing_jobs[bulk_job_id] = {
-        "job_id": bulk_job_id,
-        "status": "processing",
-        "user_id": user_id,
-        "created_at": time.time(),
-        "updated_at": time.time(),
-        "total_files": 0,
-        "processed_files": 0,
-        "successful_files": 0,
-        "failed_files": 0,
-        "duplicate_files": 0,
-        "progress": "0",
-        "results": []
-    }
+    # Resolve company context before any file I/O so every path (including duplicate-only batches) has it
+    resolved_company_id = _resolve_company_id(request, company_id)
     
     # Debug logging
     logger.info(f"Received request - files: {files}")
@@ -1328,9 +1482,26 @@ async def bulk_parse_resumes(request: Request, files: List[UploadFile] = File(..
     except Exception as e:
         logger.warning(f"⚠️ Queue system error: {str(e)}, falling back to synchronous processing")
     
+    # Track the bulk processing job only on the paths that run it here (the queue path tracks its jobs in Redis);
+    # read it back so updates go through the store's tracked dict
+    bulk_processing_jobs[bulk_job_id] = {
+        "job_id": bulk_job_id,
+        "status": "processing",
+        "user_id": user_id,
+        "created_at": time.time(),
+        "updated_at": time.time(),
+        "total_files": 0,
+        "processed_files": 0,
+        "successful_files": 0,
+        "failed_files": 0,
+        "duplicate_files": 0,
+        "progress": "0",
+        "results": []
+    }
+    job = bulk_processing_jobs[bulk_job_id]
+    
     # Fallback: run processing in background and return immediately with jobId
     try:
-        import asyncio
         # Snapshot headers we need
         auth_token = request.headers.get("authorization", "").replace("Bearer ", "") if request.headers.get("authorization") else None
         # Launch background task to process with ultra-fast processing
@@ -1345,13 +1516,16 @@ async def bulk_parse_resumes(request: Request, files: List[UploadFile] = File(..
     except Exception as e:
         logger.warning(f"⚠️ Background task launch failed, executing inline: {str(e)}")
 
-    # Synchronous inline (last resort)
+    # Synchronous inline (last resort); progress is mirrored to Redis like the background paths
+    from app.services.queue_service import queue_service
+    job = JobState(bulk_job_id, job, queue_service.redis_client)
     results = []
-    successful_files = [0]  # Use list to make it mutable
-    failed_files = [0]      # Use list to make it mutable
-    duplicate_files = [0]   # Use list to make it mutable
+    counters = Counters()
     batch_data_to_save = []
     all_files_to_process = []
+    seen_hashes: Dict[int, str] = {}
+    zip_count = 0
+    file_position = 0  # 1-based position of each file in the upload, shared by every result kind
     
     try:
         # Extract files from zip files and collect all files to process
@@ -1359,20 +1533,23 @@ async def bulk_parse_resumes(request: Request, files: List[UploadFile] = File(..
             file_extension = os.path.splitext(file.filename)[1].lower()
             
             if file_extension == '.zip':
+                zip_count += 1
                 # Extract resume files from zip
                 try:
-                    extracted_files = await _extract_resume_files_from_zip(file)
-                    for extracted_file in extracted_files:
-                        all_files_to_process.append({
+                    async for extracted_file in _extract_resume_files_from_zip(file):
+                        file_position += 1
+                        _queue_unique_file({
                             "filename": extracted_file["filename"],
                             "content": extracted_file["content"],
                             "size": extracted_file["size"],
                             "extension": extracted_file["extension"],
                             "is_from_zip": True,
-                            "original_zip": file.filename
-                        })
+                            "original_zip": file.filename,
+                            "file_index": file_position
+                        }, all_files_to_process, seen_hashes, results, counters)
                 except Exception as e:
                     logger.error(f"Error processing zip file {file.filename}: {str(e)}")
+                    file_position += 1
                     results.append({
                         "filename": file.filename,
                         "status": "failed",
@@ -1380,27 +1557,29 @@ async def bulk_parse_resumes(request: Request, files: List[UploadFile] = File(..
                         "parsed_data": None,
                         "file_type": "zip",
                         "processing_time": 0,
-                        "file_index": len(results) + 1
+                        "file_index": file_position
                     })
-                    failed_files[0] += 1
+                    counters.failed += 1
             else:
                 # Regular file
                 file_content = await file.read()
                 file_size = len(file_content)
                 file_ext = os.path.splitext(file.filename)[1].lower()
                 
-                all_files_to_process.append({
+                file_position += 1
+                _queue_unique_file({
                     "filename": file.filename,
                     "content": file_content,
                     "size": file_size,
                     "extension": file_ext,
                     "is_from_zip": False,
-                    "original_zip": None
-                })
+                    "original_zip": None,
+                    "file_index": file_position
+                }, all_files_to_process, seen_hashes, results, counters)
         
         # Update job status with total files count
-        if bulk_job_id in bulk_processing_jobs:
-            bulk_processing_jobs[bulk_job_id].update({
+        if job is not None:
+            await job.update({
                 "total_files": len(all_files_to_process),
                 "updated_at": time.time()
             })
@@ -1408,11 +1587,11 @@ async def bulk_parse_resumes(request: Request, files: List[UploadFile] = File(..
         # Process all collected files
         for i, file_data in enumerate(all_files_to_process):
             # Check if job was cancelled
-            if bulk_job_id in bulk_processing_jobs and bulk_processing_jobs[bulk_job_id].get("status") == "cancelled":
+            if job is not None and await job.cancelled():
                 logger.info(f"Job {bulk_job_id} was cancelled, stopping processing")
                 break
                 
-            file_start_time = time.time()
+            file_start_time = time.perf_counter()
             file_result = {
                 "filename": file_data["filename"],
                 "status": "failed",
@@ -1420,7 +1599,7 @@ async def bulk_parse_resumes(request: Request, files: List[UploadFile] = File(..
                 "parsed_data": None,
                 "file_type": None,
                 "processing_time": 0,
-                "file_index": i + 1,
+                "file_index": file_data["file_index"],
                 "is_from_zip": file_data["is_from_zip"],
                 "original_zip": file_data["original_zip"]
             }
@@ -1429,53 +1608,53 @@ async def bulk_parse_resumes(request: Request, files: List[UploadFile] = File(..
                 # Validate file
                         if not file_data["filename"]:
                             file_result["error"] = "No filename provided"
-                            failed_files[0] += 1
+                            counters.failed += 1
                         else:
                             # Check file extension
                             file_extension = file_data["extension"]
-                            if file_extension not in settings.ALLOWED_EXTENSIONS:
-                                file_result["error"] = f"Unsupported file format. Supported formats: {', '.join(settings.ALLOWED_EXTENSIONS)}"
+                            if file_extension not in _ALLOWED_EXTENSIONS:
+                                file_result["error"] = _UNSUPPORTED_FORMAT_ERROR
                                 file_result["file_type"] = file_extension.lstrip('.')
-                                failed_files[0] += 1
+                                counters.failed += 1
                             else:
                                 # Check file size
                                 file_size = file_data["size"]
                                 if file_size > settings.MAX_FILE_SIZE:
                                     file_result["error"] = f"File size exceeds maximum limit of {settings.MAX_FILE_SIZE} bytes"
                                     file_result["file_type"] = file_extension.lstrip('.')
-                                    failed_files[0] += 1
+                                    counters.failed += 1
                                 else:
                                     # Check if job was cancelled before processing
-                                    if bulk_job_id in bulk_processing_jobs and bulk_processing_jobs[bulk_job_id].get("status") == "cancelled":
+                                    if job is not None and await job.cancelled():
                                         logger.info(f"Job {bulk_job_id} was cancelled, skipping file processing")
                                         file_result["error"] = "Processing cancelled by user"
-                                        failed_files[0] += 1
+                                        counters.failed += 1
                                     else:
                                         # Process the file
-                                        await _process_single_file_from_data(file_data, file_result, batch_data_to_save, results, successful_files, failed_files, duplicate_files)
+                                        await _process_single_file_from_data(file_data, file_result, batch_data_to_save, results, counters)
             
             except Exception as e:
-                file_processing_time = time.time() - file_start_time
+                file_processing_time = time.perf_counter() - file_start_time
                 file_result.update({
                     "error": f"Failed to process file: {str(e)}",
                     "processing_time": file_processing_time
                 })
-                failed_files[0] += 1
+                counters.failed += 1
                 logger.error(f"Error processing file {file.filename}: {str(e)}")
             
             results.append(file_result)
             
             # Update job progress and store results incrementally
-            if bulk_job_id in bulk_processing_jobs:
+            if job is not None:
                 progress_percentage = round(((i + 1) / len(all_files_to_process)) * 100, 2)
-                bulk_processing_jobs[bulk_job_id].update({
+                await job.update({
                     "processed_files": i + 1,
-                    "successful_files": successful_files[0],
-                    "failed_files": failed_files[0],
-                    "duplicate_files": duplicate_files[0],
+                    "successful_files": counters.success,
+                    "failed_files": counters.failed,
+                    "duplicate_files": counters.duplicate,
                     "progress": str(progress_percentage),
                     "updated_at": time.time(),
-                    "results": results.copy()  # Store current results incrementally
+                    "results": results  # Live reference; serialized only when status is read or flushed
                 })
             
             # Progress update every 100 files
@@ -1485,70 +1664,27 @@ async def bulk_parse_resumes(request: Request, files: List[UploadFile] = File(..
         # Save successful files to database in batch
         if batch_data_to_save:
             try:
-                # Prefer the function argument company_id if provided via Query param
-                resolved_company_id = None
-                try:
-                    if company_id is not None:
-                        resolved_company_id = int(company_id)
-                except Exception:
-                    resolved_company_id = None
-
-                # Fallback to query param if not provided in signature
-                if resolved_company_id is None:
-                    qp_id = request.query_params.get('company_id')
-                    if qp_id:
-                        try:
-                            resolved_company_id = int(qp_id)
-                        except Exception:
-                            resolved_company_id = None
-
-                # Fallback to auth middleware state (when JWT protected endpoints are used)
-                if resolved_company_id is None and hasattr(request, 'state') and getattr(request.state, 'company_id', None):
-                    try:
-                        resolved_company_id = int(request.state.company_id)
-                    except Exception:
-                        resolved_company_id = None
-                
-                # Persist
-                print(f"🔍 Debug - About to save batch data: {len(batch_data_to_save)} items")
-                print(f"🔍 Debug - Resolved company_id: {resolved_company_id}")
-                print(f"🔍 Debug - First item keys: {list(batch_data_to_save[0].keys()) if batch_data_to_save else 'No items'}")
+                # Persist (f-string debug args are built eagerly, so only format them when DEBUG is on)
+                debug_enabled = logger.isEnabledFor(logging.DEBUG)
+                if debug_enabled:
+                    logger.debug(f"About to save batch data: {len(batch_data_to_save)} items for company: {resolved_company_id}")
+                    logger.debug(f"First item keys: {list(batch_data_to_save[0].keys())}")
                 record_ids = await database_service.save_batch_resume_data(batch_data_to_save, resolved_company_id)
-                print(f"🔍 Debug - Save returned record_ids: {record_ids}")
-                logger.info(f"Successfully saved {len(record_ids)} resume records to database for company: {resolved_company_id}")
-                
-                # Save embeddings immediately for resumes that have them
-                for i, (resume_data, db_id) in enumerate(zip(batch_data_to_save, record_ids)):
-                    if 'embedding' in resume_data and resume_data['embedding']:
-                        try:
-                            await database_service.update_resume_embedding_column(
-                                db_id, 
-                                resume_data['embedding']
-                            )
-                            logger.info(f"✅ Embedding saved immediately for resume {i+1}/{len(batch_data_to_save)} (DB ID: {db_id})")
-                        except Exception as e:
-                            logger.error(f"❌ Error saving embedding for resume {i+1} (DB ID: {db_id}): {str(e)}")
+                if debug_enabled:
+                    logger.debug(f"Save returned record_ids: {record_ids}")
+                logger.info(f"Successfully saved {len(record_ids)} resume records (with embeddings) to database for company: {resolved_company_id}")
                 
                 # Update all results with candidate creation status (including duplicates)
+                # Duplicate files don't go through candidate creation; the rest are updated after it
+                duplicate_status = {"candidate_created": False, "candidate_creation_error": 'File marked as duplicate'}
                 for result in results:
-                    if result.get('status') == 'duplicate':
-                        # Duplicate files don't go through candidate creation
-                        result['candidate_created'] = False
-                        result['candidate_creation_error'] = 'File marked as duplicate'
-                    else:
-                        # Non-duplicate files will be processed for candidate creation
-                        result['candidate_created'] = False  # Will be updated after candidate creation
-                        result['candidate_creation_error'] = None
-                        result['candidate_id'] = None
-                        result['resume_id'] = None
+                    result.update(duplicate_status if result.get('status') == 'duplicate' else _CANDIDATE_FAIL_TEMPLATE)
 
                 # Auto-create candidates from parsed resume data
-                print(f"🔍 Checking candidate creation: record_ids={len(record_ids) if record_ids else 0}, company_id={resolved_company_id}")
-                print(f"🔍 record_ids content: {record_ids}")
-                print(f"🔍 resolved_company_id: {resolved_company_id}")
+                logger.debug(f"Checking candidate creation: record_ids={len(record_ids) if record_ids else 0}, company_id={resolved_company_id}")
                 if record_ids and resolved_company_id:
                     try:
-                        print(f"🔍 Auto-creating candidates from {len(record_ids)} parsed resumes")
+                        logger.debug(f"Auto-creating candidates from {len(record_ids)} parsed resumes")
                         candidate_creation_result = await create_candidates_from_resume_data(
                             resume_data_ids=record_ids,
                             company_id=resolved_company_id,
@@ -1557,110 +1693,106 @@ async def bulk_parse_resumes(request: Request, files: List[UploadFile] = File(..
                         
                         if candidate_creation_result["success"]:
                             candidate_data = candidate_creation_result["data"]
-                            print(f"🔍 Candidate creation completed: {candidate_data.get('summary', {})}")
+                            if debug_enabled:
+                                logger.debug(f"Candidate creation completed: {candidate_data.get('summary', {})}")
                             
                             # Update the bulk job with candidate creation stats
-                            if bulk_job_id in bulk_processing_jobs:
-                                bulk_processing_jobs[bulk_job_id]["candidates_created"] = candidate_data.get('summary', {}).get('success', 0)
-                                bulk_processing_jobs[bulk_job_id]["candidates_failed"] = candidate_data.get('summary', {}).get('failed', 0)
-                                bulk_processing_jobs[bulk_job_id]["candidates_duplicates"] = candidate_data.get('summary', {}).get('duplicates', 0)
+                            if job is not None:
+                                await job.update({
+                                    "candidates_created": candidate_data.get('summary', {}).get('success', 0),
+                                    "candidates_failed": candidate_data.get('summary', {}).get('failed', 0),
+                                    "candidates_duplicates": candidate_data.get('summary', {}).get('duplicates', 0)
+                                })
                             
                             # Update individual file results with candidate creation status
                             candidates_created = candidate_data.get('summary', {}).get('success', 0)
                             candidates_failed = candidate_data.get('summary', {}).get('failed', 0)
                             
                             # Update results array with candidate creation status
+                            created_status = {"candidate_created": True, "candidate_creation_error": None}
+                            missing_status = {"candidate_created": False, "candidate_creation_error": 'No corresponding database record'}
                             for i, result in enumerate(results):
-                                if i < len(record_ids):  # Only update results that correspond to created records
-                                    result['candidate_created'] = True
-                                    result['candidate_creation_error'] = None
-                                else:
-                                    result['candidate_created'] = False
-                                    result['candidate_creation_error'] = 'No corresponding database record'
+                                # Only results that correspond to created records count as created
+                                result.update(created_status if i < len(record_ids) else missing_status)
                             
-                            # Recalculate successful_files and failed_files based on candidate creation
+                            # Recalculate the success and failed counters based on candidate creation
                             # A file is successful only if both parsing AND candidate creation succeeded
-                            successful_files[0] = candidates_created
-                            failed_files[0] = len(all_files_to_process) - successful_files[0]
-                            
-                            print(f"🔍 Updated counts - Successful: {successful_files[0]}, Failed: {failed_files[0]}")
+                            counters.success = candidates_created
+                            counters.failed = len(all_files_to_process) - counters.success
                             
                         else:
                             error_msg = candidate_creation_result.get('error', 'Unknown error')
                             suggested_action = candidate_creation_result.get('suggested_action', 'Please try again later.')
-                            print(f"🔍 Candidate creation failed: {error_msg}")
-                            print(f"🔍 Suggested action: {suggested_action}")
+                            logger.warning(f"Candidate creation failed: {error_msg} | suggested action: {suggested_action}")
                             
                             # Update the bulk job with error information
-                            if bulk_job_id in bulk_processing_jobs:
-                                bulk_processing_jobs[bulk_job_id]["candidate_creation_error"] = error_msg
-                                bulk_processing_jobs[bulk_job_id]["candidate_creation_suggestion"] = suggested_action
+                            if job is not None:
+                                await job.update({
+                                    "candidate_creation_error": error_msg,
+                                    "candidate_creation_suggestion": suggested_action
+                                })
                             
                             # Update individual file results with candidate creation failure
-                            for result in results:
-                                result['candidate_created'] = False
-                                result['candidate_creation_error'] = error_msg
+                            _apply_candidate_status(
+                                (r for r in results if r.get('status') != 'duplicate'),
+                                candidate_creation_error=error_msg
+                            )
                             
                             # All files failed due to candidate creation failure
-                            failed_files[0] = len(all_files_to_process)
-                            successful_files[0] = 0
-                            
-                            print(f"🔍 All files failed due to candidate creation - Successful: {successful_files[0]}, Failed: {failed_files[0]}")
+                            counters.failed = len(all_files_to_process)
+                            counters.success = 0
                             
                     except Exception as e:
-                        print(f"🔍 Error in auto-candidate creation: {str(e)}")
                         logger.error(f"Error in auto-candidate creation: {str(e)}")
                         
                         # Update the bulk job with error information
-                        if bulk_job_id in bulk_processing_jobs:
-                            bulk_processing_jobs[bulk_job_id]["candidate_creation_error"] = f"Unexpected error: {str(e)}"
-                            bulk_processing_jobs[bulk_job_id]["candidate_creation_suggestion"] = "Please contact support if this issue persists."
+                        if job is not None:
+                            await job.update({
+                                "candidate_creation_error": f"Unexpected error: {str(e)}",
+                                "candidate_creation_suggestion": "Please contact support if this issue persists."
+                            })
                         
                         # Update individual file results with candidate creation failure
-                        for result in results:
-                            result['candidate_created'] = False
-                            result['candidate_creation_error'] = f"Unexpected error: {str(e)}"
+                        _apply_candidate_status(
+                            (r for r in results if r.get('status') != 'duplicate'),
+                            candidate_creation_error=f"Unexpected error: {str(e)}"
+                        )
                         
                         # All files failed due to candidate creation error
-                        failed_files[0] = len(all_files_to_process)
-                        successful_files[0] = 0
-                        
-                        print(f"🔍 All files failed due to candidate creation error - Successful: {successful_files[0]}, Failed: {failed_files[0]}")
+                        counters.failed = len(all_files_to_process)
+                        counters.success = 0
                 else:
                     # No record_ids means all files were duplicates or failed parsing
-                    print(f"🔍 No database records created - all files were duplicates or failed parsing")
-                    print(f"🔍 record_ids: {record_ids}, resolved_company_id: {resolved_company_id}")
+                    logger.debug(f"No database records created - all files were duplicates or failed parsing (company_id={resolved_company_id})")
                     # Count duplicates and failed files
-                    duplicate_count = len([r for r in results if r.get('status') == 'duplicate'])
-                    failed_count = len([r for r in results if r.get('status') == 'failed'])
-                    successful_files[0] = 0
-                    failed_files[0] = duplicate_count + failed_count
-                    print(f"🔍 Final counts - Successful: {successful_files[0]}, Failed: {failed_files[0]}, Duplicates: {duplicate_count}")
+                    duplicate_count = counters.duplicate
+                    failed_count = counters.failed
+                    counters.success = 0
+                    counters.failed = duplicate_count + failed_count
                     
                     # Update results with candidate creation status for non-duplicate files
-                    for result in results:
-                        if result.get('status') != 'duplicate':
-                            result['candidate_created'] = False
-                            result['candidate_creation_error'] = 'No database records created for candidate creation'
-                            result['candidate_id'] = None
-                            result['resume_id'] = None
+                    _apply_candidate_status(
+                        (r for r in results if r.get('status') != 'duplicate'),
+                        candidate_creation_error='No database records created for candidate creation'
+                    )
                 
             except Exception as e:
                 # Surface precise DB error context
                 logger.error(f"Error saving batch data to database: {str(e)} | items={len(batch_data_to_save)}")
         
-        total_processing_time = time.time() - start_time
+        total_processing_time = time.perf_counter() - start_time
+        logger.info(f"Bulk job {bulk_job_id} final counts - Successful: {counters.success}, Failed: {counters.failed}, Duplicates: {counters.duplicate}")
         
         # Update job status to completed
-        if bulk_job_id in bulk_processing_jobs:
-            bulk_processing_jobs[bulk_job_id].update({
+        if job is not None:
+            await job.update({
                 "status": "completed",
                 "updated_at": time.time(),
                 "total_files": len(all_files_to_process),
                 "processed_files": len(all_files_to_process),
-                "successful_files": successful_files[0],
-                "failed_files": failed_files[0],
-                "duplicate_files": duplicate_files[0],
+                "successful_files": counters.success,
+                "failed_files": counters.failed,
+                "duplicate_files": counters.duplicate,
                 "progress": "100",
                 "total_processing_time": total_processing_time,
                 "results": results
@@ -1668,28 +1800,28 @@ async def bulk_parse_resumes(request: Request, files: List[UploadFile] = File(..
         
         return {
             "total_files": len(all_files_to_process),
-            "successful_files": successful_files[0],
-            "failed_files": failed_files[0],
-            "duplicate_files": duplicate_files[0],
+            "successful_files": counters.success,
+            "failed_files": counters.failed,
+            "duplicate_files": counters.duplicate,
             "total_processing_time": total_processing_time,
             "results": results,
             "processing_mode": "synchronous_bulk",
-            "success_rate": round((successful_files[0] / len(all_files_to_process) * 100) if len(all_files_to_process) > 0 else 0, 2),
-            "duplicate_rate": round((duplicate_files[0] / len(all_files_to_process) * 100) if len(all_files_to_process) > 0 else 0, 2),
-            "zip_files_processed": len([f for f in files if f.filename.endswith('.zip')]),
+            "success_rate": round((counters.success / len(all_files_to_process) * 100) if len(all_files_to_process) > 0 else 0, 2),
+            "duplicate_rate": round((counters.duplicate / len(all_files_to_process) * 100) if len(all_files_to_process) > 0 else 0, 2),
+            "zip_files_processed": zip_count,
             "extracted_files_count": len(all_files_to_process),
             "bulk_job_id": bulk_job_id,
-            "candidates_created": bulk_processing_jobs.get(bulk_job_id, {}).get("candidates_created", 0),
-            "candidates_failed": bulk_processing_jobs.get(bulk_job_id, {}).get("candidates_failed", 0),
-            "candidates_duplicates": bulk_processing_jobs.get(bulk_job_id, {}).get("candidates_duplicates", 0)
+            "candidates_created": (job or {}).get("candidates_created", 0),
+            "candidates_failed": (job or {}).get("candidates_failed", 0),
+            "candidates_duplicates": (job or {}).get("candidates_duplicates", 0)
         }
         
     except Exception as e:
         logger.error(f"Error in bulk resume parsing: {str(e)}")
         
         # Update job status to failed
-        if bulk_job_id in bulk_processing_jobs:
-            bulk_processing_jobs[bulk_job_id].update({
+        if job is not None:
+            await job.update({
                 "status": "failed",
                 "updated_at": time.time(),
                 "error": str(e),
@@ -1700,78 +1832,59 @@ async def bulk_parse_resumes(request: Request, files: List[UploadFile] = File(..
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to process bulk resumes: {str(e)}"
         )
+    finally:
+        await job.close()
 
 async def _background_process_bulk(files: List[UploadFile], bulk_job_id: str, company_id: Optional[int], auth_token: Optional[str], request: Request) -> None:
     """Process files in background using the existing synchronous logic, updating bulk_processing_jobs."""
+    from app.services.queue_service import queue_service
+    job = JobState(bulk_job_id, bulk_processing_jobs.setdefault(bulk_job_id, {"job_id": bulk_job_id}), queue_service.redis_client)
+    resolved_company_id = _resolve_company_id(request, company_id)
     try:
-        start_time = time.time()
-        # Collect all files (re-using logic similar to inline flow)
-        all_files_to_process = []
+        start_time = time.perf_counter()
         results: List[Dict[str, Any]] = []
-        successful_files = [0]
-        failed_files = [0]
-        duplicate_files = [0]
+        counters = Counters()
         batch_data_to_save: List[Dict[str, Any]] = []
+        seen_hashes: Dict[int, str] = {}
 
-        for file in files:
-            file_extension = os.path.splitext(file.filename)[1].lower()
-            if file_extension == '.zip':
-                try:
-                    extracted_files = await _extract_resume_files_from_zip(file)
-                    for extracted_file in extracted_files:
-                        all_files_to_process.append({
-                            "filename": extracted_file["filename"],
-                            "content": extracted_file["content"],
-                            "size": extracted_file["size"],
-                            "extension": extracted_file["extension"],
-                            "is_from_zip": True,
-                            "original_zip": file.filename
-                        })
-                except Exception as e:
-                    results.append({
-                        "filename": file.filename,
-                        "status": "failed",
-                        "error": f"Failed to extract zip file: {str(e)}",
-                        "parsed_data": None,
-                        "file_type": "zip",
-                        "processing_time": 0,
-                        "file_index": len(results) + 1
-                    })
-                    failed_files[0] += 1
-            else:
-                content = await file.read()
-                all_files_to_process.append({
-                    "filename": file.filename,
-                    "content": content,
-                    "size": len(content),
-                    "extension": file_extension,
-                    "is_from_zip": False,
-                    "original_zip": None
-                })
+        # Estimate the total up front from zip directories so progress stays meaningful
+        # while files are extracted and processed one at a time.
+        expected_files = sum(
+            _count_resume_files_in_zip(file) if os.path.splitext(file.filename)[1].lower() == '.zip' else 1
+            for file in files
+        )
+        total_files = 0
+        file_position = 0  # 1-based position of each upload entry, including zips that failed to extract
 
-        if bulk_job_id in bulk_processing_jobs:
-            bulk_processing_jobs[bulk_job_id].update({
-                "total_files": len(all_files_to_process),
-                "updated_at": time.time()
+        await job.update({
+            "total_files": expected_files,
+            "updated_at": time.time()
+        })
+
+        processed_files = 0
+        semaphore = _get_file_semaphore()
+        tasks: List[asyncio.Task] = []
+
+        async def _record_result(file_result: Dict[str, Any]) -> None:
+            nonlocal processed_files
+            results.append(file_result)
+            processed_files += 1
+            progress_percentage = round((processed_files / max(1, expected_files, total_files)) * 100, 2)
+            await job.update({
+                "total_files": max(expected_files, total_files),
+                "processed_files": processed_files,
+                "successful_files": counters.success,
+                "failed_files": counters.failed,
+                "duplicate_files": counters.duplicate,
+                "progress": str(progress_percentage),
+                "updated_at": time.time(),
+                "results": results
             })
 
-        for i, file_data in enumerate(all_files_to_process):
-            if bulk_job_id in bulk_processing_jobs and bulk_processing_jobs[bulk_job_id].get("status") == "cancelled":
-                break
-            file_result = {
-                "filename": file_data["filename"],
-                "status": "failed",
-                "error": None,
-                "parsed_data": None,
-                "file_type": None,
-                "processing_time": 0,
-                "file_index": i + 1,
-                "is_from_zip": file_data["is_from_zip"],
-                "original_zip": file_data["original_zip"]
-            }
-            file_start = time.time()
+        async def _process_one(file_data: Dict[str, Any], file_result: Dict[str, Any]) -> None:
+            file_start = time.perf_counter()
             try:
-                await _process_single_file_from_data(file_data, file_result, batch_data_to_save, results, successful_files, failed_files, duplicate_files)
+                await _process_single_file_from_data(file_data, file_result, batch_data_to_save, results, counters)
                 # Post-validate parsed_data for partial_success classification
                 parsed = file_result.get("parsed_data") or {}
                 if isinstance(parsed, dict):
@@ -1788,146 +1901,216 @@ async def _background_process_bulk(files: List[UploadFile], bulk_job_id: str, co
                     file_result["file_type"] = file_data["extension"].lstrip('.')
             except Exception as e:
                 file_result["error"] = f"Failed to process file: {str(e)}"
-                file_result["processing_time"] = time.time() - file_start
-                failed_files[0] += 1
-            results.append(file_result)
-            if bulk_job_id in bulk_processing_jobs:
-                progress_percentage = round(((i + 1) / max(1, len(all_files_to_process))) * 100, 2)
-                bulk_processing_jobs[bulk_job_id].update({
-                    "processed_files": i + 1,
-                    "successful_files": successful_files[0],
-                    "failed_files": failed_files[0],
-                    "duplicate_files": duplicate_files[0],
-                    "progress": str(progress_percentage),
-                    "updated_at": time.time(),
-                    "results": results.copy()
+                file_result["processing_time"] = time.perf_counter() - file_start
+                counters.failed += 1
+            finally:
+                # Release the file bytes and the worker slot as soon as the file is done
+                file_data["content"] = None
+                semaphore.release()
+            await _record_result(file_result)
+
+        async for file_data in _iter_all_files(files):
+            file_position += 1
+            if "extraction_error" in file_data:
+                results.append({
+                    "filename": file_data["filename"],
+                    "status": "failed",
+                    "error": f"Failed to extract zip file: {file_data['extraction_error']}",
+                    "parsed_data": None,
+                    "file_type": "zip",
+                    "processing_time": 0,
+                    "file_index": file_position
                 })
+                counters.failed += 1
+                continue
+
+            if await job.cancelled():
+                break
+            total_files += 1
+            # Byte-identical files within this upload are rejected before any parsing
+            content_hash = xxhash.xxh3_64_intdigest(file_data["content"])
+            first_filename = seen_hashes.get(content_hash)
+            if first_filename is not None:
+                counters.duplicate += 1
+                file_data["content"] = None
+                await _record_result(_content_duplicate_result(file_data, first_filename, file_position))
+                continue
+            seen_hashes[content_hash] = file_data["filename"]
+
+            file_result = {
+                "filename": file_data["filename"],
+                "status": "failed",
+                "error": None,
+                "parsed_data": None,
+                "file_type": None,
+                "processing_time": 0,
+                "file_index": file_position,
+                "is_from_zip": file_data["is_from_zip"],
+                "original_zip": file_data["original_zip"]
+            }
+            # Waiting for a free slot before spawning keeps extraction from running ahead of parsing
+            await semaphore.acquire()
+            tasks.append(asyncio.create_task(_process_one(file_data, file_result)))
+
+        await asyncio.gather(*tasks)
 
         # Save to DB in batch (re-using existing code path)
         if batch_data_to_save:
-            resolved_company_id = None
             try:
-                if company_id is not None:
-                    resolved_company_id = int(company_id)
-            except Exception:
-                resolved_company_id = None
-            if resolved_company_id is None and hasattr(request, 'state') and getattr(request.state, 'company_id', None):
-                try:
-                    resolved_company_id = int(request.state.company_id)
-                except Exception:
-                    resolved_company_id = None
-            try:
-                record_ids = await database_service.save_batch_resume_data(batch_data_to_save, resolved_company_id)
-                for i, (resume_data, db_id) in enumerate(zip(batch_data_to_save, record_ids)):
-                    if 'embedding' in resume_data and resume_data['embedding']:
-                        try:
-                            await database_service.update_resume_embedding_column(db_id, resume_data['embedding'])
-                        except Exception:
-                            pass
+                # Embeddings are written with the rows, in the same transaction
+                await database_service.save_batch_resume_data(batch_data_to_save, resolved_company_id)
             except Exception as e:
                 logger.error(f"Error saving batch data (background): {str(e)}")
 
-        total_time = time.time() - start_time
-        if bulk_job_id in bulk_processing_jobs:
-            bulk_processing_jobs[bulk_job_id].update({
-                "status": "completed",
-                "updated_at": time.time(),
-                "total_files": len(all_files_to_process),
-                "processed_files": len(all_files_to_process),
-                "successful_files": successful_files[0],
-                "failed_files": failed_files[0],
-                "duplicate_files": duplicate_files[0],
-                "progress": "100",
-                "total_processing_time": total_time,
-                "results": results
-            })
+        total_time = time.perf_counter() - start_time
+        await job.update({
+            "status": "completed",
+            "updated_at": time.time(),
+            "total_files": total_files,
+            "processed_files": total_files,
+            "successful_files": counters.success,
+            "failed_files": counters.failed,
+            "duplicate_files": counters.duplicate,
+            "progress": "100",
+            "total_processing_time": total_time,
+            "results": results
+        })
     except Exception as e:
         logger.error(f"Background bulk processing error: {str(e)}")
-        if bulk_job_id in bulk_processing_jobs:
-            bulk_processing_jobs[bulk_job_id].update({
-                "status": "failed",
-                "updated_at": time.time(),
-                "error": str(e),
-                "progress": bulk_processing_jobs[bulk_job_id].get("progress", "0")
-            })
+        await job.update({
+            "status": "failed",
+            "updated_at": time.time(),
+            "error": str(e),
+            "progress": job.get("progress", "0")
+        })
+    finally:
+        await job.close()
 
 async def _background_process_bulk_ultra_fast(files: List[UploadFile], bulk_job_id: str, company_id: Optional[int], auth_token: Optional[str], request: Request) -> None:
     """Ultra-fast background processing with massive parallelization."""
+    from app.services.queue_service import queue_service
+    job = JobState(bulk_job_id, bulk_processing_jobs.setdefault(bulk_job_id, {"job_id": bulk_job_id}), queue_service.redis_client)
+    resolved_company_id = _resolve_company_id(request, company_id)
+    tasks = []
     try:
-        start_time = time.time()
-        
-        # Import ultra-fast processor
-        from app.controllers._process_single_file_ultra_fast import _process_single_file_ultra_fast, _stream_files_ultra_fast
-        from app.config.settings import settings
+        start_time = time.perf_counter()
         
-        # CRITICAL: Process ALL files in parallel (not chunks)
-        MAX_CONCURRENT_FILES = settings.MAX_CONCURRENT_FILES
-        semaphore = asyncio.Semaphore(MAX_CONCURRENT_FILES)
+        # CRITICAL: Process ALL files in parallel (not chunks), bounded by CPU-aware semaphore
+        semaphore = _get_file_semaphore()
         
         async def process_single_file_with_semaphore(file_data):
             async with semaphore:
-                return await _process_single_file_ultra_fast(file_data, company_id)
+                try:
+                    return await _process_single_file_ultra_fast(file_data, resolved_company_id)
+                except Exception as e:
+                    logger.error(f"Error in ultra-fast processing of {file_data['filename']}: {str(e)}")
+                    return {"status": "failed", "error": str(e)}
         
         # Collect all files first (streaming to avoid memory issues)
         logger.info(f"🚀 Collecting files for ultra-fast processing...")
         all_files = await _stream_files_ultra_fast(files)
+        total_files = len(all_files)
         
         # Process ALL files in parallel
-        logger.info(f"🚀 Starting ultra-fast processing of {len(all_files)} files with {MAX_CONCURRENT_FILES} concurrent workers...")
+        logger.info(f"🚀 Starting ultra-fast processing of {total_files} files with {_FILE_CONCURRENCY} concurrent workers...")
         
         # Create tasks for all files
-        tasks = [process_single_file_with_semaphore(file_data) for file_data in all_files]
+        tasks = [asyncio.create_task(process_single_file_with_semaphore(file_data)) for file_data in all_files]
+        all_files = None  # Tasks hold their own file data
         
-        # Process all files concurrently
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-        
-        # Separate successful and failed results
-        successful_results = []
+        # Persist results as they complete, in sub-batches, so DB writes overlap with parsing
+        pending_results = []
+        successful_count = 0
         failed_count = 0
+        processed_count = 0
         
-        for result in results:
+        for next_done in asyncio.as_completed(tasks):
+            result = await next_done
+            processed_count += 1
             if isinstance(result, dict) and result.get('status') == 'success':
-                successful_results.append(result.get('data'))
+                pending_results.append(result.get('data'))
+                successful_count += 1
             else:
                 failed_count += 1
+            
+            if len(pending_results) >= settings.ULTRA_FAST_FLUSH_SIZE:
+                await database_service.save_batch_resume_data_ultra_fast(pending_results, resolved_company_id)
+                pending_results = []
+            
+            await job.update({
+                "total_files": total_files,
+                "processed_files": processed_count,
+                "successful_files": successful_count,
+                "failed_files": failed_count,
+                "progress": str(round((processed_count / max(1, total_files)) * 100, 2)),
+                "updated_at": time.time()
+            })
         
-        # Ultra-fast batch save to database
-        if successful_results:
-            logger.info(f"🚀 Saving {len(successful_results)} successful results to database...")
-            await database_service.save_batch_resume_data_ultra_fast(successful_results, company_id)
+        # Ultra-fast batch save of the remainder
+        if pending_results:
+            logger.info(f"🚀 Saving final {len(pending_results)} successful results to database...")
+            await database_service.save_batch_resume_data_ultra_fast(pending_results, resolved_company_id)
         
-        total_time = time.time() - start_time
+        total_time = time.perf_counter() - start_time
         logger.info(f"🚀 Ultra-fast processing completed in {total_time:.2f} seconds")
-        logger.info(f"🚀 Successfully processed: {len(successful_results)} files")
+        logger.info(f"🚀 Successfully processed: {successful_count} files")
         logger.info(f"🚀 Failed: {failed_count} files")
         
         # Update final status
-        if bulk_job_id in bulk_processing_jobs:
-            bulk_processing_jobs[bulk_job_id].update({
-                "status": "completed",
-                "total_files": len(all_files),
-                "successful_files": len(successful_results),
-                "failed_files": failed_count,
-                "total_processing_time": total_time,
-                "progress": "100"
-            })
+        await job.update({
+            "status": "completed",
+            "total_files": total_files,
+            "processed_files": processed_count,
+            "successful_files": successful_count,
+            "failed_files": failed_count,
+            "total_processing_time": total_time,
+            "progress": "100"
+        })
             
     except Exception as e:
         logger.error(f"Error in ultra-fast processing: {str(e)}")
-        if bulk_job_id in bulk_processing_jobs:
-            bulk_processing_jobs[bulk_job_id].update({
-                "status": "failed",
-                "error": str(e)
-            })
+        await job.update({
+            "status": "failed",
+            "error": str(e)
+        })
+    finally:
+        # Stop files still parsing (and calling OpenAI) once the job has failed or been cancelled
+        outstanding = [task for task in tasks if not task.done()]
+        for task in outstanding:
+            task.cancel()
+        if outstanding:
+            await asyncio.gather(*outstanding, return_exceptions=True)
+        await job.close()
 
-@router.get("/bulk-processing-status/{job_id}")
+# Single-job status lookups in flight, shared by concurrent pollers of the same job
+_JOB_STATUS_INFLIGHT: Dict[str, asyncio.Future] = {}
+
+@router.get("/bulk-processing-status/{job_id}", response_class=ORJSONResponse)
 async def get_bulk_job_status(job_id: str):
-    """Return precise status for a single bulk job (background or in-memory)."""
+    """
+    Return precise status for a single bulk job (background or in-memory).
+    
+    Concurrent polls for the same job share one lookup instead of each
+    reading Redis; the shared lookup is shielded so a disconnecting poller
+    does not cancel it for the others.
+    """
+    lookup = _JOB_STATUS_INFLIGHT.get(job_id)
+    if lookup is None:
+        lookup = asyncio.ensure_future(_lookup_bulk_job_status(job_id))
+        _JOB_STATUS_INFLIGHT[job_id] = lookup
+        lookup.add_done_callback(lambda _: _JOB_STATUS_INFLIGHT.pop(job_id, None))
+    return await asyncio.shield(lookup)
+
+async def _lookup_bulk_job_status(job_id: str) -> Dict[str, Any]:
+    """Look up a single bulk job in Redis, then the queue, then the in-memory store."""
     try:
-        # Prefer Redis if available
+        # Prefer Redis if available: bulk job state shared across workers, then queued job status
         try:
             from app.services.queue_service import queue_service
             if queue_service.redis_client:
+                bulk_job = await load_bulk_job(queue_service.redis_client, job_id)
+                if bulk_job:
+                    return bulk_job
                 status = await queue_service.get_job_status(job_id)
                 if status and not status.get("error"):
                     return status
@@ -1964,6 +2147,8 @@ async def _process_bulk_with_queue(files: List[UploadFile], start_time: float) -
     job_ids = []
     successful_queued = 0
     failed_files = 0
+    payloads = []
+    payload_results = []
     
     try:
         for i, file in enumerate(files):
@@ -2000,11 +2185,11 @@ async def _process_bulk_with_queue(files: List[UploadFile], start_time: float) -
             
             # Check file extension
             file_extension = os.path.splitext(file.filename)[1].lower()
-            if file_extension not in settings.ALLOWED_EXTENSIONS:
+            if file_extension not in _ALLOWED_EXTENSIONS:
                 results.append({
                     "filename": file.filename,
                     "status": "failed",
-                    "error": f"Unsupported file format. Supported formats: {', '.join(settings.ALLOWED_EXTENSIONS)}",
+                    "error": _UNSUPPORTED_FORMAT_ERROR,
                     "parsed_data": None,
                     "file_type": file_extension.lstrip('.'),
                     "processing_time": 0,
@@ -2014,45 +2199,39 @@ async def _process_bulk_with_queue(files: List[UploadFile], start_time: float) -
                 failed_files += 1
                 continue
             
-            # Add to queue
-            try:
-                job_id = await queue_service.add_resume_job(
-                    file_data=file_content,
-                    filename=file.filename
-                )
-                
-                results.append({
-                    "filename": file.filename,
-                    "status": "queued",
-                    "error": None,
-                    "parsed_data": None,
-                    "file_type": file_extension.lstrip('.'),
-                    "processing_time": 0,
-                    "file_index": i + 1,
-                    "job_id": job_id,
-                    "message": "Resume queued for processing. Use job_id to check status."
-                })
-                job_ids.append(job_id)
-                successful_queued += 1
-                
-            except Exception as e:
-                results.append({
-                    "filename": file.filename,
-                    "status": "failed",
-                    "error": f"Failed to queue resume: {str(e)}",
-                    "parsed_data": None,
-                    "file_type": file_extension.lstrip('.'),
-                    "processing_time": 0,
-                    "file_index": i + 1,
-                    "job_id": None
-                })
-                failed_files += 1
+            # Collect for a single pipelined enqueue; the result slot is filled in once job ids are known
+            results.append({
+                "filename": file.filename,
+                "status": "queued",
+                "error": None,
+                "parsed_data": None,
+                "file_type": file_extension.lstrip('.'),
+                "processing_time": 0,
+                "file_index": i + 1,
+                "job_id": None
+            })
+            payloads.append((file_content, file.filename))
+            payload_results.append(results[-1])
             
             # Progress update every 100 files
             if (i + 1) % 100 == 0:
-                logger.info(f"Queued {i + 1}/{len(files)} files...")
+                logger.info(f"Validated {i + 1}/{len(files)} files...")
+        
+        # Enqueue every valid file in pipelined Redis flushes
+        queued_ids = await queue_service.add_resume_jobs_pipeline(payloads) if payloads else []
+        payloads = None  # Release the file bytes; the queue now holds them
+        for result, job_id in zip(payload_results, queued_ids):
+            if job_id:
+                result["job_id"] = job_id
+                result["message"] = "Resume queued for processing. Use job_id to check status."
+                job_ids.append(job_id)
+                successful_queued += 1
+            else:
+                result["status"] = "failed"
+                result["error"] = "Failed to queue resume"
+                failed_files += 1
         
-        total_processing_time = time.time() - start_time
+        total_processing_time = time.perf_counter() - start_time
         
         return {
             "total_files": len(files),
@@ -2077,6 +2256,41 @@ async def _process_bulk_with_queue(files: List[UploadFile], start_time: float) -
             detail=f"Failed to process bulk resumes with queue: {str(e)}"
         )
 
+# Bulk job statuses that can no longer be cancelled
+_FINISHED_JOB_STATUSES = ("completed", "completed_with_errors", "failed", "cancelled")
+
+async def _cancel_bulk_job(job_id: str) -> Optional[Any]:
+    """
+    Cancel a bulk job in this worker's tracking and in Redis, so the worker running it stops.
+    
+    Args:
+        job_id: Bulk job identifier
+        
+    Returns:
+        Any: The job's status before cancellation, or None if no worker knows the job
+    """
+    from app.services.queue_service import queue_service
+    
+    fields = {"status": "cancelled", "updated_at": time.time()}
+    previous = None
+    job = bulk_processing_jobs.get(job_id)
+    if job is not None:
+        previous = job.get("status")
+        if previous not in _FINISHED_JOB_STATUSES:
+            job.update(fields)
+    
+    if queue_service.redis_client:
+        try:
+            redis_previous = await update_bulk_job(queue_service.redis_client, job_id, fields, unless_status=_FINISHED_JOB_STATUSES)
+            if previous is None:
+                previous = redis_previous
+        except Exception as e:
+            logger.warning(f"⚠️ Failed to cancel bulk job {job_id} in Redis: {str(e)}")
+    
+    if previous is not None and previous not in _FINISHED_JOB_STATUSES:
+        _invalidate_status_cache()
+    return previous
+
 @router.post("/cancel-job/{job_id}")
 async def cancel_job(job_id: str):
     """
@@ -2098,8 +2312,13 @@ async def cancel_job(job_id: str):
             )
         
         success = await queue_service.cancel_job(job_id)
+        if not success:
+            # Not a queued job: cancel a bulk job tracked by any worker instead
+            previous = await _cancel_bulk_job(job_id)
+            success = previous is not None and previous not in _FINISHED_JOB_STATUSES
         
         if success:
+            _invalidate_status_cache()
             return {
                 "message": "Job cancelled successfully",
                 "job_id": job_id,
@@ -2131,14 +2350,18 @@ async def cancel_all_jobs():
     try:
         cancelled_count = 0
         
-        # Cancel all jobs in the in-memory tracking
-        for job_id, job in bulk_processing_jobs.items():
-            if job.get("status") in ["processing", "queued"]:
+        # Cancel all active jobs in the in-memory tracking, straight from the status index
+        bulk_processing_jobs.reconcile()
+        active_job_ids = bulk_processing_jobs.by_status["processing"] | bulk_processing_jobs.by_status["queued"]
+        for job_id in active_job_ids:
+            job = bulk_processing_jobs.get(job_id)
+            if job is not None:
                 job["status"] = "cancelled"
                 job["updated_at"] = time.time()
                 cancelled_count += 1
         
         logger.info(f"Cancelled {cancelled_count} processing jobs")
+        _invalidate_status_cache()
         
         return {
             "message": f"Successfully cancelled {cancelled_count} processing jobs",
@@ -2154,60 +2377,105 @@ async def cancel_all_jobs():
             detail=f"Failed to cancel all jobs: {str(e)}"
         )
 
-@router.get("/bulk-processing-status")
-async def get_all_bulk_processing_status():
+# Aggregated /bulk-processing-status response, shared by pollers for a short window
+_STATUS_CACHE_TTL_SECONDS = 0.5
+_STATUS_CACHE: Dict[tuple, tuple] = {}  # (offset, limit, status) -> (computed_at, response)
+_status_cache_lock = asyncio.Lock()
+
+def _invalidate_status_cache() -> None:
+    """Drop the cached status responses so the next poll reflects a state change immediately."""
+    _STATUS_CACHE.clear()
+
+@router.get("/bulk-processing-status", response_class=ORJSONResponse)
+async def get_all_bulk_processing_status(
+    offset: int = Query(0, ge=0, description="Number of matching jobs to skip"),
+    limit: int = Query(100, ge=1, le=1000, description="Maximum number of jobs to return"),
+    status_filter: Optional[str] = Query(None, alias="status", description="Only list jobs with this status")
+):
     """
     Get processing status for all bulk resume jobs from all users.
     Shows how many users are uploading and their progress.
     
+    Totals always cover every job; the jobs list (newest first) and its file
+    results are paginated with offset/limit and can be filtered by status.
+    
+    Concurrent pollers share one aggregation: an operational response is
+    reused for _STATUS_CACHE_TTL_SECONDS, and requests that miss the cache
+    wait on a lock so only one of them recomputes it.
+    
+    Args:
+        offset: Number of matching jobs to skip
+        limit: Maximum number of jobs to return
+        status_filter: Optional job status to filter the jobs list by
+    
     Returns:
         Dict: All users' bulk processing status with user count and progress
     """
+    cache_key = (offset, limit, status_filter)
+    
+    def _cached() -> Optional[Dict[str, Any]]:
+        entry = _STATUS_CACHE.get(cache_key)
+        if entry and time.monotonic() - entry[0] < _STATUS_CACHE_TTL_SECONDS:
+            return entry[1]
+        return None
+    
+    response = _cached()
+    if response is not None:
+        return response
+    
+    async with _status_cache_lock:
+        response = _cached()
+        if response is not None:
+            return response
+        
+        response = await _compute_bulk_processing_status(offset, limit, status_filter)
+        if response.get("status") == "operational":
+            now = time.monotonic()
+            # Drop expired pages so rarely requested parameter combinations don't accumulate
+            for key in [key for key, entry in _STATUS_CACHE.items() if now - entry[0] >= _STATUS_CACHE_TTL_SECONDS]:
+                del _STATUS_CACHE[key]
+            _STATUS_CACHE[cache_key] = (now, response)
+        return response
+
+async def _compute_bulk_processing_status(offset: int, limit: int, status_filter: Optional[str]) -> Dict[str, Any]:
+    """Aggregate the status of every bulk job, from Redis when available or the in-memory store."""
     try:
         from app.services.queue_service import queue_service
         
         # Check if Redis is available
         if not queue_service.redis_client:
-            # Use global tracking for bulk processing jobs
-            total_jobs = len(bulk_processing_jobs)
-            active_jobs = len([job for job in bulk_processing_jobs.values() if job.get("status") in ["processing", "queued"]])
-            completed_jobs = len([job for job in bulk_processing_jobs.values() if job.get("status") == "completed"])
-            failed_jobs = len([job for job in bulk_processing_jobs.values() if job.get("status") == "failed"])
-            duplicate_jobs = len([job for job in bulk_processing_jobs.values() if job.get("status") == "duplicate"])
-            
-            # Count unique users
-            unique_users = set(job.get("user_id", "unknown") for job in bulk_processing_jobs.values())
-            active_users = set(job.get("user_id", "unknown") for job in bulk_processing_jobs.values() if job.get("status") in ["processing", "queued"])
-            
-            # Calculate total file counts from all jobs
-            total_files = sum(job.get("total_files", 0) for job in bulk_processing_jobs.values())
-            successful_files = sum(job.get("successful_files", 0) for job in bulk_processing_jobs.values())
-            failed_files = sum(job.get("failed_files", 0) for job in bulk_processing_jobs.values())
-            duplicate_files = sum(job.get("duplicate_files", 0) for job in bulk_processing_jobs.values())
+            # Use global tracking for bulk processing jobs; counts and totals come from the store's index
+            aggregate = bulk_processing_jobs.aggregate()
+            total_jobs = aggregate["total_jobs"]
+            active_jobs = aggregate["active_jobs"]
+            unique_users = aggregate["total_users"]
+            active_users = aggregate["active_users"]
             
             # Calculate progress based on processed files
-            total_processed_files = successful_files + failed_files + duplicate_files
+            total_files = aggregate["total_files"]
+            total_processed_files = aggregate["successful_files"] + aggregate["failed_files"] + aggregate["duplicate_files"]
             progress_percentage = round((total_processed_files / total_files * 100) if total_files > 0 else 0, 2)
             
-            # Collect all file results from all jobs
+            # Collect the requested page of jobs (newest first) and their file results in a single pass
             all_file_results = []
             filtered_jobs = []
-            for job in bulk_processing_jobs.values():
-                logger.info(f"Job {job.get('job_id')} status: {job.get('status')}, has results: {bool(job.get('results'))}")
+            job_statuses = []
+            page_end = offset + limit
+            matching_jobs = 0
+            for job in reversed(list(bulk_processing_jobs.values())):
+                job_results = job.get("results")
                 # Skip jobs that have no files and no results
-                if (job.get("total_files", 0) == 0) and (not job.get("results")) and (job.get("processed_files", 0) == 0):
+                if (job.get("total_files", 0) == 0) and (not job_results) and (job.get("processed_files", 0) == 0):
                     continue
-                filtered_jobs.append(job)
-                if job.get("results"):
-                    all_file_results.extend(job.get("results", []))
-                    logger.info(f"Job {job.get('job_id')} has {len(job.get('results', []))} results")
-                # Also check for partial results in active jobs
-                elif job.get("status") == "processing" and job.get("processed_files", 0) > 0:
-                    logger.info(f"Job {job.get('job_id')} is processing, processed files: {job.get('processed_files', 0)}")
-                    # Active jobs now have incremental results
-                    if job.get("results"):
-                        all_file_results.extend(job.get("results", []))
-                        logger.info(f"Active job {job.get('job_id')} has {len(job.get('results', []))} partial results")
+                if status_filter and job.get("status") != status_filter:
+                    continue
+                if offset <= matching_jobs < page_end:
+                    filtered_jobs.append(job)
+                    job_statuses.append(job.get("status"))
+                    # Completed and active jobs both carry (incremental) results
+                    if job_results:
+                        all_file_results.extend(job_results)
+                matching_jobs += 1
             
             logger.info(f"Total file results collected: {len(all_file_results)}")
             
@@ -2215,28 +2483,32 @@ async def get_all_bulk_processing_status():
                 "status": "operational",
                 "total_jobs": total_jobs,
                 "active_jobs": active_jobs,
-                "completed_jobs": completed_jobs,
-                "failed_jobs": failed_jobs,
-                "duplicate_jobs": duplicate_jobs,
-                "total_users": len(unique_users),
-                "active_users": len(active_users),
+                "completed_jobs": aggregate["completed_jobs"],
+                "failed_jobs": aggregate["failed_jobs"],
+                "duplicate_jobs": aggregate["duplicate_jobs"],
+                "total_users": unique_users,
+                "active_users": active_users,
                 "progress_percentage": progress_percentage,
                 "jobs": filtered_jobs,
                 "file_results": all_file_results,
+                "total": matching_jobs,
+                "offset": offset,
+                "limit": limit,
+                "next_offset": page_end if page_end < matching_jobs else None,
                 "redis_status": "disconnected",
                 "debug_info": {
                     "jobs_count": len(filtered_jobs),
                     "file_results_count": len(all_file_results),
-                    "job_statuses": [job.get("status") for job in filtered_jobs]
+                    "job_statuses": job_statuses
                 },
                 "summary": {
-                    "total_files": sum(job.get("total_files", 0) for job in filtered_jobs),
-                    "successful_files": sum(job.get("successful_files", 0) for job in filtered_jobs),
-                    "failed_files": sum(job.get("failed_files", 0) for job in filtered_jobs),
-                    "duplicate_files": sum(job.get("duplicate_files", 0) for job in filtered_jobs),
+                    "total_files": total_files,
+                    "successful_files": aggregate["successful_files"],
+                    "failed_files": aggregate["failed_files"],
+                    "duplicate_files": aggregate["duplicate_files"],
                     "total_resumes_uploaded": total_jobs,
-                    "users_uploading": len(unique_users),
-                    "users_currently_active": len(active_users),
+                    "users_uploading": unique_users,
+                    "users_currently_active": active_users,
                     "processing_progress": f"{progress_percentage}%",
                     "estimated_completion": "All completed" if active_jobs == 0 else "Processing..."
                 }
@@ -2244,57 +2516,57 @@ async def get_all_bulk_processing_status():
         
         # Get all job statuses from Redis
         try:
-            # Get all job keys
-            job_keys = queue_service.redis_client.keys("job_status:*")
+            # Get all job statuses (SCAN + one pipelined HGETALL flush), counting as we go
             all_jobs = []
-            
-            for job_key in job_keys:
-                job_id = job_key.replace("job_status:", "")
-                job_data = queue_service.redis_client.hgetall(job_key)
-                
-                if job_data:
-                    # Parse result if available
-                    result = None
-                    if job_data.get("result"):
-                        try:
-                            result = json.loads(job_data["result"])
-                        except json.JSONDecodeError:
-                            result = {"error": "Invalid result format"}
-                    
-                    job_info = {
-                        "job_id": job_id,
-                        "status": job_data.get("status", "unknown"),
-                        "created_at": job_data.get("created_at"),
-                        "updated_at": job_data.get("updated_at"),
-                        "filename": job_data.get("filename"),
-                        "progress": job_data.get("progress", "0"),
-                        "result": result,
-                        "error": job_data.get("error")
-                    }
-                    all_jobs.append(job_info)
-            
-            # Count jobs by status
-            active_jobs = len([j for j in all_jobs if j["status"] in ["queued", "processing"]])
-            completed_jobs = len([j for j in all_jobs if j["status"] == "completed"])
-            failed_jobs = len([j for j in all_jobs if j["status"] == "failed"])
-            duplicate_jobs = len([j for j in all_jobs if j["status"] == "duplicate"])
-            
-            # Count unique users (based on IP or user_id if available)
+            status_counts = Counter()
             unique_users = set()
             active_users = set()
             
-            for job in all_jobs:
-                # Try to get user identifier from job data
-                user_id = job.get("user_id") or job.get("ip_address") or "unknown"
-                unique_users.add(user_id)
+            for job_id, job_data in await queue_service.scan_job_statuses():
+                # Parse result if available
+                result = None
+                if job_data.get("result"):
+                    try:
+                        result = orjson.loads(job_data["result"])
+                    except orjson.JSONDecodeError:
+                        result = {"error": "Invalid result format"}
                 
-                if job["status"] in ["queued", "processing"]:
+                job_info = {
+                    "job_id": job_id,
+                    "status": job_data.get("status", "unknown"),
+                    "created_at": job_data.get("created_at"),
+                    "updated_at": job_data.get("updated_at"),
+                    "filename": job_data.get("filename"),
+                    "progress": job_data.get("progress", "0"),
+                    "result": result,
+                    "error": job_data.get("error")
+                }
+                all_jobs.append(job_info)
+                status_counts[job_info["status"]] += 1
+                
+                # Count unique users (based on IP or user_id if available)
+                user_id = job_data.get("user_id") or job_data.get("ip_address") or "unknown"
+                unique_users.add(user_id)
+                if job_info["status"] in ["queued", "processing"]:
                     active_users.add(user_id)
             
+            # Count jobs by status
+            active_jobs = status_counts["queued"] + status_counts["processing"]
+            completed_jobs = status_counts["completed"]
+            failed_jobs = status_counts["failed"]
+            duplicate_jobs = status_counts["duplicate"]
+            
             # Calculate processing progress
             total_processed = completed_jobs + failed_jobs
             progress_percentage = round((total_processed / len(all_jobs) * 100) if len(all_jobs) > 0 else 0, 2)
             
+            # Bulk upload jobs from every worker, counted from the per-status indexes
+            bulk_job_counts = await count_bulk_jobs_by_status(queue_service.redis_client)
+            
+            # Page the jobs list; counts above still cover every job
+            matching_jobs = [job for job in all_jobs if job["status"] == status_filter] if status_filter else all_jobs
+            page_end = offset + limit
+            
             return {
                 "status": "operational",
                 "total_jobs": len(all_jobs),
@@ -2305,7 +2577,16 @@ async def get_all_bulk_processing_status():
                 "total_users": len(unique_users),
                 "active_users": len(active_users),
                 "progress_percentage": progress_percentage,
-                "jobs": all_jobs,
+                "jobs": matching_jobs[offset:page_end],
+                "total": len(matching_jobs),
+                "offset": offset,
+                "limit": limit,
+                "next_offset": page_end if page_end < len(matching_jobs) else None,
+                "bulk_jobs": {
+                    "total": sum(bulk_job_counts.values()),
+                    "active": bulk_job_counts.get("processing", 0) + bulk_job_counts.get("queued", 0),
+                    "by_status": bulk_job_counts
+                },
                 "redis_status": "connected",
                 "summary": {
                     "total_resumes_uploaded": len(all_jobs),
@@ -2342,6 +2623,64 @@ async def get_all_bulk_processing_status():
             "jobs": []
         }
 
+# resume_id -> filename index of the failed folder, rebuilt only when the directory changes
+_FAILED_FILE_INDEX: Dict[str, Any] = {"folder": None, "mtime_ns": None, "files": {}}
+
+def _get_failed_file_index(failed_folder: str) -> Dict[str, str]:
+    """
+    Map failed resume IDs (the UUID filename stem) to their filenames in the failed folder.
+    
+    The index is built with one scandir pass and reused until the folder's
+    mtime changes (any file added or removed), so lookups are O(1) per ID.
+    Metadata sidecars are not indexed.
+    """
+    mtime_ns = os.stat(failed_folder).st_mtime_ns
+    if _FAILED_FILE_INDEX["folder"] == failed_folder and _FAILED_FILE_INDEX["mtime_ns"] == mtime_ns:
+        return _FAILED_FILE_INDEX["files"]
+    
+    with os.scandir(failed_folder) as entries:
+        files = {
+            os.path.splitext(entry.name)[0]: entry.name
+            for entry in entries
+            if not entry.name.endswith(".metadata.json")
+        }
+    _FAILED_FILE_INDEX.update({"folder": failed_folder, "mtime_ns": mtime_ns, "files": files})
+    return files
+
+def _invalidate_failed_file_index() -> None:
+    """Force the next failed-folder lookup to rescan (after deleting files)."""
+    _FAILED_FILE_INDEX["mtime_ns"] = None
+
+def _delete_failed_resume_files(failed_folder: str, resume_id: str) -> Optional[str]:
+    """
+    Delete a failed resume and its metadata sidecar (run in a worker thread).
+    
+    Raises FileNotFoundError when the failed folder itself does not exist.
+    
+    Args:
+        failed_folder: Failed resumes folder
+        resume_id: Failed resume ID (UUID filename stem)
+        
+    Returns:
+        Optional[str]: Deleted filename, or None if no failed resume has this ID
+    """
+    found_file = _get_failed_file_index(failed_folder).get(resume_id)
+    if not found_file:
+        return None
+    
+    try:
+        os.remove(os.path.join(failed_folder, found_file))
+    except FileNotFoundError:
+        return None
+    finally:
+        _invalidate_failed_file_index()
+    
+    try:
+        os.remove(os.path.join(failed_folder, f"{resume_id}.metadata.json"))
+    except FileNotFoundError:
+        pass
+    return found_file
+
 @router.delete("/failed-resumes/{resume_id}")
 async def delete_failed_resume(resume_id: str):
     """
@@ -2357,20 +2696,15 @@ async def delete_failed_resume(resume_id: str):
         # Create failed folder path
         failed_folder = os.path.join(settings.UPLOAD_FOLDER, "failed")
         
-        # Check if failed folder exists
-        if not os.path.exists(failed_folder):
+        # Find the file by resume ID (UUID pattern) and delete it with its metadata, off the event loop
+        try:
+            found_file = await asyncio.to_thread(_delete_failed_resume_files, failed_folder, resume_id)
+        except FileNotFoundError:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Failed resumes folder not found"
             )
         
-        # Find file by resume ID (UUID pattern)
-        found_file = None
-        for filename in os.listdir(failed_folder):
-            if filename.startswith(resume_id):
-                found_file = filename
-                break
-        
         if not found_file:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -2379,9 +2713,6 @@ async def delete_failed_resume(resume_id: str):
         
         file_path = os.path.join(failed_folder, found_file)
         
-        # Delete the file
-        os.remove(file_path)
-        
         logger.info(f"Successfully deleted failed resume: {found_file} (ID: {resume_id})")
         
         return {
@@ -2400,6 +2731,23 @@ async def delete_failed_resume(resume_id: str):
             detail=f"Failed to delete failed resume: {str(e)}"
         )
 
+# Metadata sidecars parsed per worker-thread call when listing failed resumes
+_METADATA_CHUNK_SIZE = 256
+
+def _load_failed_metadata(metadata_paths: List[str]) -> List[Optional[Dict[str, Any]]]:
+    """Load failed-resume metadata sidecars; None where a file is missing or unreadable."""
+    loaded = []
+    for metadata_path in metadata_paths:
+        try:
+            with open(metadata_path, 'rb') as f:
+                loaded.append(orjson.loads(f.read()))
+        except FileNotFoundError:
+            loaded.append(None)
+        except Exception as e:
+            logger.warning(f"Could not read metadata {metadata_path}: {e}")
+            loaded.append(None)
+    return loaded
+
 @router.get("/failed-resumes")
 async def list_failed_resumes():
     """
@@ -2420,65 +2768,63 @@ async def list_failed_resumes():
                 "message": "No failed resumes folder found"
             }
         
-        # Get all files in failed folder
+        # Get all files in failed folder (scandir caches each entry's stat, so one syscall per file)
         failed_files = []
-        for filename in os.listdir(failed_folder):
-            file_path = os.path.join(failed_folder, filename)
-            if os.path.isfile(file_path):
-                file_size = os.path.getsize(file_path)
+        metadata_paths = []
+        with os.scandir(failed_folder) as entries:
+            for entry in entries:
+                filename = entry.name
+                # Metadata sidecars describe a failed resume; they aren't one themselves
+                if filename.endswith(".metadata.json") or not entry.is_file(follow_symlinks=False):
+                    continue
+                file_stat = entry.stat()
                 file_extension = os.path.splitext(filename)[1].lower()
                 
                 # Extract resume ID from filename (UUID part)
                 resume_id = os.path.splitext(filename)[0]  # Remove extension to get UUID
                 
-                # Try to read failure reason from metadata file
-                failure_reason = "Unknown failure reason"
-                failure_type = "unknown"
-                original_filename = filename  # Default to UUID filename if no metadata
-                metadata_file = os.path.join(failed_folder, f"{resume_id}.metadata.json")
-                
-                if os.path.exists(metadata_file):
-                    try:
-                        with open(metadata_file, 'r', encoding='utf-8') as f:
-                            metadata = json.load(f)
-                            failure_reason = metadata.get("failure_reason", "Unknown failure reason")
-                            failure_type = metadata.get("failure_type", "unknown")
-                            original_filename = metadata.get("original_filename", filename)
-                    except Exception as e:
-                        logger.warning(f"Could not read metadata for {filename}: {e}")
-                
+                # Failure details are filled in from the metadata file below
+                metadata_paths.append(os.path.join(failed_folder, f"{resume_id}.metadata.json"))
                 failed_files.append({
                     "resume_id": resume_id,
-                    "filename": original_filename,  # Use original filename for display
+                    "filename": filename,  # Replaced by the original filename when metadata exists
                     "uuid_filename": filename,  # Keep UUID filename for reference
-                    "file_size": file_size,
+                    "file_size": file_stat.st_size,
                     "file_type": file_extension.lstrip('.'),
-                    "created_at": os.path.getctime(file_path),
-                    "file_path": file_path,
-                    "failure_reason": failure_reason,
-                    "failure_type": failure_type,
+                    "created_at": file_stat.st_ctime,
+                    "file_path": entry.path,
+                    "failure_reason": "Unknown failure reason",
+                    "failure_type": "unknown",
                     "can_reupload": True  # All failed resumes can be re-uploaded
                 })
         
+        # Read the metadata sidecars in worker threads, a chunk per thread, so the event loop stays free
+        metadata_chunks = await asyncio.gather(*(
+            asyncio.to_thread(_load_failed_metadata, metadata_paths[start:start + _METADATA_CHUNK_SIZE])
+            for start in range(0, len(metadata_paths), _METADATA_CHUNK_SIZE)
+        ))
+        # Merge in the metadata and count by failure type in the same pass
+        failure_types = Counter()
+        for failed_file, metadata in zip(failed_files, (m for chunk in metadata_chunks for m in chunk)):
+            if metadata:
+                failed_file["failure_reason"] = metadata.get("failure_reason", "Unknown failure reason")
+                failed_file["failure_type"] = metadata.get("failure_type", "unknown")
+                failed_file["filename"] = metadata.get("original_filename", failed_file["uuid_filename"])
+            failure_types[failed_file["failure_type"]] += 1
+        
         # Sort by creation time (newest first)
         failed_files.sort(key=lambda x: x["created_at"], reverse=True)
         
-        # Count by failure type
-        failure_types = {}
-        for file in failed_files:
-            failure_type = file["failure_type"]
-            failure_types[failure_type] = failure_types.get(failure_type, 0) + 1
-        
         return {
             "failed_resumes": failed_files,
             "total_count": len(failed_files),
             "failed_folder": failed_folder,
             "failure_summary": {
-                "duplicate_resumes": failure_types.get("duplicate", 0),
-                "missing_fields": failure_types.get("missing_required_fields", 0),
-                "parsing_errors": failure_types.get("parsing_error", 0),
-                "file_errors": failure_types.get("file_error", 0),
-                "unknown_errors": failure_types.get("unknown", 0)
+                "duplicate_resumes": failure_types["duplicate"],
+                "missing_fields": failure_types["missing_required_fields"],
+                "parsing_errors": failure_types["parsing_error"],
+                "file_errors": failure_types["file_error"],
+                "unknown_errors": failure_types["unknown"]
             }
         }
         
@@ -2490,6 +2836,15 @@ async def list_failed_resumes():
         )
 
 
+# Failed-folder files read at once when re-uploading
+_REUPLOAD_READ_CONCURRENCY = 32
+# Processed files between re-upload progress publications (the last file always publishes)
+_REUPLOAD_PROGRESS_EVERY = 25
+# Background re-upload jobs also publish progress at least this often, in seconds
+_REUPLOAD_PROGRESS_INTERVAL = 0.5
+# Failed-resume records (with file content) fetched per query by background re-upload jobs
+_REUPLOAD_PREFETCH_SIZE = 50
+
 @router.post("/re-upload-failed-resumes")
 async def re_upload_failed_resumes(request: Request):
     """
@@ -2502,7 +2857,7 @@ async def re_upload_failed_resumes(request: Request):
     Returns:
         Dict: Re-processing results with job tracking
     """
-    start_time = time.time()
+    start_time = time.perf_counter()
     
     try:
         # Parse JSON body to get failed resume IDs
@@ -2518,7 +2873,8 @@ async def re_upload_failed_resumes(request: Request):
     bulk_job_id = str(uuid.uuid4())
     user_id = "reupload_user"  # Simplified for re-upload operations
     
-    # Track the bulk processing job
+    # Track the bulk processing job; progress and per-file results are mirrored to Redis when available
+    from app.services.queue_service import queue_service
     bulk_processing_jobs[bulk_job_id] = {
         "job_id": bulk_job_id,
         "status": "processing",
@@ -2532,6 +2888,7 @@ async def re_upload_failed_resumes(request: Request):
         "duplicate_files": 0,
         "progress": "0"
     }
+    job = JobState(bulk_job_id, bulk_processing_jobs[bulk_job_id], queue_service.redis_client)
     
     logger.info(f"Re-uploading {len(failed_resume_ids)} failed resume IDs: {failed_resume_ids}")
     
@@ -2550,11 +2907,8 @@ async def re_upload_failed_resumes(request: Request):
     
     # Process failed resumes
     results = []
-    successful_files = [0]
-    failed_files = [0]
-    duplicate_files = [0]
+    counters = Counters()
     batch_data_to_save = []
-    all_files_to_process = []
     
     try:
         failed_folder = os.path.join(settings.UPLOAD_FOLDER, "failed")
@@ -2567,35 +2921,21 @@ async def re_upload_failed_resumes(request: Request):
                 detail=f"Failed resumes folder not found: {failed_folder}"
             )
         
+        # Index the failed folder once instead of listing it for every resume ID
+        failed_file_index = _get_failed_file_index(failed_folder)
+        files_to_read = []
+        
         # Process each failed resume ID
         for resume_id in failed_resume_ids:
             # Check if job was cancelled
-            if bulk_job_id in bulk_processing_jobs and bulk_processing_jobs[bulk_job_id].get("status") == "cancelled":
+            if await job.cancelled():
                 logger.info(f"Job {bulk_job_id} was cancelled, stopping re-upload processing")
                 break
             # Find the file by resume ID
-            found_file = None
-            for filename in os.listdir(failed_folder):
-                if filename.startswith(resume_id) and not filename.endswith('.metadata.json'):
-                    found_file = filename
-                    break
+            found_file = failed_file_index.get(resume_id)
             
             if found_file:
-                file_path = os.path.join(failed_folder, found_file)
-                file_extension = os.path.splitext(found_file)[1].lower()
-                
-                # Read file content
-                with open(file_path, "rb") as f:
-                    file_content = f.read()
-                
-                all_files_to_process.append({
-                    "filename": found_file,
-                    "content": file_content,
-                    "size": len(file_content),
-                    "extension": file_extension,
-                    "is_from_failed": True,
-                    "original_resume_id": resume_id
-                })
+                files_to_read.append((resume_id, found_file))
             else:
                 logger.warning(f"Failed resume ID {resume_id} not found in failed folder")
                 results.append({
@@ -2605,98 +2945,128 @@ async def re_upload_failed_resumes(request: Request):
                     "file_type": "unknown",
                     "processing_time": 0
                 })
-                failed_files[0] += 1
+                counters.failed += 1
         
-        # Process all files
-        for i, file_data in enumerate(all_files_to_process):
-            # Check if job was cancelled
-            if bulk_job_id in bulk_processing_jobs and bulk_processing_jobs[bulk_job_id].get("status") == "cancelled":
-                logger.info(f"Job {bulk_job_id} was cancelled, stopping re-upload file processing")
-                break
-            try:
-                # Parse the resume
-                parsed_data = await parse_resume_file(file_data)
-                
-                if parsed_data:
-                    # Check for uniqueness
-                    uniqueness_check = await check_resume_uniqueness(parsed_data)
+        # Read file contents without blocking the event loop, a bounded number at a time
+        read_semaphore = asyncio.Semaphore(_REUPLOAD_READ_CONCURRENCY)
+        
+        async def _read_failed_file(resume_id: str, found_file: str) -> Dict[str, Any]:
+            async with read_semaphore:
+                async with aiofiles.open(os.path.join(failed_folder, found_file), "rb") as f:
+                    file_content = await f.read()
+            return {
+                "filename": found_file,
+                "content": file_content,
+                "size": len(file_content),
+                "extension": os.path.splitext(found_file)[1].lower(),
+                "is_from_failed": True,
+                "original_resume_id": resume_id
+            }
+        
+        all_files_to_process = await asyncio.gather(*(
+            _read_failed_file(resume_id, found_file) for resume_id, found_file in files_to_read
+        ))
+        
+        # Process all files concurrently, bounded by the shared file semaphore
+        semaphore = _get_file_semaphore()
+        processed_files = 0
+        
+        async def _process_one(file_data: Dict[str, Any]) -> None:
+            nonlocal processed_files
+            async with semaphore:
+                # Check if job was cancelled
+                if await job.cancelled():
+                    return
+                try:
+                    # Parse the resume
+                    parsed_data = await parse_resume_file(file_data)
                     
-                    if uniqueness_check["is_unique"]:
-                        # Save to database
-                        resume_id = await save_resume_to_database(parsed_data, file_data)
-                        
-                        # Generate embedding
-                        await generate_resume_embedding(resume_id, parsed_data)
+                    if parsed_data:
+                        # Check for uniqueness
+                        uniqueness_check = await check_resume_uniqueness(parsed_data)
                         
-                        results.append({
-                            "filename": file_data["filename"],
-                            "status": "success",
-                            "parsed_data": parsed_data,
-                            "file_type": file_data["extension"].lstrip('.'),
-                            "processing_time": time.time() - start_time,
-                            "embedding_status": "completed",
-                            "embedding_generated": True
-                        })
-                        successful_files[0] += 1
+                        if uniqueness_check["is_unique"]:
+                            # Save to database
+                            resume_id = await save_resume_to_database(parsed_data, file_data)
+                            
+                            # Generate embedding
+                            await generate_resume_embedding(resume_id, parsed_data)
+                            
+                            results.append({
+                                "filename": file_data["filename"],
+                                "status": "success",
+                                "parsed_data": parsed_data,
+                                "file_type": file_data["extension"].lstrip('.'),
+                                "processing_time": time.perf_counter() - start_time,
+                                "embedding_status": "completed",
+                                "embedding_generated": True
+                            })
+                            counters.success += 1
+                        else:
+                            # Mark as duplicate
+                            results.append({
+                                "filename": file_data["filename"],
+                                "status": "duplicate",
+                                "error": uniqueness_check["error"],
+                                "file_type": file_data["extension"].lstrip('.'),
+                                "processing_time": time.perf_counter() - start_time
+                            })
+                            counters.duplicate += 1
                     else:
-                        # Mark as duplicate
                         results.append({
                             "filename": file_data["filename"],
-                            "status": "duplicate",
-                            "error": uniqueness_check["error"],
+                            "status": "failed",
+                            "error": "Failed to parse resume",
                             "file_type": file_data["extension"].lstrip('.'),
-                            "processing_time": time.time() - start_time
+                            "processing_time": time.perf_counter() - start_time
                         })
-                        duplicate_files[0] += 1
-                else:
+                        counters.failed += 1
+                    
+                except Exception as e:
+                    logger.error(f"Error processing file {file_data['filename']}: {str(e)}")
                     results.append({
                         "filename": file_data["filename"],
                         "status": "failed",
-                        "error": "Failed to parse resume",
+                        "error": str(e),
                         "file_type": file_data["extension"].lstrip('.'),
-                        "processing_time": time.time() - start_time
+                        "processing_time": time.perf_counter() - start_time
                     })
-                    failed_files[0] += 1
+                    counters.failed += 1
                 
-                # Update job progress
-                if bulk_job_id in bulk_processing_jobs:
-                    progress_percentage = round(((i + 1) / len(all_files_to_process)) * 100, 2)
-                    bulk_processing_jobs[bulk_job_id].update({
-                        "processed_files": i + 1,
-                        "successful_files": successful_files[0],
-                        "failed_files": failed_files[0],
-                        "duplicate_files": duplicate_files[0],
+                # Update job progress (single-threaded event loop, so no lock is needed between awaits)
+                processed_files += 1
+                publish_progress = processed_files % _REUPLOAD_PROGRESS_EVERY == 0 or processed_files == len(all_files_to_process)
+                if publish_progress:
+                    progress_percentage = round((processed_files / len(all_files_to_process)) * 100, 2)
+                    await job.update({
+                        "processed_files": processed_files,
+                        "successful_files": counters.success,
+                        "failed_files": counters.failed,
+                        "duplicate_files": counters.duplicate,
                         "progress": str(progress_percentage),
                         "updated_at": time.time(),
-                        "results": results.copy()
+                        "results": results
                     })
-                
-            except Exception as e:
-                logger.error(f"Error processing file {file_data['filename']}: {str(e)}")
-                results.append({
-                    "filename": file_data["filename"],
-                    "status": "failed",
-                    "error": str(e),
-                    "file_type": file_data["extension"].lstrip('.'),
-                    "processing_time": time.time() - start_time
-                })
-                failed_files[0] += 1
+        
+        await asyncio.gather(*(_process_one(file_data) for file_data in all_files_to_process))
+        if job.get("status") == "cancelled":
+            logger.info(f"Job {bulk_job_id} was cancelled, stopped re-upload file processing")
         
         # Mark job as completed
-        if bulk_job_id in bulk_processing_jobs:
-            bulk_processing_jobs[bulk_job_id].update({
-                "status": "completed",
-                "updated_at": time.time()
-            })
+        await job.update({
+            "status": "completed",
+            "updated_at": time.time(),
+            "results": results
+        })
         
-        total_processing_time = time.time() - start_time
+        total_processing_time = time.perf_counter() - start_time
         
         return {
             "job_id": bulk_job_id,
             "total_files": len(failed_resume_ids),
-            "successful_files": successful_files[0],
-            "failed_files": failed_files[0],
-            "duplicate_files": duplicate_files[0],
+            "successful_files": counters.success,
+            "failed_files": counters.failed,
+            "duplicate_files": counters.duplicate,
             "total_processing_time": total_processing_time,
             "results": results
         }
@@ -2704,15 +3074,48 @@ async def re_upload_failed_resumes(request: Request):
     except Exception as e:
         logger.error(f"Error re-uploading failed resumes: {str(e)}")
         # Mark job as failed
-        if bulk_job_id in bulk_processing_jobs:
-            bulk_processing_jobs[bulk_job_id].update({
-                "status": "failed",
-                "updated_at": time.time()
-            })
+        await job.update({
+            "status": "failed",
+            "updated_at": time.time()
+        })
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to re-upload failed resumes: {str(e)}"
         )
+    finally:
+        await job.close()
+
+# Folders with more files than this are unlinked by a small thread pool (os.remove releases the GIL)
+_DELETE_FANOUT_THRESHOLD = 512
+_DELETE_WORKERS = 8
+
+def _remove_file(path: str) -> bool:
+    """Remove a file, returning False if it was already gone (e.g. a concurrent single-resume delete)."""
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        return False
+    return True
+
+def _delete_folder_files(folder: str) -> int:
+    """
+    Delete every regular file directly inside a folder (run in a worker thread).
+    
+    Args:
+        folder: Folder to empty
+        
+    Returns:
+        int: Number of files deleted
+    """
+    with os.scandir(folder) as entries:
+        paths = [entry.path for entry in entries if entry.is_file(follow_symlinks=False)]
+    
+    if len(paths) <= _DELETE_FANOUT_THRESHOLD:
+        return sum(_remove_file(path) for path in paths)
+    
+    chunksize = max(1, len(paths) // (_DELETE_WORKERS * 4))
+    with ThreadPoolExecutor(max_workers=_DELETE_WORKERS) as executor:
+        return sum(executor.map(_remove_file, paths, chunksize=chunksize))
 
 @router.delete("/failed-resumes")
 async def delete_all_failed_resumes():
@@ -2733,13 +3136,9 @@ async def delete_all_failed_resumes():
                 "deleted_count": 0
             }
         
-        # Get all files in failed folder
-        deleted_count = 0
-        for filename in os.listdir(failed_folder):
-            file_path = os.path.join(failed_folder, filename)
-            if os.path.isfile(file_path):
-                os.remove(file_path)
-                deleted_count += 1
+        # Delete all files in failed folder off the event loop
+        deleted_count = await asyncio.to_thread(_delete_folder_files, failed_folder)
+        _invalidate_failed_file_index()
         
         logger.info(f"Successfully deleted {deleted_count} failed resumes")
         
@@ -2756,6 +3155,43 @@ async def delete_all_failed_resumes():
             detail=f"Failed to delete all failed resumes: {str(e)}"
         )
 
+def _resume_embedding_text(parsed_data: Dict[str, Any]) -> str:
+    """
+    Build the text embedded for a resume - ONLY SKILLS AND EXPERIENCE.
+    
+    Args:
+        parsed_data: Parsed resume data
+        
+    Returns:
+        str: Newline-joined skills, experience and total experience sections
+    """
+    skills = parsed_data.get('Skills', [])
+    experience = parsed_data.get('Experience', [])
+    total_experience = parsed_data.get('TotalExperience', '')
+    
+    text_parts = []
+    
+    # Add skills with normalization
+    if skills:
+        skills_text = ", ".join(skills) if isinstance(skills, list) else str(skills)
+        # Normalize common skill variations for better matching
+        skills_text = _normalize_skills(skills_text)
+        text_parts.append(f"Skills: {skills_text}")
+    
+    # Add experience
+    if experience:
+        if isinstance(experience, list):
+            exp_text = "; ".join([str(exp) for exp in experience])
+        else:
+            exp_text = str(experience)
+        text_parts.append(f"Experience: {exp_text}")
+    
+    # Add total experience if available
+    if total_experience:
+        text_parts.append(f"TotalExperience: {total_experience}")
+    
+    return "\n".join(text_parts)
+
 @router.post("/generate-resume-embeddings")
 async def generate_resume_embeddings():
     """
@@ -2766,35 +3202,8 @@ async def generate_resume_embeddings():
         Dict: Status of embedding generation process
     """
     try:
-        # Get all resumes without embeddings
-        all_resumes = await database_service.get_all_resumes(limit=1000)
-        resumes_without_embeddings = []
-        
-        for resume in all_resumes:
-            # Check if resume already has embedding in separate column
-            has_embedding = False
-            
-            # Check separate embedding column first
-            if resume.get('embedding'):
-                has_embedding = True
-            
-            # Fallback: check parsed_data for backward compatibility
-            if not has_embedding:
-                parsed_data = resume.get('parsed_data', {})
-                
-                # Handle parsed_data that might be a JSON string
-                if isinstance(parsed_data, str):
-                    try:
-                        parsed_data = json.loads(parsed_data)
-                    except (json.JSONDecodeError, TypeError):
-                        continue
-                
-                if parsed_data and isinstance(parsed_data, dict):
-                    if 'embedding' in parsed_data and parsed_data['embedding']:
-                        has_embedding = True
-            
-            if not has_embedding:
-                resumes_without_embeddings.append(resume)
+        # Get resumes without embeddings (filtered in SQL)
+        resumes_without_embeddings = await database_service.get_resumes_missing_embedding(limit=1000)
         
         if not resumes_without_embeddings:
             return {
@@ -2805,80 +3214,76 @@ async def generate_resume_embeddings():
                 "failed_resumes": []
             }
         
-        # Process resumes in batches
-        batch_size = 5  # Process 5 resumes at a time to avoid rate limits
+        # Build the embedding text for every resume up front (cheap, CPU only)
+        work = []
+        for resume in resumes_without_embeddings:
+            parsed_data = resume.get('parsed_data', {})
+            if isinstance(parsed_data, str):
+                try:
+                    parsed_data = orjson.loads(parsed_data)
+                except (json.JSONDecodeError, TypeError):
+                    continue
+            
+            if not isinstance(parsed_data, dict):
+                continue
+            
+            combined_text = _resume_embedding_text(parsed_data)
+            if not combined_text.strip():
+                logger.warning(f"Resume {resume['id']}: No meaningful text content found")
+                continue
+            work.append((resume, combined_text, hashlib.sha256(combined_text.encode()).hexdigest()))
+        
+        # Identical texts are embedded once, and texts embedded by an earlier run reuse the stored vector
+        groups: Dict[str, List[Dict[str, Any]]] = {}
+        texts: Dict[str, str] = {}
+        for resume, combined_text, text_hash in work:
+            groups.setdefault(text_hash, []).append(resume)
+            texts[text_hash] = combined_text
+        reusable = await database_service.get_embeddings_by_text_hash(list(groups))
+        
         total_processed = 0
         embeddings_generated = 0
         failed_resumes = []
+        semaphore = asyncio.Semaphore(max(1, settings.MAX_CONCURRENT_API_CALLS))
         
-        for i in range(0, len(resumes_without_embeddings), batch_size):
-            batch = resumes_without_embeddings[i:i + batch_size]
+        async def _save_embeddings(embedded: List[tuple]) -> None:
+            nonlocal embeddings_generated
+            # Write all (resume, embedding, text_hash) rows with one UPDATE ... FROM (VALUES ...)
+            try:
+                updated_ids = set(await database_service.update_resume_embeddings_bulk([
+                    (resume['id'], embedding, text_hash) for resume, embedding, text_hash in embedded
+                ]))
+                update_error = "Failed to update database"
+            except Exception as e:
+                logger.error(f"Error saving embeddings for {len(embedded)} resumes: {str(e)}")
+                updated_ids = set()
+                update_error = str(e)
             
-            for resume in batch:
-                try:
-                    # Generate semantic text representation
-                    parsed_data = resume.get('parsed_data', {})
-                    if isinstance(parsed_data, str):
-                        try:
-                            parsed_data = json.loads(parsed_data)
-                        except:
-                            continue
-                    
-                    if not isinstance(parsed_data, dict):
-                        continue
-                    
-                    # Create structured text for embedding - ONLY SKILLS AND EXPERIENCE
-                    skills = parsed_data.get('Skills', [])
-                    experience = parsed_data.get('Experience', [])
-                    total_experience = parsed_data.get('TotalExperience', '')
-                    
-                    # Build text representation with ONLY skills and experience
-                    text_parts = []
-                    
-                    # Add skills with normalization
-                    if skills:
-                        skills_text = ", ".join(skills) if isinstance(skills, list) else str(skills)
-                        # Normalize common skill variations for better matching
-                        skills_text = _normalize_skills(skills_text)
-                        text_parts.append(f"Skills: {skills_text}")
-                    
-                    # Add experience with normalization
-                    if experience:
-                        if isinstance(experience, list):
-                            exp_text = "; ".join([str(exp) for exp in experience])
-                        else:
-                            exp_text = str(experience)
-                        text_parts.append(f"Experience: {exp_text}")
-                    
-                    # Add total experience if available
-                    if total_experience:
-                        text_parts.append(f"TotalExperience: {total_experience}")
-                    
-                    # Combine all text
-                    combined_text = "\n".join(text_parts)
-                    
-                    if not combined_text.strip():
-                        logger.warning(f"Resume {resume['id']}: No meaningful text content found")
-                        continue
-                    
-                    # Generate embedding
-                    embedding = await openai_service.generate_embedding(combined_text)
-                    
+            for resume, _, _ in embedded:
+                if resume['id'] in updated_ids:
+                    embeddings_generated += 1
+                else:
+                    failed_resumes.append({
+                        "resume_id": resume['id'],
+                        "filename": resume.get('filename', 'Unknown'),
+                        "error": update_error
+                    })
+                    logger.error(f"Failed to update database for resume {resume['id']}")
+            logger.info(f"Saved embeddings for {len(updated_ids)}/{len(embedded)} resumes in batch")
+        
+        async def _embed_batch(text_hashes: List[str]) -> None:
+            nonlocal total_processed
+            async with semaphore:
+                # Small jitter so a full semaphore doesn't release requests in lockstep
+                await asyncio.sleep(random.uniform(0, 0.05))
+                embeddings = await openai_service.generate_embeddings_batch([texts[text_hash] for text_hash in text_hashes])
+            
+            embedded = []
+            for text_hash, embedding in zip(text_hashes, embeddings):
+                for resume in groups[text_hash]:
+                    total_processed += 1
                     if embedding:
-                        # Update resume with embedding in separate column
-                        update_success = await database_service.update_resume_embedding_column(resume['id'], embedding)
-                        
-                        if update_success:
-                            embeddings_generated += 1
-                            candidate_name = resume.get('candidate_name', 'Unknown')
-                            logger.info(f"Generated embedding for resume {resume['id']}: {candidate_name}")
-                        else:
-                            failed_resumes.append({
-                                "resume_id": resume['id'],
-                                "filename": resume.get('filename', 'Unknown'),
-                                "error": "Failed to update database"
-                            })
-                            logger.error(f"Failed to update database for resume {resume['id']}")
+                        embedded.append((resume, embedding, text_hash))
                     else:
                         failed_resumes.append({
                             "resume_id": resume['id'],
@@ -2886,30 +3291,33 @@ async def generate_resume_embeddings():
                             "error": "Failed to generate embedding"
                         })
                         logger.error(f"Failed to generate embedding for resume {resume['id']}")
-                    
-                    total_processed += 1
-                    
-                except Exception as e:
-                    logger.error(f"Error processing resume {resume['id']}: {str(e)}")
-                    failed_resumes.append({
-                        "resume_id": resume['id'],
-                        "filename": resume.get('filename', 'Unknown'),
-                        "error": str(e)
-                    })
-                    total_processed += 1
-                
-                # Small delay to avoid rate limits
-                import asyncio
-                await asyncio.sleep(0.1)
             
-            # Delay between batches
-            await asyncio.sleep(1)
+            if embedded:
+                await _save_embeddings(embedded)
+        
+        reused = [
+            (resume, reusable[text_hash], text_hash)
+            for text_hash, resumes in groups.items() if text_hash in reusable
+            for resume in resumes
+        ]
+        if reused:
+            total_processed += len(reused)
+            logger.info(f"Reusing stored embeddings for {len(reused)} resumes with unchanged text")
+            await _save_embeddings(reused)
+        
+        # Generate the remaining embeddings with multi-input requests, several batches at a time
+        to_embed = [text_hash for text_hash in groups if text_hash not in reusable]
+        await asyncio.gather(*(
+            _embed_batch(to_embed[start:start + EMBEDDING_BATCH_SIZE])
+            for start in range(0, len(to_embed), EMBEDDING_BATCH_SIZE)
+        ))
         
         return {
             "success": True,
             "message": f"Embedding generation completed! Processed {total_processed} resumes.",
             "total_processed": total_processed,
             "embeddings_generated": embeddings_generated,
+            "embeddings_reused": len(reused),
             "failed_resumes": failed_resumes,
             "success_rate": round((embeddings_generated / total_processed * 100) if total_processed > 0 else 0, 2)
         }
@@ -2922,10 +3330,9 @@ async def generate_resume_embeddings():
         )
 
 # Additional endpoints for resume management
-@router.get("/resumes")
+@router.get("/resumes", response_class=ORJSONResponse)
 async def get_all_resumes(
-    request: Request,
-    company_id: int = Query(None, description="Company ID for data isolation"),
+    company_id: Optional[int] = Depends(get_company_id),
     dedupe_by: str = Query("email", description="Deduplication strategy: email | id | none")
 ):
     """
@@ -2940,14 +3347,7 @@ async def get_all_resumes(
         Dict: List of unique resume records with embedding status
     """
     try:
-        # Derive company_id from auth middleware when not provided
-        if company_id is None:
-            try:
-                company_id = getattr(request.state, 'company_id', None)
-            except Exception:
-                company_id = None
-
-        # Validate company_id; if still missing, return empty set gracefully
+        # No usable company (query param or auth middleware): return empty set gracefully
         if company_id is None:
             logger.warning("get_all_resumes called without company_id context; returning empty list")
             return {
@@ -2956,80 +3356,24 @@ async def get_all_resumes(
                 "message": "No company context provided"
             }
 
-        # Ensure company_id is an int
-        try:
-            company_id = int(company_id)
-        except Exception:
-            logger.warning(f"Invalid company_id provided: {company_id}; returning empty list")
-            return {
-                "resumes": [],
-                "total_unique": 0,
-                "message": "Invalid company_id"
-            }
-
-        # Get all resumes first with company filtering
-        all_resumes = await database_service.get_all_resumes(limit=1000, offset=0, company_id=company_id)  # Get more to filter unique
-        
-        # Debug logging
-        logger.info(f"get_all_resumes returned {len(all_resumes)} resumes for company_id: {company_id}")
-        if all_resumes:
-            logger.info(f"Sample resume data: {all_resumes[0] if all_resumes else 'None'}")
-
         # Normalize dedupe_by parameter
         dedupe_by_normalized = (dedupe_by or "email").lower().strip()
         if dedupe_by_normalized not in ("email", "id", "none"):
             dedupe_by_normalized = "email"
 
-        # Build unique set according to strategy
-        unique_resumes: dict[str, dict] = {}
-        dropped_without_key = 0
-        for resume in all_resumes:
-            if dedupe_by_normalized == "none":
-                # Keep all
-                key = f"row_{resume.get('id', uuid.uuid4().hex)}"
-            elif dedupe_by_normalized == "id":
-                key = str(resume.get('id') or "")
-            else:
-                # email strategy (default)
-                key = (resume.get('candidate_email') or "").lower().strip()
-
-            if not key:
-                # Fallback to id if email missing
-                key = str(resume.get('id') or "")
-            if not key:
-                # Still no key – count and skip from deduped result
-                dropped_without_key += 1
-                logger.warning(f"Dropping resume without key: {resume}")
-                continue
-
-            if key not in unique_resumes:
-                unique_resumes[key] = resume
-
-        # Convert to list
-        unique_list = list(unique_resumes.values())
+        # Newest resumes with company filtering, already deduplicated by the database
+        listing = await database_service.get_resume_listing(company_id=company_id, limit=1000, dedupe_by=dedupe_by_normalized)
+        unique_list = listing["resumes"]
         
         # Debug logging
-        logger.info(f"After deduplication: {len(unique_list)} unique resumes, dropped: {dropped_without_key}")
+        logger.info(f"get_resume_listing returned {len(unique_list)} unique of {listing['total']} resumes for company_id: {company_id}")
         
         # Format response with embedding status only
         formatted_resumes = []
         for resume in unique_list:
-            # Check if embedding exists
-            embedding = resume.get('embedding')
-            has_embedding = False
-            embedding_status = "failed"
-            
-            if embedding:
-                if isinstance(embedding, str):
-                    try:
-                        import json
-                        embedding = json.loads(embedding)
-                    except json.JSONDecodeError:
-                        embedding = None
-                
-                if embedding and isinstance(embedding, list) and len(embedding) > 0:
-                    has_embedding = True
-                    embedding_status = "completed"
+            # Embedding presence is computed by the database; the vector itself is never fetched
+            has_embedding = bool(resume.get('has_embedding'))
+            embedding_status = "completed" if has_embedding else "failed"
             
             formatted_resumes.append({
                 "id": resume.get('id'),
@@ -3049,9 +3393,9 @@ async def get_all_resumes(
         
         return {
             "resumes": formatted_resumes,
-            "total": len(all_resumes),
+            "total": listing["total"],
             "total_unique": len(unique_list),
-            "dropped_without_key": dropped_without_key,
+            "dropped_without_key": 0,  # Every row has an id to fall back on
             "dedupe_by": dedupe_by_normalized,
             "message": "Retrieved resumes with embedding status"
         }
@@ -3166,9 +3510,13 @@ async def download_resume(resume_id: int):
                 detail="Resume not found"
             )
         
-        # Get file path
+        # Get file path; the stat doubles as the existence check and is handed to FileResponse
         file_path = resume.get('file_path')
-        if not file_path or not os.path.exists(file_path):
+        try:
+            stat_result = os.stat(file_path) if file_path else None
+        except FileNotFoundError:
+            stat_result = None
+        if stat_result is None:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Resume file not found on disk"
@@ -3177,12 +3525,12 @@ async def download_resume(resume_id: int):
         # Get filename for download
         filename = resume.get('filename', 'resume.pdf')
         
-        # Return file
-        from fastapi.responses import FileResponse
+        # Return file with its real content type
         return FileResponse(
             path=file_path,
             filename=filename,
-            media_type='application/octet-stream'
+            media_type=mimetypes.guess_type(filename)[0] or 'application/octet-stream',
+            stat_result=stat_result
         )
         
     except HTTPException:
@@ -3207,24 +3555,21 @@ async def cancel_job(job_id: str):
         Dict: Cancellation confirmation
     """
     try:
-        if job_id not in bulk_processing_jobs:
+        # Cancel the job wherever it is tracked (this worker and/or Redis)
+        previous_status = await _cancel_bulk_job(job_id)
+        
+        if previous_status is None:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Job not found"
             )
         
-        job = bulk_processing_jobs[job_id]
-        
-        if job.get("status") in ["completed", "failed", "cancelled"]:
+        if previous_status in _FINISHED_JOB_STATUSES:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Job is already completed, failed, or cancelled"
             )
         
-        # Cancel the job
-        job["status"] = "cancelled"
-        job["updated_at"] = time.time()
-        
         logger.info(f"Cancelled job {job_id}")
         
         return {
@@ -3299,13 +3644,27 @@ async def re_upload_failed_resumes(
             "results": []
         }
         
-        # Store job in memory (in production, use Redis or database)
+        # Track the job locally and write it to Redis before returning, so any worker can serve its status
+        from app.services.queue_service import queue_service
         bulk_processing_jobs[job_id] = job_data
+        await JobState(job_id, bulk_processing_jobs[job_id], queue_service.redis_client).close()
         
         logger.info(f"Created re-upload job {job_id} with {len(failed_resume_ids)} files")
         
-        # Process files in background
-        asyncio.create_task(process_reupload_files(job_id, failed_resume_ids, company_id))
+        # Hand the job to the re-upload workers; process it here when there is no queue or it can't be reached
+        queued = False
+        if queue_service.redis_client:
+            try:
+                await queue_service.add_reupload_job(job_id, failed_resume_ids, company_id)
+                queued = True
+            except Exception as e:
+                logger.warning("⚠️ Failed to queue re-upload job %s, processing it here: %s", job_id, e)
+        if queued:
+            # Whichever worker consumes the job owns it from here; its state lives in Redis, and a local
+            # copy would go stale (and, being "processing", never be evicted)
+            del bulk_processing_jobs[job_id]
+        else:
+            asyncio.create_task(process_reupload_files(job_id, failed_resume_ids, company_id))
         
         return {
             "message": "Re-upload job created successfully",
@@ -3327,14 +3686,23 @@ async def get_job_status(job_id: str):
     Get the status of a specific job (including re-upload jobs).
     """
     try:
-        if job_id not in bulk_processing_jobs:
+        # Prefer Redis: the job may be run (and updated) by any worker
+        job = None
+        from app.services.queue_service import queue_service
+        if queue_service.redis_client:
+            try:
+                job = await load_bulk_job(queue_service.redis_client, job_id)
+            except Exception as e:
+                logger.warning(f"⚠️ Failed to load job {job_id} from Redis: {str(e)}")
+        if job is None:
+            job = bulk_processing_jobs.get(job_id)
+        
+        if job is None:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Job not found"
             )
         
-        job = bulk_processing_jobs[job_id]
-        
         return {
             "job_id": job_id,
             "status": job.get("status", "unknown"),
@@ -3388,175 +3756,322 @@ async def process_reupload_files(job_id: str, failed_resume_ids: List[str], comp
     """
     Process re-uploaded files in the background.
     """
+    from app.services.queue_service import queue_service
+    
+    tracked = bulk_processing_jobs.get(job_id)
+    if tracked is None and queue_service.redis_client:
+        # Queued by another worker: adopt the job state it wrote to Redis
+        try:
+            stored = await load_bulk_job(queue_service.redis_client, job_id)
+        except Exception as e:
+            logger.error("Failed to load re-upload job %s from Redis: %s", job_id, e)
+            stored = None
+        if stored is not None:
+            bulk_processing_jobs[job_id] = stored
+            tracked = bulk_processing_jobs[job_id]
+    if tracked is None:
+        logger.error("Job %s not found in memory", job_id)
+        return
+    # Progress is applied locally and mirrored to Redis, so any worker can report it
+    job = JobState(job_id, tracked, queue_service.redis_client)
+    
     try:
-        logger.info(f"Starting re-upload processing for job {job_id}")
-        
-        job = bulk_processing_jobs.get(job_id)
-        if not job:
-            logger.error(f"Job {job_id} not found in memory")
-            return
+        logger.info("Starting re-upload processing for job %s", job_id)
         
         # Update job status
-        job["status"] = "processing"
-        job["updated_at"] = time.time()
+        await job.update({
+            "status": "processing",
+            "updated_at": time.time()
+        })
         
         successful_count = 0
         failed_count = 0
-        results = []
         
         # Filter out metadata files - only process actual resume files
         actual_resume_ids = [rid for rid in failed_resume_ids if not rid.endswith('.metadata')]
-        logger.info(f"Processing {len(actual_resume_ids)} actual resume files (filtered out {len(failed_resume_ids) - len(actual_resume_ids)} metadata files)")
+        logger.info("Processing %s actual resume files (filtered out %s metadata files)", len(actual_resume_ids), len(failed_resume_ids) - len(actual_resume_ids))
+        # One slot per file, filled by position so concurrent tasks keep the request order without list growth
+        results: List[Optional[Dict[str, Any]]] = [None] * len(actual_resume_ids)
+        
+        # Re-upload files concurrently, bounded by the shared file semaphore
+        semaphore = _get_file_semaphore()
+        processed_count = 0
+        # Successfully parsed resumes waiting to be saved with the rest of their chunk
+        pending_saves: List[Dict[str, Any]] = []
+        
+        last_published_at = 0.0
+        
+        async def _publish_progress(force: bool = False) -> None:
+            # Per-file progress is throttled; chunk boundaries always publish
+            nonlocal last_published_at
+            now = time.monotonic()
+            if not force and processed_count % _REUPLOAD_PROGRESS_EVERY and now - last_published_at < _REUPLOAD_PROGRESS_INTERVAL:
+                return
+            last_published_at = now
+            await job.update({
+                "processed_files": processed_count,
+                "successful_files": successful_count,
+                "failed_files": failed_count,
+                "progress_percentage": int((processed_count / len(actual_resume_ids)) * 100),
+                "updated_at": time.time()
+            })
         
-        for i, resume_id in enumerate(actual_resume_ids):
-            try:
-                logger.info(f"Processing re-upload file {i+1}/{len(actual_resume_ids)}: {resume_id}")
-                
-                # Try to find the failed resume in the database
-                failed_resume = await database_service.get_failed_resume_by_id(resume_id, company_id)
-                
-                if not failed_resume:
-                    logger.warning(f"Failed resume not found: {resume_id}")
-                    result = {
-                        "resume_id": resume_id,
-                        "status": "failed",
-                        "filename": f"resume_{resume_id}.pdf",
-                        "error": "Failed resume not found in database"
-                    }
-                    results.append(result)
-                    failed_count += 1
-                else:
-                    # Process the resume using enhanced processor
-                    start_time = time.time()
+        async def _reupload_one(index: int, resume_id: str, failed_resume: Optional[Dict[str, Any]]) -> None:
+            nonlocal successful_count, failed_count, processed_count
+            filename = (failed_resume or {}).get('filename') or f"resume_{resume_id}.pdf"
+            async with semaphore:
+                if await job.cancelled():
+                    return
+                try:
+                    logger.info("Processing re-upload file: %s", resume_id)
                     
-                    try:
-                        # Import the enhanced processor
-                        from app.services.enhanced_resume_processor import EnhancedResumeProcessor
-                        processor = EnhancedResumeProcessor()
-                        
-                        # Get file content from database or file system
-                        file_content = await database_service.get_failed_resume_file_content(resume_id, company_id)
+                    if not failed_resume:
+                        logger.warning("Failed resume not found: %s", resume_id)
+                        result = {
+                            "resume_id": resume_id,
+                            "status": "failed",
+                            "filename": filename,
+                            "error": "Failed resume not found in database"
+                        }
+                        failed_count += 1
+                    else:
+                        # Process the resume using enhanced processor
+                        start_time = time.perf_counter()
+                    
+                        try:
+                            # File content comes with the prefetched record; fall back to the file system
+                            file_content = failed_resume.get('file_content')
                         
-                        if not file_content:
-                            # Try to get file path as fallback
-                            file_path = failed_resume.get('file_path')
-                            if file_path and os.path.exists(file_path):
-                                with open(file_path, 'rb') as f:
-                                    file_content = f.read()
-                            else:
-                                raise Exception("Could not retrieve file content")
+                            if not file_content:
+                                # Try to get file path as fallback
+                                file_path = failed_resume.get('file_path')
+                                if file_path and os.path.exists(file_path):
+                                    async with aiofiles.open(file_path, 'rb') as f:
+                                        file_content = await f.read()
+                                else:
+                                    raise Exception("Could not retrieve file content")
                         
-                        # Process the resume with actual file content
-                        processing_result = await processor.process_resume(
-                            file_content=file_content,
-                            filename=failed_resume.get('filename', f"resume_{resume_id}.pdf"),
-                            company_id=company_id
-                        )
+                            # Process the resume with actual file content
+                            processing_result = await enhanced_resume_processor.process_resume(
+                                file_content=file_content,
+                                filename=filename,
+                                company_id=company_id
+                            )
                         
-                        processing_time = time.time() - start_time
+                            processing_time = time.perf_counter() - start_time
                         
-                        if processing_result.success and processing_result.parsed_data:
-                            # Save the processed resume to main database
-                            candidate_id = await database_service.save_processed_resume(
-                                parsed_data=processing_result.parsed_data,
-                                company_id=company_id,
-                                user_id=1,
-                                original_filename=failed_resume.get('filename', f"resume_{resume_id}.pdf")
-                            )
-                            
-                            if candidate_id:
-                                # Remove the failed resume record since it's now successfully processed
-                                cleanup_success = await database_service.remove_failed_resume(resume_id, company_id)
-                                
-                                result = {
+                            if processing_result.success and processing_result.parsed_data:
+                                # Saved to the main database (and its failed record removed) with the rest of the chunk
+                                pending_saves.append({
+                                    "index": index,
                                     "resume_id": resume_id,
-                                    "status": "success",
-                                    "filename": failed_resume.get('filename', f"resume_{resume_id}.pdf"),
+                                    "filename": filename,
                                     "processing_time": round(processing_time, 2),
-                                    "parsed_data": processing_result.parsed_data,
-                                    "candidate_id": candidate_id,
-                                    "database_record": "created",
-                                    "failed_record_cleaned": cleanup_success
-                                }
-                                successful_count += 1
-                                logger.info(f"Successfully processed and saved re-upload file {resume_id} as candidate {candidate_id}, cleanup: {cleanup_success}")
+                                    "parsed_data": processing_result.parsed_data
+                                })
+                                return
                             else:
+                                error_message = str(processing_result.error) if processing_result.error else 'Unknown processing error'
                                 result = {
                                     "resume_id": resume_id,
                                     "status": "failed",
-                                    "filename": failed_resume.get('filename', f"resume_{resume_id}.pdf"),
-                                    "error": "Failed to save processed resume to database",
+                                    "filename": filename,
+                                    "error": error_message,
                                     "processing_time": round(processing_time, 2)
                                 }
                                 failed_count += 1
-                                logger.error(f"Failed to save processed resume {resume_id} to database")
-                        else:
-                            error_message = str(processing_result.error) if processing_result.error else 'Unknown processing error'
+                                logger.error("Failed to process re-upload file %s: %s", resume_id, error_message)
+                        
+                        except Exception as processing_error:
+                            processing_time = time.perf_counter() - start_time
                             result = {
                                 "resume_id": resume_id,
                                 "status": "failed",
-                                "filename": failed_resume.get('filename', f"resume_{resume_id}.pdf"),
-                                "error": error_message,
+                                "filename": filename,
+                                "error": str(processing_error),
                                 "processing_time": round(processing_time, 2)
                             }
                             failed_count += 1
-                            logger.error(f"Failed to process re-upload file {resume_id}: {error_message}")
-                        
-                    except Exception as processing_error:
-                        processing_time = time.time() - start_time
-                        result = {
-                            "resume_id": resume_id,
-                            "status": "failed",
-                            "filename": failed_resume.get('filename', f"resume_{resume_id}.pdf"),
-                            "error": str(processing_error),
-                            "processing_time": round(processing_time, 2)
-                        }
-                        failed_count += 1
-                        logger.error(f"Error processing re-upload file {resume_id}: {str(processing_error)}")
-                
-                results.append(result)
-                
-                # Update job progress
-                job["processed_files"] = i + 1
-                job["successful_files"] = successful_count
-                job["failed_files"] = failed_count
-                job["progress_percentage"] = int(((i + 1) / len(actual_resume_ids)) * 100)
-                job["updated_at"] = time.time()
+                            logger.error("Error processing re-upload file %s: %s", resume_id, processing_error)
                 
-            except Exception as e:
-                logger.error(f"Error processing re-upload file {resume_id}: {str(e)}")
-                
-                result = {
-                    "resume_id": resume_id,
-                    "status": "failed",
-                    "filename": f"resume_{resume_id}.pdf",
-                    "error": str(e)
-                }
+                except Exception as e:
+                    logger.error("Error processing re-upload file %s: %s", resume_id, e)
+                    result = {
+                        "resume_id": resume_id,
+                        "status": "failed",
+                        "filename": filename,
+                        "error": str(e)
+                    }
+                    failed_count += 1
                 
-                results.append(result)
-                failed_count += 1
+                results[index] = result
+                processed_count += 1
                 
                 # Update job progress
-                job["processed_files"] = i + 1
-                job["failed_files"] = failed_count
-                job["progress_percentage"] = int(((i + 1) / len(actual_resume_ids)) * 100)
-                job["updated_at"] = time.time()
+                await _publish_progress()
         
-        # Update final job status
-        job["status"] = "completed" if failed_count == 0 else "completed_with_errors"
-        job["results"] = results
-        job["updated_at"] = time.time()
+        async def _flush_saves(pending: List[Dict[str, Any]]) -> None:
+            nonlocal successful_count, failed_count, processed_count
+            if not pending:
+                return
+            try:
+                saved = await database_service.save_processed_resumes_bulk(
+                    [(item["resume_id"], item["parsed_data"], item["filename"]) for item in pending],
+                    company_id=company_id,
+                    user_id=1
+                )
+            except Exception as e:
+                # One bad row rolls back the batch; save the chunk file by file instead
+                logger.error("Error saving %s re-uploaded resumes in one batch, saving individually: %s", len(pending), e)
+                saved = {}
+                for item in pending:
+                    candidate_id = await database_service.save_processed_resume(
+                        parsed_data=item["parsed_data"],
+                        company_id=company_id,
+                        user_id=1,
+                        original_filename=item["filename"]
+                    )
+                    if candidate_id:
+                        saved[item["resume_id"]] = (candidate_id, await database_service.remove_failed_resume(item["resume_id"], company_id))
+            
+            for item in pending:
+                resume_id = item["resume_id"]
+                if resume_id in saved:
+                    candidate_id, cleanup_success = saved[resume_id]
+                    results[item["index"]] = {
+                        "resume_id": resume_id,
+                        "status": "success",
+                        "filename": item["filename"],
+                        "processing_time": item["processing_time"],
+                        "parsed_data": item["parsed_data"],
+                        "candidate_id": candidate_id,
+                        "database_record": "created",
+                        "failed_record_cleaned": cleanup_success
+                    }
+                    successful_count += 1
+                    logger.info("Successfully processed and saved re-upload file %s as candidate %s, cleanup: %s", resume_id, candidate_id, cleanup_success)
+                else:
+                    results[item["index"]] = {
+                        "resume_id": resume_id,
+                        "status": "failed",
+                        "filename": item["filename"],
+                        "error": "Failed to save processed resume to database",
+                        "processing_time": item["processing_time"]
+                    }
+                    failed_count += 1
+                    logger.error("Failed to save processed resume %s to database", resume_id)
+            processed_count += len(pending)
         
-        logger.info(f"Completed re-upload processing for job {job_id}: {successful_count} successful, {failed_count} failed")
+        # Records and file content arrive with one query per chunk, which also bounds the bytes held at once
+        for start in range(0, len(actual_resume_ids), _REUPLOAD_PREFETCH_SIZE):
+            if await job.cancelled():
+                break
+            chunk_ids = actual_resume_ids[start:start + _REUPLOAD_PREFETCH_SIZE]
+            failed_resumes_by_id = await database_service.get_failed_resumes_by_ids(chunk_ids, company_id, include_content=True)
+            await asyncio.gather(*(
+                _reupload_one(start + offset, resume_id, failed_resumes_by_id.get(resume_id))
+                for offset, resume_id in enumerate(chunk_ids)
+            ))
+            await _flush_saves(pending_saves)
+            pending_saves.clear()
+            await _publish_progress(force=True)
+        if job.get("status") == "cancelled":
+            logger.info("Job %s was cancelled, stopped re-upload processing", job_id)
+        
+        # Update final job status (a cancelled job stays cancelled)
+        final_status = "cancelled" if job.get("status") == "cancelled" else ("completed" if failed_count == 0 else "completed_with_errors")
+        await job.update({
+            "status": final_status,
+            "results": [result for result in results if result is not None],  # files skipped by a cancel have no result
+            "updated_at": time.time()
+        })
+        
+        logger.info("Completed re-upload processing for job %s: %s successful, %s failed", job_id, successful_count, failed_count)
         
     except Exception as e:
-        logger.error(f"Error in re-upload processing for job {job_id}: {str(e)}")
+        logger.error("Error in re-upload processing for job %s: %s", job_id, e)
         
         # Update job status to failed
-        if job_id in bulk_processing_jobs:
-            bulk_processing_jobs[job_id]["status"] = "failed"
-            bulk_processing_jobs[job_id]["error"] = str(e)
-            bulk_processing_jobs[job_id]["updated_at"] = time.time()
+        await job.update({
+            "status": "failed",
+            "error": str(e),
+            "updated_at": time.time()
+        })
+    finally:
+        await job.close()
+
+async def _reupload_heartbeat() -> None:
+    """Keep this worker's re-upload heartbeat alive, so its claimed jobs are not requeued while it runs."""
+    from app.services.queue_service import queue_service, REUPLOAD_HEARTBEAT_TTL_SECONDS
+    
+    while True:
+        try:
+            await queue_service.heartbeat_reupload_worker()
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning("⚠️ Re-upload worker heartbeat failed: %s", e)
+        await asyncio.sleep(REUPLOAD_HEARTBEAT_TTL_SECONDS / 3)
+
+async def run_reupload_worker() -> None:
+    """
+    Consume queued re-upload jobs one at a time until cancelled (started at application startup).
+    
+    Every app worker runs one consumer, so re-upload jobs are spread over the
+    worker processes instead of all running on the loop that accepted them.
+    A job stays in this worker's processing list until it finishes, and jobs
+    left behind by a worker that died are requeued when a worker starts.
+    """
+    from app.services.queue_service import queue_service
+    
+    if not queue_service.redis_client:
+        logger.info("Re-upload worker not started: queue system not available")
+        return
+    
+    heartbeat = asyncio.create_task(_reupload_heartbeat())
+    try:
+        try:
+            await queue_service.heartbeat_reupload_worker()
+            await queue_service.requeue_orphaned_reupload_jobs()
+        except Exception as e:
+            logger.error("❌ Re-upload worker failed to requeue orphaned jobs: %s", e)
+        
+        logger.info("🚀 Re-upload worker started")
+        while True:
+            try:
+                claimed = await queue_service.pop_reupload_job()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error("❌ Re-upload worker failed to read the queue: %s", e)
+                await asyncio.sleep(5)
+                continue
+            
+            if claimed:
+                queued, raw = claimed
+                await process_reupload_files(queued["job_id"], queued["failed_resume_ids"], queued["company_id"])
+                try:
+                    await queue_service.ack_reupload_job(raw)
+                except Exception as e:
+                    logger.error("❌ Failed to acknowledge re-upload job %s: %s", queued["job_id"], e)
+    finally:
+        heartbeat.cancel()
+
+# Fields a usable resume must carry, and list sections whose absence is only a warning
+_ESSENTIAL_FIELDS = ("Name", "Email", "Phone")
+_SECTION_WARNINGS = (
+    ("Experience", "missing_experience"),
+    ("Skills", "missing_skills"),
+    ("Education", "missing_education"),
+)
+# Parsed resumes with fewer non-empty fields than this are classified as poor
+_MIN_FILLED_FIELDS = 5
+
+def _has_content(value: Any) -> bool:
+    """Return True for a truthy value that is not a blank string, without stringifying nested data."""
+    if isinstance(value, str):
+        return bool(value.strip())
+    return bool(value)
 
 def _validate_parsed_data(parsed_data: Dict[str, Any]) -> Dict[str, Any]:
     """
@@ -3579,28 +4094,16 @@ def _validate_parsed_data(parsed_data: Dict[str, Any]) -> Dict[str, Any]:
     validation_errors = []
     
     # Check for essential fields
-    essential_fields = ["Name", "Email", "Phone"]
-    missing_essential = []
-    
-    for field in essential_fields:
-        value = parsed_data.get(field, "")
-        if not value or not str(value).strip():
-            missing_essential.append(field.lower())
-    
-    # Check for work experience
-    experience = parsed_data.get("Experience", [])
-    if not experience or not isinstance(experience, list) or len(experience) == 0:
-        warnings.append("missing_experience")
-    
-    # Check for skills
-    skills = parsed_data.get("Skills", [])
-    if not skills or not isinstance(skills, list) or len(skills) == 0:
-        warnings.append("missing_skills")
+    missing_essential = [
+        field.lower() for field in _ESSENTIAL_FIELDS
+        if not _has_content(parsed_data.get(field))
+    ]
     
-    # Check for education
-    education = parsed_data.get("Education", [])
-    if not education or not isinstance(education, list) or len(education) == 0:
-        warnings.append("missing_education")
+    # Check for work experience, skills and education
+    for field, warning in _SECTION_WARNINGS:
+        section = parsed_data.get(field)
+        if not section or not isinstance(section, list):
+            warnings.append(warning)
     
     # Determine quality level
     if len(missing_essential) >= 2:
@@ -3612,9 +4115,9 @@ def _validate_parsed_data(parsed_data: Dict[str, Any]) -> Dict[str, Any]:
     else:
         quality = "good"
     
-    # Check for data completeness
-    total_fields = len([k for k, v in parsed_data.items() if v and str(v).strip()])
-    if total_fields < 5:
+    # Check for data completeness (the full count is reported as completeness_score)
+    total_fields = sum(1 for value in parsed_data.values() if _has_content(value))
+    if total_fields < _MIN_FILLED_FIELDS:
         quality = "poor"
         warnings.append("insufficient_data")
     
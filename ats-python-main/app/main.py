@@ -3,11 +3,13 @@ Main FastAPI application entry point.
 Simplified version with only essential endpoints.
 """
 
+import orjson
 import logging
 import asyncio
-from fastapi import FastAPI, Request
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, Query, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse, Response
 from slowapi import Limiter, _rate_limit_exceeded_handler
 from slowapi.util import get_remote_address
 from slowapi.errors import RateLimitExceeded
@@ -21,12 +23,14 @@ from app.controllers.job_post_embeddings_controller import router as job_post_em
 from app.controllers.candidates_matching_external_controller import router as candidates_matching_router
 from app.controllers.get_embedding_data_controller import router as embedding_data_router
 from app.middleware.auth_middleware import JWTAuthMiddleware
+from app.services.database_service import DatabaseService
+from app.services.openai_service import get_async_client, close_async_client
 
 
 
 # Configure logging
 logging.basicConfig(
-    level=logging.DEBUG,
+    level=logging.DEBUG if settings.DEBUG else logging.INFO,
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
 )
 logger = logging.getLogger(__name__)
@@ -34,11 +38,95 @@ logger = logging.getLogger(__name__)
 # Initialize rate limiter for 1000+ users
 limiter = Limiter(key_func=get_remote_address)
 
+def _log_basic_startup_banner():
+    """Log the basic startup banner used when the full status report is unavailable."""
+    logger.info("🚀 Starting Resume Parser Backend...")
+    logger.info("=" * 60)
+    logger.info(f"🎯 Starting {settings.APP_NAME} v{settings.APP_VERSION}")
+    logger.info(f"🌐 Server will be available at: http://localhost:{settings.PORT}")
+    logger.info(f"📚 API Documentation: http://localhost:{settings.PORT}/docs")
+    logger.info(f"📖 ReDoc Documentation: http://localhost:{settings.PORT}/redoc")
+    logger.info("=" * 60)
+    logger.info("ℹ️  For detailed system status, visit: /startup-status")
+
+async def _show_startup_status():
+    """
+    Display the comprehensive startup status report.
+    Runs in the background so a slow probe never delays readiness.
+    """
+    try:
+        from app.services.startup_status_service import startup_status_service
+        
+        # Display comprehensive startup status with timeout
+        await asyncio.wait_for(
+            startup_status_service.display_comprehensive_startup_status(),
+            timeout=30.0  # 30 second timeout
+        )
+    except asyncio.TimeoutError:
+        logger.warning("⚠️  Startup status check timed out - database may be slow to respond")
+        _log_basic_startup_banner()
+    except Exception as e:
+        logger.error(f"⚠️  Could not show comprehensive startup status: {str(e)}")
+        # Fallback to basic startup message
+        _log_basic_startup_banner()
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Application lifecycle: initialize shared resources on startup and release them on shutdown.
+    """
+    db = DatabaseService()
+    background_tasks = []
+    
+    try:
+        # Force initialize to bind to current loop
+        await db._get_pool()
+        logger.info("✅ DB pool initialized on startup")
+    except Exception as e:
+        logger.error(f"❌ Failed to initialize DB pool on startup: {str(e)}")
+    
+    try:
+        # Background re-upload consumer, one per app worker
+        from app.controllers.resume_controller import run_reupload_worker
+        background_tasks.append(asyncio.create_task(run_reupload_worker()))
+        background_tasks.append(asyncio.create_task(_show_startup_status()))
+    except Exception as e:
+        logger.error(f"❌ Startup failed: {str(e)}")
+        # Don't re-raise the exception to prevent startup failure
+    
+    yield
+    
+    logger.info(f"Shutting down {settings.APP_NAME}")
+    for task in background_tasks:
+        task.cancel()
+    # Let cancelled tasks unwind before the clients and pools they use are closed
+    await asyncio.gather(*background_tasks, return_exceptions=True)
+    try:
+        await close_async_client()
+    except Exception as e:
+        logger.warning(f"⚠️  Error closing OpenAI client on shutdown: {str(e)}")
+    try:
+        from app.services.file_processor import shutdown_process_pool
+        shutdown_process_pool()
+    except Exception as e:
+        logger.warning(f"⚠️  Error shutting down extraction process pool: {str(e)}")
+    try:
+        await db.close_pool()
+    except Exception as e:
+        logger.warning(f"⚠️  Error closing DB pool on shutdown: {str(e)}")
+    try:
+        from app.services.redis_pool import close_redis_pools
+        await close_redis_pools()
+    except Exception as e:
+        logger.warning(f"⚠️  Error closing Redis pools on shutdown: {str(e)}")
+
 # Create FastAPI application
 app = FastAPI(
     title=settings.APP_NAME,
     description=settings.APP_DESCRIPTION,
     version=settings.APP_VERSION,
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,  # orjson encoding for every route that returns plain data
     docs_url="/docs",
     redoc_url="/redoc",
     openapi_url="/openapi.json"
@@ -52,108 +140,44 @@ app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
 from fastapi.middleware.gzip import GZipMiddleware
 app.add_middleware(GZipMiddleware, minimum_size=1000)  # Compress responses > 1KB
 
-# Add CORS middleware - must be added before other middleware
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],  # Allow ALL origins for testing
-    allow_credentials=False,  # Must be False when using wildcard origins
-    allow_methods=["GET", "POST", "PUT", "DELETE", "OPTIONS", "HEAD"],  # Specific methods
-    allow_headers=["*"],  # Allow all headers including Authorization
-    expose_headers=["*"],  # Expose all headers
-    max_age=86400  # Cache preflight response for 24 hours
-)
-
-# Add preflight handler for CORS
-@app.options("/{full_path:path}")
-async def preflight_handler(full_path: str):
-    """
-    Handle preflight OPTIONS requests for CORS.
-    """
-    return JSONResponse(
-        content={"message": "Preflight request handled"},
-        headers={
-            "Access-Control-Allow-Origin": "*",
-            "Access-Control-Allow-Methods": "GET, POST, PUT, DELETE, OPTIONS, HEAD",
-            "Access-Control-Allow-Headers": "*",
-            "Access-Control-Max-Age": "86400"
-        }
-    )
-
-# Add CORS headers middleware
-@app.middleware("http")
-async def add_cors_headers(request: Request, call_next):
-    """
-    Add CORS headers to all responses.
-    """
-    response = await call_next(request)
-    
-    # Add CORS headers if not already present
-    if "Access-Control-Allow-Origin" not in response.headers:
-        response.headers["Access-Control-Allow-Origin"] = "*"
-    if "Access-Control-Allow-Methods" not in response.headers:
-        response.headers["Access-Control-Allow-Methods"] = "GET, POST, PUT, DELETE, OPTIONS, HEAD"
-    if "Access-Control-Allow-Headers" not in response.headers:
-        response.headers["Access-Control-Allow-Headers"] = "*"
-    
-    return response
-
-# Add request timing middleware
-@app.middleware("http")
-async def add_process_time_header(request: Request, call_next):
-    """
-    Add processing time header to all responses.
-    """
-    start_time = time.time()
-    response = await call_next(request)
-    process_time = time.time() - start_time
-    response.headers["X-Process-Time"] = str(process_time)
-    return response
-
 # Add JWT authentication middleware
 app.add_middleware(JWTAuthMiddleware)
 
-# Add request logging middleware
+# Fallback CORS headers for responses that bypass CORSMiddleware (e.g. auth rejections)
+_CORS_FALLBACK_HEADERS = (
+    ("Access-Control-Allow-Origin", "*"),
+    ("Access-Control-Allow-Methods", "GET, POST, PUT, DELETE, OPTIONS, HEAD"),
+    ("Access-Control-Allow-Headers", "*"),
+)
+
+# Add unified timing, CORS fallback and logging middleware (outermost, so it also sees auth responses)
 @app.middleware("http")
-async def log_requests(request: Request, call_next):
+async def unified_middleware(request: Request, call_next):
     """
-    Log all incoming requests and their processing time.
+    Time the request, fill in missing CORS headers and log the result in a single pass.
     """
-    start_time = time.time()
-    
-    # Log request
-    logger.info(f"Request: {request.method} {request.url}")
-    
-    # Process request
+    start_time = time.perf_counter()
     response = await call_next(request)
+    process_time = time.perf_counter() - start_time
     
-    # Calculate processing time
-    process_time = time.time() - start_time
-    
-    # Log response
-    logger.info(f"Response: {response.status_code} - {process_time:.3f}s")
+    headers = response.headers
+    headers["X-Process-Time"] = str(process_time)
+    for name, value in _CORS_FALLBACK_HEADERS:
+        headers.setdefault(name, value)
     
+    logger.info("%s %s -> %s - %.3fs", request.method, request.url.path, response.status_code, process_time)
     return response
 
-# Initialize and close DB pool with app lifecycle
-from app.services.database_service import DatabaseService
-
-@app.on_event("startup")
-async def init_db_pool():
-    try:
-        db = DatabaseService()
-        # Force initialize to bind to current loop
-        await db._get_pool()
-        logger.info("✅ DB pool initialized on startup")
-    except Exception as e:
-        logger.error(f"❌ Failed to initialize DB pool on startup: {str(e)}")
-
-@app.on_event("shutdown")
-async def close_db_pool():
-    try:
-        db = DatabaseService()
-        await db.close_pool()
-    except Exception as e:
-        logger.warning(f"⚠️  Error closing DB pool on shutdown: {str(e)}")
+# Add CORS middleware last so it is outermost and answers preflight OPTIONS before any other middleware runs
+app.add_middleware(
+    CORSMiddleware,
+    allow_origins=["*"],  # Allow ALL origins for testing
+    allow_credentials=False,  # Must be False when using wildcard origins
+    allow_methods=["GET", "POST", "PUT", "DELETE", "OPTIONS", "HEAD"],  # Specific methods
+    allow_headers=["*"],  # Allow all headers including Authorization
+    expose_headers=["*"],  # Expose all headers
+    max_age=86400  # Cache preflight response for 24 hours
+)
 
 # Test CORS endpoint
 @app.get("/test-cors")
@@ -161,8 +185,7 @@ async def test_cors():
     """
     Test endpoint to verify CORS is working.
     """
-    from fastapi.responses import JSONResponse
-    response = JSONResponse(
+    response = ORJSONResponse(
         content={
             "message": "CORS test successful", 
             "timestamp": time.time(),
@@ -183,9 +206,6 @@ async def test_openai_api():
     Test endpoint to verify OpenAI API key is working.
     """
     try:
-        from app.services.openai_service import OpenAIService
-        from app.config.settings import settings
-        
         # Check if API key is set
         if not settings.OPENAI_API_KEY:
             return {
@@ -195,11 +215,8 @@ async def test_openai_api():
                 "timestamp": time.time()
             }
         
-        # Test if API key is valid
-        openai_service = OpenAIService()
-        
-        # Try a simple API call
-        test_response = openai_service.client.chat.completions.create(
+        # Try a simple API call on the shared async client so the event loop is not blocked
+        test_response = await get_async_client().chat.completions.create(
             model=settings.OPENAI_MODEL,
             messages=[{"role": "user", "content": "Hello, this is a test message"}],
             max_tokens=10
@@ -274,6 +291,46 @@ app.include_router(embedding_data_router)
 
 
 
+# Root endpoint payload; it only depends on settings, so it is serialized once at import
+_ROOT_PAYLOAD = {
+    "message": "Resume Parser API",
+    "version": settings.APP_VERSION,
+    "description": settings.APP_DESCRIPTION,
+    "endpoints": {
+        "health": "/health",
+        "startup_status": "/startup-status",
+        "parse_resume": "/api/v1/parse-resume",
+        "resume_embeddings_status": "/api/v1/resume-embeddings-status",
+        "generate_resume_embeddings": "/api/v1/generate-resume-embeddings",
+        "generate_job_posting": "/api/v1/job-posting/generate",
+        "all_resumes": "/api/v1/resumes",
+        "download_unique_resumes": "/api/v1/download/resumes",
+        "download_unique_resumes_with_files": "/api/v1/download/resumes/with-files",
+        "download_all_resumes_admin": "/api/v1/download/resumes/all",
+        "download_resume_file": "/api/v1/download/resume/{resume_id}",
+
+        "job_post_embeddings": {
+            "start_embedding": "/job-post-embeddings/start-embedding",
+            "all_embeddings": "/job-post-embeddings/all-embeddings",
+            "summary": "/job-post-embeddings/summary",
+            "health": "/job-post-embeddings/health"
+        },
+        "candidates_matching": {
+            "fast_matching": "/api/v1/candidates-matching/job/{job_id}/candidates-fast",
+            "all_matches": "/api/v1/candidates-matching/all-matches",
+            "populate_locations": "/api/v1/candidates-matching/populate-job-locations",
+            "health": "/api/v1/candidates-matching/health"
+        },
+        "test_cors": "/test-cors",
+        "test_openai": "/test-openai",
+        "docs": "/docs",
+        "redoc": "/redoc"
+    },
+    "supported_formats": settings.ALLOWED_EXTENSIONS,
+    "max_file_size_mb": settings.MAX_FILE_SIZE / (1024 * 1024)
+}
+_ROOT_BODY = orjson.dumps(_ROOT_PAYLOAD)
+
 # Root endpoint
 @app.get("/")
 async def root():
@@ -281,45 +338,9 @@ async def root():
     Root endpoint with application information.
     
     Returns:
-        dict: Application information and available endpoints
+        Response: Pre-serialized application information and available endpoints
     """
-    return {
-        "message": "Resume Parser API",
-        "version": settings.APP_VERSION,
-        "description": settings.APP_DESCRIPTION,
-        "endpoints": {
-            "health": "/health",
-            "startup_status": "/startup-status",
-            "parse_resume": "/api/v1/parse-resume",
-            "resume_embeddings_status": "/api/v1/resume-embeddings-status",
-            "generate_resume_embeddings": "/api/v1/generate-resume-embeddings",
-            "generate_job_posting": "/api/v1/job-posting/generate",
-            "all_resumes": "/api/v1/resumes",
-            "download_unique_resumes": "/api/v1/download/resumes",
-            "download_unique_resumes_with_files": "/api/v1/download/resumes/with-files",
-            "download_all_resumes_admin": "/api/v1/download/resumes/all",
-            "download_resume_file": "/api/v1/download/resume/{resume_id}",
-
-            "job_post_embeddings": {
-                "start_embedding": "/job-post-embeddings/start-embedding",
-                "all_embeddings": "/job-post-embeddings/all-embeddings",
-                "summary": "/job-post-embeddings/summary",
-                "health": "/job-post-embeddings/health"
-            },
-            "candidates_matching": {
-                "fast_matching": "/api/v1/candidates-matching/job/{job_id}/candidates-fast",
-                "all_matches": "/api/v1/candidates-matching/all-matches",
-                "populate_locations": "/api/v1/candidates-matching/populate-job-locations",
-                "health": "/api/v1/candidates-matching/health"
-            },
-            "test_cors": "/test-cors",
-            "test_openai": "/test-openai",
-            "docs": "/docs",
-            "redoc": "/redoc"
-        },
-        "supported_formats": settings.ALLOWED_EXTENSIONS,
-        "max_file_size_mb": settings.MAX_FILE_SIZE / (1024 * 1024)
-    }
+    return Response(content=_ROOT_BODY, media_type="application/json")
 
 # Health check endpoint (root level)
 @app.get("/health")
@@ -336,18 +357,47 @@ async def health_check():
         "timestamp": time.time()
     }
 
+# Startup status report, reused for this many seconds unless a refresh is requested
+_STARTUP_STATUS_TTL_SECONDS = 30
+_startup_status_cache = None  # (computed_at, report)
+_startup_status_lock = asyncio.Lock()
+
 # Startup status endpoint
 @app.get("/startup-status")
-async def get_startup_status():
+async def get_startup_status(refresh: bool = Query(False, description="Re-run the status probe instead of using the cached report")):
     """
     Get comprehensive startup status information.
     
+    The probe is slow, so a successful report is cached for
+    _STARTUP_STATUS_TTL_SECONDS and concurrent misses share one probe.
+    
+    Args:
+        refresh: Re-run the probe even if a cached report is fresh
+    
     Returns:
         dict: Complete startup status report
     """
+    global _startup_status_cache
+    
+    def _fresh_report():
+        if refresh or _startup_status_cache is None:
+            return None
+        computed_at, report = _startup_status_cache
+        return report if time.monotonic() - computed_at < _STARTUP_STATUS_TTL_SECONDS else None
+    
+    report = _fresh_report()
+    if report is not None:
+        return report
+    
     try:
-        from app.services.startup_status_service import startup_status_service
-        return await startup_status_service.display_comprehensive_startup_status()
+        async with _startup_status_lock:
+            report = _fresh_report()
+            if report is not None:
+                return report
+            from app.services.startup_status_service import startup_status_service
+            report = await startup_status_service.display_comprehensive_startup_status()
+            _startup_status_cache = (time.monotonic(), report)
+            return report
     except Exception as e:
         return {
             "error": str(e),
@@ -366,11 +416,11 @@ async def global_exception_handler(request: Request, exc: Exception):
         exc (Exception): The unhandled exception
         
     Returns:
-        JSONResponse: Error response
+        ORJSONResponse: Error response
     """
     logger.error(f"Unhandled exception: {str(exc)}", exc_info=True)
     
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=500,
         content={
             "error": "Internal server error",
@@ -379,64 +429,19 @@ async def global_exception_handler(request: Request, exc: Exception):
         }
     )
 
-# Startup event
-@app.on_event("startup")
-async def startup_event():
-    """
-    Application startup event handler with comprehensive status display.
-    """
-    try:
-        # Show comprehensive startup status
-        from app.services.startup_status_service import startup_status_service
-        
-        # Display comprehensive startup status with timeout
-        try:
-            await asyncio.wait_for(
-                startup_status_service.display_comprehensive_startup_status(),
-                timeout=30.0  # 30 second timeout
-            )
-        except asyncio.TimeoutError:
-            logger.warning("⚠️  Startup status check timed out - database may be slow to respond")
-            logger.info("🚀 Starting Resume Parser Backend...")
-            logger.info("=" * 60)
-            logger.info(f"🎯 Starting {settings.APP_NAME} v{settings.APP_VERSION}")
-            logger.info(f"🌐 Server will be available at: http://localhost:{settings.PORT}")
-            logger.info(f"📚 API Documentation: http://localhost:{settings.PORT}/docs")
-            logger.info(f"📖 ReDoc Documentation: http://localhost:{settings.PORT}/redoc")
-            logger.info("=" * 60)
-            logger.info("ℹ️  For detailed system status, visit: /startup-status")
-        except Exception as e:
-            logger.error(f"⚠️  Could not show comprehensive startup status: {str(e)}")
-            # Fallback to basic startup message
-            logger.info("🚀 Starting Resume Parser Backend...")
-            logger.info("=" * 60)
-            logger.info(f"🎯 Starting {settings.APP_NAME} v{settings.APP_VERSION}")
-            logger.info(f"🌐 Server will be available at: http://localhost:{settings.PORT}")
-            logger.info(f"📚 API Documentation: http://localhost:{settings.PORT}/docs")
-            logger.info(f"📖 ReDoc Documentation: http://localhost:{settings.PORT}/redoc")
-            logger.info("=" * 60)
-            logger.info("ℹ️  For detailed system status, visit: /startup-status")
-        
-    except Exception as e:
-        logger.error(f"❌ Startup failed: {str(e)}")
-        # Don't re-raise the exception to prevent startup failure
-
-# Shutdown event
-@app.on_event("shutdown")
-async def shutdown_event():
-    """
-    Application shutdown event handler.
-    """
-    logger.info(f"Shutting down {settings.APP_NAME}")
-
 if __name__ == "__main__":
     import uvicorn
     
-    # Run the application
+    # Run the application on uvloop/httptools (both ship with uvicorn[standard]).
+    # Bulk job tracking, rate limits and caches fall back to per-process state when Redis is down,
+    # so extra worker processes are opt-in via WORKERS (reload needs a single one)
     uvicorn.run(
         "app.main:app",
         host="0.0.0.0",
         port=settings.PORT,
+        loop="uvloop",
+        http="httptools",
+        workers=1 if settings.DEBUG else settings.WORKERS,
         reload=settings.DEBUG,
         log_level="info"
     )
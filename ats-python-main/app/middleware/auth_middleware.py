@@ -3,18 +3,39 @@ JWT Authentication middleware for Python backend.
 Handles JWT token validation and company isolation.
 """
 
+import re
 import jwt
+import time
 import logging
+from collections import OrderedDict
 from typing import Optional, Dict, Any
 from fastapi import HTTPException, status, Request
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 
 from app.config.settings import settings
 
 logger = logging.getLogger(__name__)
 
+# Decoded tokens kept in memory so repeat requests skip HMAC verification
+_TOKEN_CACHE_MAX_SIZE = 10000
+# Cache lifetime for tokens that carry no exp claim
+_TOKEN_CACHE_DEFAULT_TTL = 300
+
+# Bulk endpoints that skip auth entirely when DEBUG is on
+_DEBUG_BYPASS_ROUTES = (
+    "/api/v1/bulk-parse-resumes",
+    "/api/v1/failed-resumes",
+    "/api/v1/bulk-processing-status",
+    "/job-post-embeddings",
+)
+
+
+def _compile_prefix_pattern(prefixes) -> "re.Pattern[str]":
+    """Compile route prefixes into one regex so a path is checked with a single re.match."""
+    return re.compile("|".join(re.escape(prefix) for prefix in prefixes))
+
 class JWTAuthMiddleware(BaseHTTPMiddleware):
     """JWT Authentication middleware for company isolation."""
     
@@ -36,21 +57,50 @@ class JWTAuthMiddleware(BaseHTTPMiddleware):
             "/api/v1/failed-resumes",  # Allow UI to fetch failed list during debugging
             "/api/v1/bulk-parse-resumes"  # Allow bulk uploads during local testing
         ]
+        # Prefix matching compiled once; exact matches are covered by the prefix match
+        self._public_route_re = _compile_prefix_pattern(self.public_routes)
+        self._debug_bypass_re = _compile_prefix_pattern(_DEBUG_BYPASS_ROUTES)
+        # token -> (expires_at, decoded payload), oldest first
+        self._token_cache: "OrderedDict[str, tuple[float, Dict[str, Any]]]" = OrderedDict()
+    
+    def _decode_token(self, token: str) -> Dict[str, Any]:
+        """
+        Decode and verify a JWT, reusing the cached payload until the token expires.
+        
+        Args:
+            token: Raw bearer token
+            
+        Returns:
+            Dict: Decoded token payload
+        """
+        now = time.time()
+        cached = self._token_cache.get(token)
+        if cached is not None:
+            if cached[0] > now:
+                self._token_cache.move_to_end(token)
+                return cached[1]
+            del self._token_cache[token]
+        
+        decoded = jwt.decode(token, self.secret_key, algorithms=["HS256"])
+        
+        exp = decoded.get("exp")
+        expires_at = float(exp) if isinstance(exp, (int, float)) else now + _TOKEN_CACHE_DEFAULT_TTL
+        self._token_cache[token] = (expires_at, decoded)
+        if len(self._token_cache) > _TOKEN_CACHE_MAX_SIZE:
+            self._token_cache.popitem(last=False)
+        return decoded
     
     async def dispatch(self, request: Request, call_next):
         """Process request and validate JWT token."""
         
+        path = request.url.path
+        
         # Unconditional dev bypass for key bulk endpoints to avoid 401s during local testing
-        if settings.DEBUG and (
-            request.url.path.startswith("/api/v1/bulk-parse-resumes") or
-            request.url.path.startswith("/api/v1/failed-resumes") or
-            request.url.path.startswith("/api/v1/bulk-processing-status") or
-            request.url.path.startswith("/job-post-embeddings")
-        ):
+        if settings.DEBUG and self._debug_bypass_re.match(path):
             return await call_next(request)
 
         # Skip authentication for public routes (prefix match)
-        if request.url.path in self.public_routes or any(request.url.path.startswith(route) for route in self.public_routes):
+        if self._public_route_re.match(path):
             return await call_next(request)
         
         # Skip authentication for OPTIONS requests (CORS preflight)
@@ -59,13 +109,14 @@ class JWTAuthMiddleware(BaseHTTPMiddleware):
         
         # Get authorization header
         auth_header = request.headers.get("authorization")
-        logger.info(f"🔍 Auth Debug - Request: {request.method} {request.url.path}")
-        logger.info(f"🔍 Auth Debug - Headers: {dict(request.headers)}")
-        logger.info(f"🔍 Auth Debug - Authorization: {auth_header}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("🔍 Auth Debug - Request: %s %s", request.method, path)
+            logger.debug("🔍 Auth Debug - Headers: %s", dict(request.headers))
+            logger.debug("🔍 Auth Debug - Authorization: %s", auth_header)
         
         if not auth_header or not auth_header.startswith("Bearer "):
             logger.warning("❌ No valid authorization header found")
-            return JSONResponse(
+            return ORJSONResponse(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 content={"error": "Access denied. No token provided."}
             )
@@ -74,8 +125,8 @@ class JWTAuthMiddleware(BaseHTTPMiddleware):
             # Extract token
             token = auth_header.split(" ")[1]
             
-            # Verify JWT token
-            decoded = jwt.decode(token, self.secret_key, algorithms=["HS256"])
+            # Verify JWT token (cached per token until it expires)
+            decoded = self._decode_token(token)
             
             # Extract user info from token
             user_id = decoded.get("userId")
@@ -83,7 +134,7 @@ class JWTAuthMiddleware(BaseHTTPMiddleware):
             email = decoded.get("email")
             
             if not user_id or not company_id:
-                return JSONResponse(
+                return ORJSONResponse(
                     status_code=status.HTTP_401_UNAUTHORIZED,
                     content={"error": "Invalid token. Missing user or company information."}
                 )
@@ -93,25 +144,25 @@ class JWTAuthMiddleware(BaseHTTPMiddleware):
             request.state.company_id = company_id
             request.state.user_email = email
             
-            logger.info(f"Authenticated user {user_id} from company {company_id}")
+            logger.info("Authenticated user %s from company %s", user_id, company_id)
             
             # Process request
             response = await call_next(request)
             return response
             
         except jwt.ExpiredSignatureError:
-            return JSONResponse(
+            return ORJSONResponse(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 content={"error": "Token has expired. Please login again."}
             )
         except jwt.InvalidTokenError:
-            return JSONResponse(
+            return ORJSONResponse(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 content={"error": "Invalid token."}
             )
         except Exception as e:
-            logger.error(f"Authentication error: {str(e)}")
-            return JSONResponse(
+            logger.error("Authentication error: %s", e)
+            return ORJSONResponse(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 content={"error": "Authentication failed."}
             )
@@ -5,34 +5,62 @@ Limits requests per user/IP to prevent abuse.
 
 import time
 import logging
-from typing import Dict, Any
+from typing import Dict, Any, Tuple
 from fastapi import Request, HTTPException, status
 from fastapi.responses import JSONResponse
 import redis
+from app.services.redis_pool import RATE_LIMIT_DB, get_redis_pool
 
 logger = logging.getLogger(__name__)
 
+# Sliding-window approximation over two fixed-window counters: the previous window's count is weighted
+# by how much of it still overlaps the sliding window. One integer per key and window, O(1) per request.
+# KEYS = current window counter, previous window counter; ARGV = limit, previous-window weight, counter TTL.
+# Returns {allowed, remaining}.
+_SLIDING_WINDOW_LUA = """
+local limit = tonumber(ARGV[1])
+local previous = tonumber(redis.call('GET', KEYS[2]) or '0') * tonumber(ARGV[2])
+local current = tonumber(redis.call('GET', KEYS[1]) or '0')
+if previous + current >= limit then
+    return {0, 0}
+end
+current = redis.call('INCR', KEYS[1])
+if current == 1 then
+    redis.call('EXPIRE', KEYS[1], ARGV[3])
+end
+return {1, math.max(0, math.floor(limit - previous - current))}
+"""
+
+def _window_counters(key: str, window: int) -> Tuple[str, str, float]:
+    """
+    Name the current and previous fixed-window counters for a key.
+    
+    Returns:
+        Tuple[str, str, float]: Current counter key, previous counter key, and the
+        fraction of the previous window still inside the sliding window
+    """
+    now = time.time()
+    bucket = int(now // window)
+    previous_weight = 1.0 - (now - bucket * window) / window
+    return f"rate_limit:{key}:{bucket}", f"rate_limit:{key}:{bucket - 1}", previous_weight
+
 class RateLimiter:
     """Rate limiter using Redis for distributed limiting."""
     
     def __init__(self):
         """Initialize rate limiter with Redis."""
         try:
-            self.redis_client = redis.Redis(
-                host='147.93.155.233',
-                port=6379,
-                db=1,  # Use different DB for rate limiting
-                decode_responses=True
-            )
+            self.redis_client = redis.Redis(connection_pool=get_redis_pool(RATE_LIMIT_DB))
             self.redis_client.ping()
+            self._sliding_window = self.redis_client.register_script(_SLIDING_WINDOW_LUA)
             logger.info("✅ Rate limiter Redis connection established")
         except Exception as e:
             logger.error(f"❌ Rate limiter Redis connection failed: {str(e)}")
             self.redis_client = None
     
-    def is_allowed(self, key: str, limit: int, window: int) -> bool:
+    def check(self, key: str, limit: int, window: int) -> Tuple[bool, int]:
         """
-        Check if request is allowed based on rate limit.
+        Record a request and check it against the rate limit in one atomic Redis call.
         
         Args:
             key: Unique identifier (IP, user_id, etc.)
@@ -40,38 +68,38 @@ class RateLimiter:
             window: Time window in seconds
             
         Returns:
-            bool: True if allowed, False if rate limited
+            Tuple[bool, int]: Whether the request is allowed, and the requests left in the window
         """
         if not self.redis_client:
-            return True  # Allow if Redis is down
+            return True, limit  # Allow if Redis is down
         
         try:
-            current_time = int(time.time())
-            window_start = current_time - window
-            
-            # Use sliding window counter
-            pipe = self.redis_client.pipeline()
-            
-            # Remove old entries
-            pipe.zremrangebyscore(f"rate_limit:{key}", 0, window_start)
-            
-            # Count current requests
-            pipe.zcard(f"rate_limit:{key}")
-            
-            # Add current request
-            pipe.zadd(f"rate_limit:{key}", {str(current_time): current_time})
-            
-            # Set expiration
-            pipe.expire(f"rate_limit:{key}", window)
-            
-            results = pipe.execute()
-            current_count = results[1]
-            
-            return current_count < limit
+            current_key, previous_key, previous_weight = _window_counters(key, window)
+            # Weighted count and conditional increment in a single script (EVALSHA, reloaded on NOSCRIPT);
+            # a counter lives for two windows so it can still serve as the previous one
+            allowed, remaining = self._sliding_window(
+                keys=[current_key, previous_key],
+                args=[limit, previous_weight, window * 2]
+            )
+            return bool(allowed), int(remaining)
             
         except Exception as e:
             logger.error(f"❌ Rate limiter error: {str(e)}")
-            return True  # Allow if error
+            return True, limit  # Allow if error
+    
+    def is_allowed(self, key: str, limit: int, window: int) -> bool:
+        """
+        Check if request is allowed based on rate limit.
+        
+        Args:
+            key: Unique identifier (IP, user_id, etc.)
+            limit: Maximum requests allowed
+            window: Time window in seconds
+            
+        Returns:
+            bool: True if allowed, False if rate limited
+        """
+        return self.check(key, limit, window)[0]
     
     def get_remaining_requests(self, key: str, limit: int, window: int) -> int:
         """Get remaining requests for a key."""
@@ -79,16 +107,10 @@ class RateLimiter:
             return limit
         
         try:
-            current_time = int(time.time())
-            window_start = current_time - window
-            
-            # Remove old entries
-            self.redis_client.zremrangebyscore(f"rate_limit:{key}", 0, window_start)
-            
-            # Count current requests
-            current_count = self.redis_client.zcard(f"rate_limit:{key}")
-            
-            return max(0, limit - current_count)
+            current_key, previous_key, previous_weight = _window_counters(key, window)
+            current, previous = self.redis_client.mget(current_key, previous_key)
+            used = int(current or 0) + int(previous or 0) * previous_weight
+            return max(0, int(limit - used))
             
         except Exception as e:
             logger.error(f"❌ Rate limiter count error: {str(e)}")
@@ -112,8 +134,8 @@ def rate_limit(limit: int = 10, window: int = 60):
             client_ip = request.client.host
             
             # Check rate limit
-            if not rate_limiter.is_allowed(client_ip, limit, window):
-                remaining = rate_limiter.get_remaining_requests(client_ip, limit, window)
+            allowed, remaining = rate_limiter.check(client_ip, limit, window)
+            if not allowed:
                 raise HTTPException(
                     status_code=status.HTTP_429_TOO_MANY_REQUESTS,
                     detail={
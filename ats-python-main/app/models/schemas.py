@@ -4,7 +4,19 @@ Simplified version with only essential models.
 """
 
 from typing import Dict, Any, Optional, List
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+
+class ResumeResult(BaseModel):
+    """Per-file result in a batch parse response; endpoint-specific keys (job_id, record_id, ...) are kept as extras."""
+    
+    model_config = ConfigDict(extra="allow")
+    
+    filename: Optional[str] = Field(None, description="Name of the processed file")
+    status: str = Field(description="Processing status (success, failed, queued, duplicate)")
+    parsed_data: Optional[Dict[str, Any]] = Field(None, description="Parsed resume data")
+    file_type: Optional[str] = Field(None, description="File type (extension without dot)")
+    processing_time: Optional[float] = Field(None, description="Time taken to process the file")
+    error: Optional[str] = Field(None, description="Error message if processing failed")
 
 class BatchResumeParseResponse(BaseModel):
     """Response model for resume parsing endpoint (supports both single and multiple files)."""
@@ -13,47 +25,45 @@ class BatchResumeParseResponse(BaseModel):
     successful_files: int = Field(description="Number of files successfully processed")
     failed_files: int = Field(description="Number of files that failed to process")
     total_processing_time: float = Field(description="Total time taken to process all files")
-    results: List[Dict[str, Any]] = Field(description="Results for each processed file")
+    results: List[ResumeResult] = Field(description="Results for each processed file")
     
-    class Config:
-        """Pydantic configuration."""
-        schema_extra = {
-            "example": {
-                "total_files": 3,
-                "successful_files": 2,
-                "failed_files": 1,
-                "total_processing_time": 5.2,
-                "results": [
-                    {
-                        "filename": "resume1.pdf",
-                        "status": "success",
-                        "parsed_data": {
-                            "Name": "John Doe",
-                            "Email": "john.doe@email.com"
-                        },
-                        "file_type": "pdf",
-                        "processing_time": 2.1
+    model_config = ConfigDict(json_schema_extra={
+        "example": {
+            "total_files": 3,
+            "successful_files": 2,
+            "failed_files": 1,
+            "total_processing_time": 5.2,
+            "results": [
+                {
+                    "filename": "resume1.pdf",
+                    "status": "success",
+                    "parsed_data": {
+                        "Name": "John Doe",
+                        "Email": "john.doe@email.com"
                     },
-                    {
-                        "filename": "resume2.png",
-                        "status": "success",
-                        "parsed_data": {
-                            "Name": "Jane Smith",
-                            "Email": "jane.smith@email.com"
-                        },
-                        "file_type": "png",
-                        "processing_time": 1.8
+                    "file_type": "pdf",
+                    "processing_time": 2.1
+                },
+                {
+                    "filename": "resume2.png",
+                    "status": "success",
+                    "parsed_data": {
+                        "Name": "Jane Smith",
+                        "Email": "jane.smith@email.com"
                     },
-                    {
-                        "filename": "invalid.txt",
-                        "status": "failed",
-                        "error": "No text could be extracted from the file",
-                        "file_type": "txt",
-                        "processing_time": 0.1
-                    }
-                ]
-            }
+                    "file_type": "png",
+                    "processing_time": 1.8
+                },
+                {
+                    "filename": "invalid.txt",
+                    "status": "failed",
+                    "error": "No text could be extracted from the file",
+                    "file_type": "txt",
+                    "processing_time": 0.1
+                }
+            ]
         }
+    })
 
 class ErrorResponse(BaseModel):
     """Error response model."""
@@ -62,15 +72,13 @@ class ErrorResponse(BaseModel):
     detail: Optional[str] = Field(None, description="Detailed error information")
     error_code: Optional[str] = Field(None, description="Error code for client handling")
     
-    class Config:
-        """Pydantic configuration."""
-        schema_extra = {
-            "example": {
-                "error": "Invalid file format",
-                "detail": "Only PDF, DOCX, DOC, TXT, RTF, PNG, JPG, JPEG, WEBP files are supported",
-                "error_code": "INVALID_FILE_FORMAT"
-            }
+    model_config = ConfigDict(json_schema_extra={
+        "example": {
+            "error": "Invalid file format",
+            "detail": "Only PDF, DOCX, DOC, TXT, RTF, PNG, JPG, JPEG, WEBP files are supported",
+            "error_code": "INVALID_FILE_FORMAT"
         }
+    })
 
 class HealthResponse(BaseModel):
     """Health check response model."""
@@ -79,12 +87,10 @@ class HealthResponse(BaseModel):
     version: str = Field(description="Application version")
     timestamp: str = Field(description="Current timestamp")
     
-    class Config:
-        """Pydantic configuration."""
-        schema_extra = {
-            "example": {
-                "status": "healthy",
-                "version": "1.0.0",
-                "timestamp": "2024-01-01T12:00:00Z"
-            }
+    model_config = ConfigDict(json_schema_extra={
+        "example": {
+            "status": "healthy",
+            "version": "1.0.0",
+            "timestamp": "2024-01-01T12:00:00Z"
         }
+    })
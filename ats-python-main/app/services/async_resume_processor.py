@@ -6,7 +6,8 @@ Processes resumes from Redis queue in background.
 import json
 import logging
 import asyncio
-from typing import Dict, Any
+from typing import Dict, Any, Optional, Set
+from app.config.settings import settings
 from app.services.queue_service import queue_service
 from app.services.file_processor import FileProcessor
 from app.services.openai_service import OpenAIService
@@ -14,6 +15,11 @@ from app.services.database_service import DatabaseService
 
 logger = logging.getLogger(__name__)
 
+# Queue the processor consumes (producers LPUSH, so popping from the right keeps FIFO order)
+_QUEUE_KEY = "resume_processing_queue"
+# Seconds BRPOP waits for work; kept below the Redis client's 5s socket timeout
+_QUEUE_BLOCK_SECONDS = 2
+
 class AsyncResumeProcessor:
     """Background processor for resume queue."""
     
@@ -23,6 +29,8 @@ class AsyncResumeProcessor:
         self.openai_service = OpenAIService()
         self.database_service = DatabaseService()
         self.is_processing = False
+        # Bounds how many jobs are taken off the queue and parsing at once
+        self._job_semaphore = asyncio.Semaphore(max(1, settings.MAX_CONCURRENT_FILES))
     
     async def start_processing(self):
         """Start processing resumes from queue."""
@@ -33,13 +41,24 @@ class AsyncResumeProcessor:
         self.is_processing = True
         logger.info("🚀 Starting async resume processor...")
         
+        running: Set[asyncio.Task] = set()
         try:
             while self.is_processing:
-                await self._process_next_job()
-                await asyncio.sleep(1)  # Check queue every second
+                # Take a job only once a slot is free, so nothing popped sits waiting in memory
+                await self._job_semaphore.acquire()
+                job_data = await self._pop_job()
+                if job_data is None:
+                    self._job_semaphore.release()
+                    continue
+                task = asyncio.create_task(self._run_job(job_data))
+                running.add(task)
+                task.add_done_callback(running.discard)
         except Exception as e:
             logger.error(f"❌ Processor error: {str(e)}")
         finally:
+            # Jobs already taken off the queue are finished rather than dropped
+            if running:
+                await asyncio.gather(*running, return_exceptions=True)
             self.is_processing = False
             logger.info("🛑 Async resume processor stopped")
     
@@ -48,48 +67,58 @@ class AsyncResumeProcessor:
         self.is_processing = False
         logger.info("🛑 Stopping async resume processor...")
     
-    async def _process_next_job(self):
-        """Process next job from queue."""
+    async def _pop_job(self) -> Optional[Dict[str, Any]]:
+        """
+        Block briefly for the next queued job.
+        
+        Returns:
+            Optional[Dict]: Decoded job payload, or None if the queue stayed empty or could not be read
+        """
+        try:
+            item = await queue_service.redis_client.brpop(_QUEUE_KEY, timeout=_QUEUE_BLOCK_SECONDS)
+        except Exception as e:
+            logger.error(f"❌ Error reading job queue: {str(e)}")
+            await asyncio.sleep(1)  # Back off instead of spinning while Redis is unreachable
+            return None
+        return json.loads(item[1]) if item else None
+    
+    async def _run_job(self, job_data: Dict[str, Any]):
+        """Process one queued resume job, then free its slot."""
+        try:
+            await self._process_job(job_data)
+        finally:
+            self._job_semaphore.release()
+    
+    async def _process_job(self, job_data: Dict[str, Any]):
+        """Parse and save one queued resume, recording its status transitions."""
         try:
-            # Get job from queue (blocking with timeout)
-            job_data_str = queue_service.redis_client.brpop(
-                "resume_processing_queue", 
-                timeout=1
-            )
-            
-            if not job_data_str:
-                return
-            
-            job_data = json.loads(job_data_str[1])
             job_id = job_data["job_id"]
             filename = job_data["filename"]
             company_id = job_data.get("company_id")
             
             logger.info(f"🔄 Processing job {job_id}: {filename}")
             
-            # Check if job was cancelled before processing
-            job_status = await queue_service.get_job_status(job_id)
-            if job_status.get("status") == "cancelled":
+            # Check if job was cancelled before processing (only the status field is needed)
+            if await queue_service.redis_client.hget(f"job_status:{job_id}", "status") == "cancelled":
                 logger.info(f"⏭️ Skipping cancelled job {job_id}: {filename}")
-                continue
+                return
             
-            # Update status to processing
+            # Update status to processing; the next write is the terminal one
             await queue_service.update_job_status(job_id, "processing", "10")
             
             try:
-                # Convert hex string back to bytes
-                file_data = bytes.fromhex(job_data["file_data"])
+                # File bytes are stored under their own key, next to the small queue entry
+                file_data = await queue_service.get_job_file(job_data)
+                if file_data is None:
+                    raise Exception("Queued file content not found (expired or never stored)")
                 
                 # Process file
-                await queue_service.update_job_status(job_id, "processing", "30")
                 text_content = await self.file_processor.process_file(file_data, filename)
                 
                 # Parse with OpenAI
-                await queue_service.update_job_status(job_id, "processing", "60")
                 parsed_data = await self.openai_service.parse_resume_text(text_content)
                 
                 # Save to database
-                await queue_service.update_job_status(job_id, "processing", "80")
                 record_id = await self.database_service.save_resume_data(
                     filename=filename,
                     file_path=f"uploads/{filename}",
@@ -115,6 +144,8 @@ class AsyncResumeProcessor:
                     result=result
                 )
                 
+                await queue_service.delete_job_file(job_id)
+                
                 logger.info(f"✅ Job {job_id} completed successfully")
                 
             except Exception as e:
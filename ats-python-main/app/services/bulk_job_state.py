@@ -0,0 +1,481 @@
+"""
+Bulk job state service for tracking bulk resume processing jobs.
+Keeps the in-process job dict current and mirrors it to Redis with coalesced writes,
+and indexes the in-process jobs so status endpoints don't rescan them.
+"""
+
+import asyncio
+import logging
+import time
+import orjson
+from collections import Counter, defaultdict
+from collections.abc import MutableMapping
+from typing import Dict, Any, List, Optional, Set
+from cachetools import TTLCache
+
+logger = logging.getLogger(__name__)
+
+# Bulk job state expires with the same 24 hour window as queued job status
+BULK_JOB_TTL_SECONDS = 86400
+# Per-file results kept in a job's results stream (approximate, trimmed by XADD)
+BULK_JOB_MAX_STREAMED_RESULTS = 100000
+
+
+def bulk_job_key(job_id: str) -> str:
+    """Redis hash holding the scalar fields of a bulk job."""
+    return f"bulk_job:{job_id}"
+
+
+def bulk_job_results_key(job_id: str) -> str:
+    """Redis stream holding one JSON-encoded entry per processed file of a bulk job."""
+    return f"bulk_job:{job_id}:result_stream"
+
+
+def bulk_job_status_key(status: Any) -> str:
+    """Redis sorted set of bulk job IDs currently in a status, scored by their last write time."""
+    return f"bulk_jobs:status:{status}"
+
+
+# Sets bulk job hash fields and moves the job between the per-status sorted sets in one atomic step,
+# leaving the job untouched if its current status is protected (e.g. cancelled by another worker).
+# KEYS = job hash; ARGV = job id, status set key prefix, now, TTL seconds, initial status (JSON, written
+# only if the job has none yet, or ''), '1' to leave a missing job alone, number of protected statuses N,
+# N protected (JSON) statuses, then field/value pairs. Returns {previous status or nil, 1 if written}.
+_SET_JOB_FIELDS_LUA = """
+local previous = redis.call('HGET', KEYS[1], 'status')
+if not previous and ARGV[6] == '1' then
+    return {false, 0}
+end
+local first_field = 8 + tonumber(ARGV[7])
+for i = 8, first_field - 1 do
+    if previous == ARGV[i] then
+        return {previous, 0}
+    end
+end
+local status = previous
+if not previous and ARGV[5] ~= '' then
+    status = ARGV[5]
+    redis.call('HSET', KEYS[1], 'status', status)
+end
+for i = first_field, #ARGV, 2 do
+    redis.call('HSET', KEYS[1], ARGV[i], ARGV[i + 1])
+    if ARGV[i] == 'status' then
+        status = ARGV[i + 1]
+    end
+end
+redis.call('EXPIRE', KEYS[1], ARGV[4])
+if status then
+    local now = tonumber(ARGV[3])
+    local status_key = ARGV[2] .. tostring(cjson.decode(status))
+    if previous and previous ~= status then
+        redis.call('ZREM', ARGV[2] .. tostring(cjson.decode(previous)), ARGV[1])
+    end
+    redis.call('ZADD', status_key, now, ARGV[1])
+    redis.call('ZREMRANGEBYSCORE', status_key, 0, now - tonumber(ARGV[4]))
+    redis.call('EXPIRE', status_key, ARGV[4])
+end
+return {previous, 1}
+"""
+
+
+def _set_job_fields(client, job_id: str, mapping: Dict[str, bytes], protected_statuses: tuple = (),
+                    require_existing: bool = False, initial_status: Any = None):
+    """
+    Queue or run the guarded bulk job write (see _SET_JOB_FIELDS_LUA) on a client or pipeline.
+
+    Args:
+        client: Async Redis client or pipeline
+        job_id: Bulk job identifier
+        mapping: JSON-encoded job fields to set
+        protected_statuses: Statuses in which the job is left untouched
+        require_existing: Leave the job alone if it is not in Redis
+        initial_status: Status to write only if the job has none yet
+
+    Returns:
+        The client's eval result (an awaitable, or the pipeline when queued)
+    """
+    args = [
+        job_id,
+        bulk_job_status_key(""),
+        time.time(),
+        BULK_JOB_TTL_SECONDS,
+        orjson.dumps(initial_status) if initial_status is not None else "",
+        "1" if require_existing else "0",
+        len(protected_statuses),
+        *(orjson.dumps(status) for status in protected_statuses),
+    ]
+    for field, value in mapping.items():
+        args.extend((field, value))
+    return client.eval(_SET_JOB_FIELDS_LUA, 1, bulk_job_key(job_id), *args)
+
+
+class JobState:
+    """
+    Write-coalescing view of a single bulk job.
+
+    Every update is applied to the in-process job dict immediately, so local
+    readers (cancellation checks, the in-memory status fallback) stay exact.
+    When Redis is available the changed fields are buffered and written at most
+    once per flush interval, so other workers can serve the job's status
+    without a Redis round trip per processed file. Per-file results are
+    append-only while the job runs: each flush XADDs only the results added
+    since the last one instead of re-encoding the whole list, and close()
+    rewrites the stream once so in-place updates to earlier results land too.
+    Each flush also moves the job between the per-status sorted sets, so
+    cross-worker status counts are a ZCOUNT per status instead of a scan over
+    every job, and cancellation made by another worker (see update_bulk_job)
+    is picked up by cancelled().
+    """
+
+    def __init__(self, job_id: str, job: Dict[str, Any], redis_client=None, flush_interval: float = 0.5):
+        self.job_id = job_id
+        self.job = job
+        self.redis_client = redis_client
+        self.flush_interval = flush_interval
+        self._pending: Dict[str, Any] = dict(job) if redis_client is not None else {}
+        # The starting status is only written if Redis has none yet, so it can't undo a cancellation
+        self._initial_status = self._pending.pop("status", None)
+        self._flush_task: Optional[asyncio.Task] = None
+        self._results_flushed = 0
+        self._cancel_checked_at = 0.0
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Read a field from the local job dict."""
+        return self.job.get(key, default)
+
+    async def cancelled(self) -> bool:
+        """
+        Whether the job has been cancelled, here or (via Redis) by another worker.
+
+        Redis is consulted at most once per flush interval, so this is cheap to
+        call for every processed file.
+
+        Returns:
+            bool: True if the job's status is cancelled
+        """
+        if self.job.get("status") == "cancelled":
+            return True
+        now = time.monotonic()
+        if self.redis_client is None or now - self._cancel_checked_at < self.flush_interval:
+            return False
+
+        self._cancel_checked_at = now
+        try:
+            status = await self.redis_client.hget(bulk_job_key(self.job_id), "status")
+        except Exception as e:
+            logger.warning(f"⚠️ Failed to check bulk job {self.job_id} for cancellation: {str(e)}")
+            return False
+        if status is None or orjson.loads(status) != "cancelled":
+            return False
+
+        # Adopt the cancellation locally; Redis already holds it, so nothing is re-flushed
+        self.job["status"] = "cancelled"
+        return True
+
+    async def update(self, fields: Dict[str, Any]) -> None:
+        """
+        Apply fields to the job and schedule a Redis flush.
+
+        Args:
+            fields: Job fields to set
+        """
+        self.job.update(fields)
+        if self.redis_client is None:
+            return
+
+        self._pending.update(fields)
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_loop())
+
+    async def close(self) -> None:
+        """
+        Wait for any scheduled flush and write whatever is still buffered.
+
+        The results stream is rewritten in full here, since results already
+        streamed may have been updated in place since (e.g. candidate creation
+        status), which the append-only incremental flushes never re-send.
+        """
+        if self._flush_task is not None:
+            await self._flush_task
+        await self._flush(rewrite_results=True)
+
+    async def _flush_loop(self) -> None:
+        await asyncio.sleep(self.flush_interval)
+        await self._flush()
+
+    async def _flush(self, rewrite_results: bool = False) -> None:
+        if self.redis_client is None or not (self._pending or rewrite_results or self._initial_status is not None):
+            return
+
+        pending, self._pending = self._pending, {}
+        pending.pop("results", None)
+        # Results are streamed from the job's (live) list; a shorter list means it was replaced
+        results = self.job.get("results")
+        results = results if isinstance(results, list) else []
+        reset = rewrite_results or len(results) < self._results_flushed
+        start = 0 if reset else self._results_flushed
+        # Serialize on the event loop so the job can keep mutating while the write is in flight
+        mapping = {key: orjson.dumps(value, default=str) for key, value in pending.items()}
+        new_results = [orjson.dumps(result, default=str) for result in results[start:]]
+
+        try:
+            previous, written = await self._write(mapping, new_results, reset)
+            self._initial_status = None
+            self._results_flushed = start + len(new_results)
+        except Exception as e:
+            logger.warning(f"⚠️ Failed to flush bulk job {self.job_id} state to Redis: {str(e)}")
+            return
+
+        if not written:
+            # Another worker cancelled the job; adopt it locally instead of overwriting it
+            self.job["status"] = orjson.loads(previous)
+
+    async def _write(self, mapping: Dict[str, bytes], new_results: List[bytes], reset: bool) -> tuple:
+        results_key = bulk_job_results_key(self.job_id)
+        # A stream rewrite runs as one transaction so readers never see it half-written
+        pipe = self.redis_client.pipeline(transaction=reset)
+        # Hash fields and the status index are written atomically, never replacing a cancellation
+        _set_job_fields(pipe, self.job_id, mapping, protected_statuses=("cancelled",), initial_status=self._initial_status)
+        if reset:
+            pipe.delete(results_key)
+        for result_json in new_results:
+            pipe.xadd(results_key, {"result": result_json}, maxlen=BULK_JOB_MAX_STREAMED_RESULTS, approximate=True)
+        if new_results:
+            pipe.expire(results_key, BULK_JOB_TTL_SECONDS)
+        replies = await pipe.execute()
+        return tuple(replies[0])
+
+
+async def load_bulk_job(redis_client, job_id: str) -> Optional[Dict[str, Any]]:
+    """
+    Load a bulk job written by JobState from Redis.
+
+    Args:
+        redis_client: Async Redis client (decode_responses=True)
+        job_id: Bulk job identifier
+
+    Returns:
+        Dict: Job fields including results, or None if the job is not in Redis
+    """
+    pipe = redis_client.pipeline(transaction=False)
+    pipe.hgetall(bulk_job_key(job_id))
+    pipe.xrange(bulk_job_results_key(job_id))
+    raw_fields, raw_results = await pipe.execute()
+    if not raw_fields:
+        return None
+
+    job = {key: orjson.loads(value) for key, value in raw_fields.items()}
+    job["results"] = [orjson.loads(entry["result"]) for _, entry in raw_results]
+    return job
+
+
+async def update_bulk_job(redis_client, job_id: str, fields: Dict[str, Any], unless_status: tuple = ()) -> Optional[Any]:
+    """
+    Set fields on a bulk job in Redis from any worker, keeping the status index current.
+
+    Args:
+        redis_client: Async Redis client (decode_responses=True)
+        job_id: Bulk job identifier
+        fields: Job fields to set
+        unless_status: Statuses in which the job is left untouched (e.g. already finished)
+
+    Returns:
+        Any: The job's status before the update, or None if the job is not in Redis
+    """
+    mapping = {field: orjson.dumps(value, default=str) for field, value in fields.items()}
+    raw_previous, _ = await _set_job_fields(redis_client, job_id, mapping, protected_statuses=tuple(unless_status), require_existing=True)
+    return orjson.loads(raw_previous) if raw_previous is not None else None
+
+
+async def count_bulk_jobs_by_status(redis_client) -> Dict[str, int]:
+    """
+    Count the bulk jobs written by JobState in each status, across all workers.
+
+    Args:
+        redis_client: Async Redis client (decode_responses=True)
+
+    Returns:
+        Dict: Status -> number of live bulk jobs in that status
+    """
+    prefix = bulk_job_status_key("")
+    status_keys = [key async for key in redis_client.scan_iter(match=f"{prefix}*")]
+    if not status_keys:
+        return {}
+
+    # Only count entries written within the hash TTL, i.e. jobs whose state still exists
+    since = time.time() - BULK_JOB_TTL_SECONDS
+    pipe = redis_client.pipeline(transaction=False)
+    for key in status_keys:
+        pipe.zcount(key, since, "+inf")
+    return {
+        key[len(prefix):]: count
+        for key, count in zip(status_keys, await pipe.execute())
+        if count
+    }
+
+
+# Job fields the in-memory store keeps aggregated, and the statuses that count as active
+_INDEXED_FIELDS = frozenset({"status", "user_id", "total_files", "successful_files", "failed_files", "duplicate_files"})
+_SUMMED_FIELDS = ("total_files", "successful_files", "failed_files", "duplicate_files")
+_ACTIVE_STATUSES = ("processing", "queued")
+
+
+class TrackedJob(dict):
+    """Job dict that keeps its BulkJobStore's indexes current when indexed fields change."""
+
+    __slots__ = ("_store", "_job_id")
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._store = None
+        self._job_id = None
+
+    def _tracked(self) -> bool:
+        return self._store is not None and self._store._indexed.get(self._job_id) is self
+
+    def __setitem__(self, key, value) -> None:
+        if key in _INDEXED_FIELDS and self._tracked():
+            self._store._unindex(self._job_id, self)
+            super().__setitem__(key, value)
+            self._store._index(self._job_id, self)
+        else:
+            super().__setitem__(key, value)
+
+    def update(self, *args, **kwargs) -> None:
+        fields = dict(*args, **kwargs)
+        if self._tracked() and not _INDEXED_FIELDS.isdisjoint(fields):
+            self._store._unindex(self._job_id, self)
+            super().update(fields)
+            self._store._index(self._job_id, self)
+        else:
+            super().update(fields)
+
+
+class BulkJobStore(MutableMapping):
+    """
+    Bounded in-memory bulk job tracking with a status index and running totals.
+
+    Queued and processing jobs are held unbounded; a job only becomes subject to
+    the size and TTL bounds once it leaves those statuses, so eviction can never
+    drop a job that is still running (and still polled or cancelled).
+    Job dicts are stored as TrackedJob instances, so writes made anywhere through
+    job["status"] = ... or job.update(...) keep counts, by_status, sums and the
+    user counters current. Status endpoints read those instead of scanning every job.
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        self._active: Dict[str, TrackedJob] = {}
+        self._finished: TTLCache = TTLCache(maxsize=maxsize, ttl=ttl)
+        self.counts: Counter = Counter()
+        self.by_status: Dict[Any, Set[str]] = defaultdict(set)
+        self.sums: Counter = Counter()
+        self.users: Counter = Counter()
+        self.active_users: Counter = Counter()
+        self._indexed: Dict[str, TrackedJob] = {}
+
+    def __getitem__(self, job_id: str) -> TrackedJob:
+        job = self._active.get(job_id)
+        if job is not None:
+            return job
+        return self._finished[job_id]
+
+    def __contains__(self, job_id: object) -> bool:
+        return job_id in self._active or job_id in self._finished
+
+    def __iter__(self):
+        # Finished jobs (oldest first) then running ones, so reversed() lists the newest first
+        return iter(list(self._finished) + list(self._active))
+
+    def __len__(self) -> int:
+        return len(self._active) + len(self._finished)
+
+    def __setitem__(self, job_id: str, job: Dict[str, Any]) -> None:
+        tracked = job if isinstance(job, TrackedJob) else TrackedJob(job)
+        previous = self._indexed.get(job_id)
+        if previous is not None:
+            self._unindex(job_id, previous)
+        tracked._store, tracked._job_id = self, job_id
+        self._index(job_id, tracked)
+
+    def __delitem__(self, job_id: str) -> None:
+        if self._active.pop(job_id, None) is None:
+            self._finished.pop(job_id, None)
+        previous = self._indexed.get(job_id)
+        if previous is not None:
+            self._unindex(job_id, previous)
+
+    def setdefault(self, job_id: str, default: Optional[Dict[str, Any]] = None) -> TrackedJob:
+        """Return the stored job, inserting default first if missing (always the tracked instance)."""
+        if job_id not in self:
+            self[job_id] = default if default is not None else {}
+        return self[job_id]
+
+    def _place(self, job_id: str, job: TrackedJob) -> None:
+        """Hold the job unbounded while active, and under the size/TTL bounds once it has finished."""
+        if job.get("status") in _ACTIVE_STATUSES:
+            self._finished.pop(job_id, None)
+            self._active[job_id] = job
+        else:
+            self._active.pop(job_id, None)
+            if self._finished.get(job_id) is not job:
+                self._finished[job_id] = job
+
+    def reconcile(self) -> None:
+        """Drop index entries for finished jobs the TTL/size bound has evicted since the last call."""
+        self._finished.expire()
+        if len(self._indexed) != len(self):
+            for job_id in [job_id for job_id in self._indexed if job_id not in self]:
+                self._unindex(job_id, self._indexed[job_id])
+
+    def aggregate(self) -> Dict[str, int]:
+        """
+        Job and file totals across every tracked job, read straight from the indexes.
+
+        Returns:
+            Dict: Job counts by status, distinct (active) users and summed file counters
+        """
+        self.reconcile()
+        aggregate = {
+            "total_jobs": len(self._indexed),
+            "active_jobs": sum(self.counts[status] for status in _ACTIVE_STATUSES),
+            "completed_jobs": self.counts["completed"],
+            "failed_jobs": self.counts["failed"],
+            "duplicate_jobs": self.counts["duplicate"],
+            "total_users": len(self.users),
+            "active_users": len(self.active_users),
+        }
+        for field in _SUMMED_FIELDS:
+            aggregate[field] = self.sums[field]
+        return aggregate
+
+    def _index(self, job_id: str, job: TrackedJob) -> None:
+        self._place(job_id, job)
+        self._indexed[job_id] = job
+        status = job.get("status")
+        user_id = job.get("user_id", "unknown")
+        self.counts[status] += 1
+        self.by_status[status].add(job_id)
+        for field in _SUMMED_FIELDS:
+            self.sums[field] += job.get(field) or 0
+        self.users[user_id] += 1
+        if status in _ACTIVE_STATUSES:
+            self.active_users[user_id] += 1
+
+    def _unindex(self, job_id: str, job: TrackedJob) -> None:
+        del self._indexed[job_id]
+        status = job.get("status")
+        user_id = job.get("user_id", "unknown")
+        self.counts[status] -= 1
+        self.by_status[status].discard(job_id)
+        for field in _SUMMED_FIELDS:
+            self.sums[field] -= job.get(field) or 0
+        _decrement(self.users, user_id)
+        if status in _ACTIVE_STATUSES:
+            _decrement(self.active_users, user_id)
+
+
+def _decrement(counter: Counter, key: Any) -> None:
+    """Decrement a counter entry, removing it at zero so len(counter) counts distinct keys."""
+    counter[key] -= 1
+    if counter[key] <= 0:
+        del counter[key]
@@ -8,6 +8,18 @@ import logging
 from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass
 
+# RE2 matches in linear time (no backtracking) on adversarial resume text; optional, falls back to re without it
+try:
+    import re2 as _scan_re
+except ImportError:
+    _scan_re = re
+
+# Aho-Corasick finds every contact keyword in one pass per line; fall back to one regex per category
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
 logger = logging.getLogger(__name__)
 
 @dataclass
@@ -17,46 +29,130 @@ class ContactInfo:
     confidence: float = 0.0
     source: str = "unknown"
 
+# Email patterns, in priority order
+_EMAIL_PATTERNS = (
+    # Standard email patterns
+    r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b',
+    # Email with spaces (common in resumes)
+    r'\b[A-Za-z0-9._%+-]+\s+at\s+[A-Za-z0-9.-]+\s+dot\s+[A-Z|a-z]{2,}\b',
+    # Email with @ symbol variations
+    r'\b[A-Za-z0-9._%+-]+\s*@\s*[A-Za-z0-9.-]+\s*\.\s*[A-Z|a-z]{2,}\b',
+    # Email in parentheses
+    r'\([A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\)',
+    # Email with brackets
+    r'\[[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\]',
+)
+
+# Phone patterns, in priority order
+_PHONE_PATTERNS = (
+    # US phone number patterns
+    r'\+?1?[-.\s]?\(?[0-9]{3}\)?[-.\s]?[0-9]{3}[-.\s]?[0-9]{4}',
+    r'\(?[0-9]{3}\)?[-.\s]?[0-9]{3}[-.\s]?[0-9]{4}',
+    r'[0-9]{3}[-.\s]?[0-9]{3}[-.\s]?[0-9]{4}',
+    # International patterns
+    r'\+[1-9]\d{1,14}',
+    # Phone with extensions
+    r'\(?[0-9]{3}\)?[-.\s]?[0-9]{3}[-.\s]?[0-9]{4}\s*(?:ext|ext\.|extension|x)\s*[0-9]+',
+    # Phone with country code
+    r'\+1[-.\s]?\(?[0-9]{3}\)?[-.\s]?[0-9]{3}[-.\s]?[0-9]{4}',
+)
+
+# Compiled once at import with the scanning engine; the fused alternations tell in one scan
+# whether any pattern matches at all (case-insensitivity is inline so both engines accept it)
+_EMAIL_RES = tuple(_scan_re.compile(f"(?i){p}") for p in _EMAIL_PATTERNS)
+_PHONE_RES = tuple(_scan_re.compile(p) for p in _PHONE_PATTERNS)
+_EMAIL_ANY_RE = _scan_re.compile("(?i)" + "|".join(f"(?:{p})" for p in _EMAIL_PATTERNS))
+_PHONE_ANY_RE = _scan_re.compile("|".join(f"(?:{p})" for p in _PHONE_PATTERNS))
+
+# Unicode whitespace (NBSP, thin and other PDF spaces) folded to a plain space before scanning: RE2's \s only
+# covers ASCII [\t\n\f\r ], while re's covers all of them, so both engines then see the same text
+_SCAN_WHITESPACE = {
+    code: ' ' for code in range(0x3001)
+    if chr(code).isspace() and chr(code) not in '\t\n\f\r '
+}
+
+# Normalization and validation patterns
+_AT_RE = re.compile(r'\s+at\s+')
+_DOT_RE = re.compile(r'\s+dot\s+')
+_WS_RE = re.compile(r'\s+')
+_BRACKET_RE = re.compile(r'[()\[\]]')
+_NON_PHONE_CHAR_RE = re.compile(r'[^\d+]')
+_NON_DIGIT_RE = re.compile(r'[^\d]')
+_EMAIL_VALIDATE_RE = re.compile(r'^[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}$')
+
+def _first_match(text: str, fused_re, pattern_res) -> Optional[str]:
+    """
+    Return the first match of the highest-priority pattern that matches the text.
+    
+    The fused alternation rejects texts with no match in a single scan; otherwise
+    patterns are searched in priority order, each stopping at its first hit.
+    """
+    if not fused_re.search(text):
+        return None
+    for pattern_re in pattern_res:
+        match = pattern_re.search(text)
+        if match:
+            return match.group(0)
+    return None
+
+def _build_keyword_matcher(keywords: Dict[str, Tuple[str, ...]]):
+    """
+    Build a matcher returning the keyword categories present in a lowercased line.
+    
+    Args:
+        keywords: Mapping of category name to its keywords
+        
+    Returns:
+        Callable taking a lowercased line and returning a set of category names
+    """
+    if ahocorasick is not None:
+        categories_by_word: Dict[str, set] = {}
+        for category, words in keywords.items():
+            for word in words:
+                categories_by_word.setdefault(word, set()).add(category)
+        
+        automaton = ahocorasick.Automaton()
+        for word, categories in categories_by_word.items():
+            automaton.add_word(word, tuple(categories))
+        automaton.make_automaton()
+        
+        def match(line_lower: str) -> set:
+            return {category for _, categories in automaton.iter(line_lower) for category in categories}
+        return match
+    
+    category_res = [
+        (category, re.compile('|'.join(re.escape(word) for word in words)))
+        for category, words in keywords.items()
+    ]
+    
+    def match(line_lower: str) -> set:
+        return {category for category, keyword_re in category_res if keyword_re.search(line_lower)}
+    return match
+
 class ContactExtractor:
     """Enhanced contact information extractor with multiple extraction methods."""
     
     def __init__(self):
         """Initialize the contact extractor with regex patterns."""
-        self.email_patterns = [
-            # Standard email patterns
-            r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b',
-            # Email with spaces (common in resumes)
-            r'\b[A-Za-z0-9._%+-]+\s+at\s+[A-Za-z0-9.-]+\s+dot\s+[A-Z|a-z]{2,}\b',
-            # Email with @ symbol variations
-            r'\b[A-Za-z0-9._%+-]+\s*@\s*[A-Za-z0-9.-]+\s*\.\s*[A-Z|a-z]{2,}\b',
-            # Email in parentheses
-            r'\([A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\)',
-            # Email with brackets
-            r'\[[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\]',
-        ]
-        
-        self.phone_patterns = [
-            # US phone number patterns
-            r'\+?1?[-.\s]?\(?[0-9]{3}\)?[-.\s]?[0-9]{3}[-.\s]?[0-9]{4}',
-            r'\(?[0-9]{3}\)?[-.\s]?[0-9]{3}[-.\s]?[0-9]{4}',
-            r'[0-9]{3}[-.\s]?[0-9]{3}[-.\s]?[0-9]{4}',
-            # International patterns
-            r'\+[1-9]\d{1,14}',
-            # Phone with extensions
-            r'\(?[0-9]{3}\)?[-.\s]?[0-9]{3}[-.\s]?[0-9]{4}\s*(?:ext|ext\.|extension|x)\s*[0-9]+',
-            # Phone with country code
-            r'\+1[-.\s]?\(?[0-9]{3}\)?[-.\s]?[0-9]{3}[-.\s]?[0-9]{4}',
-        ]
+        self.email_patterns = list(_EMAIL_PATTERNS)
+        self.phone_patterns = list(_PHONE_PATTERNS)
         
         # Context keywords for contact information
         self.contact_keywords = {
-            'email': ['email', 'e-mail', 'mail', 'contact', 'reach me at', 'reach me'],
-            'phone': ['phone', 'tel', 'telephone', 'mobile', 'cell', 'call me at', 'call me']
+            'email': ('email', 'e-mail', 'mail', 'contact', 'reach me at', 'reach me'),
+            'phone': ('phone', 'tel', 'telephone', 'mobile', 'cell', 'call me at', 'call me')
         }
+        self._match_keywords = _build_keyword_matcher(self.contact_keywords)
     
     def extract_contact_info(self, text: str) -> ContactInfo:
         """
-        Extract contact information using multiple methods.
+        Extract contact information from keyword context lines and the whole text.
+        
+        Lines carrying a contact keyword are walked once, stopping as soon as both
+        contacts have been found there; those context matches are preferred. The
+        regex result is the highest-priority pattern match over the whole text, so
+        a stray digit run on an early line never beats a real number further down
+        and matches spanning a line break are still found.
         
         Args:
             text: Resume text content
@@ -64,98 +160,48 @@ class ContactExtractor:
         Returns:
             ContactInfo object with extracted email and phone
         """
-        # Method 1: Regex extraction
-        regex_result = self._extract_with_regex(text)
-        
-        # Method 2: Context-based extraction
-        context_result = self._extract_with_context(text)
+        text = text.translate(_SCAN_WHITESPACE)
+        context_email = context_phone = None
         
-        # Method 3: Combine and validate results
-        final_result = self._combine_results(regex_result, context_result)
-        
-        return final_result
-    
-    def _extract_with_regex(self, text: str) -> ContactInfo:
-        """Extract contact info using regex patterns."""
-        email = None
-        phone = None
-        
-        # Extract email
-        for pattern in self.email_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            if matches:
-                email = self._normalize_email(matches[0])
+        for line in text.split('\n'):
+            if context_email and context_phone:
                 break
-        
-        # Extract phone
-        for pattern in self.phone_patterns:
-            matches = re.findall(pattern, text)
-            if matches:
-                phone = self._normalize_phone(matches[0])
-                break
-        
-        confidence = 0.8 if email and phone else 0.6 if email or phone else 0.0
-        
-        return ContactInfo(
-            email=email,
-            phone=phone,
-            confidence=confidence,
-            source="regex"
-        )
-    
-    def _extract_with_context(self, text: str) -> ContactInfo:
-        """Extract contact info using context analysis."""
-        email = None
-        phone = None
-        
-        # Split text into lines for context analysis
-        lines = text.split('\n')
-        
-        for line in lines:
-            line_lower = line.lower().strip()
+            categories = self._match_keywords(line.lower())
+            if not categories:
+                continue
             
-            # Check for email context
-            if any(keyword in line_lower for keyword in self.contact_keywords['email']):
-                for pattern in self.email_patterns:
-                    matches = re.findall(pattern, line, re.IGNORECASE)
-                    if matches:
-                        email = self._normalize_email(matches[0])
-                        break
+            if context_email is None and 'email' in categories:
+                match = _first_match(line, _EMAIL_ANY_RE, _EMAIL_RES)
+                if match:
+                    context_email = self._normalize_email(match)
             
-            # Check for phone context
-            if any(keyword in line_lower for keyword in self.contact_keywords['phone']):
-                for pattern in self.phone_patterns:
-                    matches = re.findall(pattern, line)
-                    if matches:
-                        phone = self._normalize_phone(matches[0])
-                        break
+            if context_phone is None and 'phone' in categories:
+                match = _first_match(line, _PHONE_ANY_RE, _PHONE_RES)
+                if match:
+                    context_phone = self._normalize_phone(match)
         
-        confidence = 0.9 if email and phone else 0.7 if email or phone else 0.0
+        # Whole-text pass in pattern priority order (also needed to score agreement with context matches)
+        match = _first_match(text, _EMAIL_ANY_RE, _EMAIL_RES)
+        regex_email = self._normalize_email(match) if match else None
+        match = _first_match(text, _PHONE_ANY_RE, _PHONE_RES)
+        regex_phone = self._normalize_phone(match) if match else None
         
-        return ContactInfo(
-            email=email,
-            phone=phone,
-            confidence=confidence,
-            source="context"
-        )
-    
-    def _combine_results(self, regex_result: ContactInfo, context_result: ContactInfo) -> ContactInfo:
-        """Combine results from different extraction methods."""
-        # Prefer context results as they're more reliable
-        email = context_result.email or regex_result.email
-        phone = context_result.phone or regex_result.phone
-        
-        # Calculate combined confidence
-        confidence = max(regex_result.confidence, context_result.confidence)
-        if context_result.email and regex_result.email and context_result.email == regex_result.email:
+        # Context matches are more reliable than bare regex hits
+        email = context_email or regex_email
+        phone = context_phone or regex_phone
+        
+        regex_confidence = 0.8 if regex_email and regex_phone else 0.6 if regex_email or regex_phone else 0.0
+        context_confidence = 0.9 if context_email and context_phone else 0.7 if context_email or context_phone else 0.0
+        confidence = max(regex_confidence, context_confidence)
+        if context_email and context_email == regex_email:
             confidence = min(confidence + 0.1, 1.0)
-        if context_result.phone and regex_result.phone and context_result.phone == regex_result.phone:
+        if context_phone and context_phone == regex_phone:
             confidence = min(confidence + 0.1, 1.0)
         
         source = "combined"
-        if context_result.email or context_result.phone:
+        if context_email or context_phone:
             source = "context"
-        elif regex_result.email or regex_result.phone:
+        elif regex_email or regex_phone:
             source = "regex"
         
         return ContactInfo(
@@ -171,19 +217,19 @@ class ContactExtractor:
         email = email.strip().lower()
         
         # Fix common OCR errors
-        email = re.sub(r'\s+at\s+', '@', email)
-        email = re.sub(r'\s+dot\s+', '.', email)
-        email = re.sub(r'\s+', '', email)
+        email = _AT_RE.sub('@', email)
+        email = _DOT_RE.sub('.', email)
+        email = _WS_RE.sub('', email)
         
         # Remove parentheses and brackets
-        email = re.sub(r'[()\[\]]', '', email)
+        email = _BRACKET_RE.sub('', email)
         
         return email
     
     def _normalize_phone(self, phone: str) -> str:
         """Normalize phone number."""
         # Remove all non-digit characters except +
-        phone = re.sub(r'[^\d+]', '', phone)
+        phone = _NON_PHONE_CHAR_RE.sub('', phone)
         
         # Handle US phone numbers
         if len(phone) == 10:
@@ -201,8 +247,7 @@ class ContactExtractor:
         
         # Validate email
         if email:
-            email_pattern = r'^[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}$'
-            if not re.match(email_pattern, email):
+            if not _EMAIL_VALIDATE_RE.match(email):
                 errors.append(f"Invalid email format: {email}")
         else:
             errors.append("Email is required")
@@ -210,7 +255,7 @@ class ContactExtractor:
         # Validate phone
         if phone:
             # Remove all non-digit characters for validation
-            phone_digits = re.sub(r'[^\d]', '', phone)
+            phone_digits = _NON_DIGIT_RE.sub('', phone)
             if len(phone_digits) < 10:
                 errors.append(f"Invalid phone format: {phone}")
         else:
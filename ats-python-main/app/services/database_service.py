@@ -7,6 +7,7 @@ import logging
 import json
 import os
 import asyncio
+import aiofiles
 from typing import Dict, Any, Optional, List
 from datetime import datetime
 import asyncpg
@@ -161,6 +162,7 @@ class DatabaseService:
                     processing_time FLOAT NOT NULL,
                     parsed_data JSONB NOT NULL,
                     embedding JSONB,
+                    embedding_text_hash CHAR(64),
                     candidate_name VARCHAR(255),
                     candidate_email VARCHAR(255),
                     candidate_phone VARCHAR(100),
@@ -186,6 +188,18 @@ class DatabaseService:
             await conn.execute('CREATE INDEX IF NOT EXISTS idx_resume_data_candidate_name ON resume_data(candidate_name)')
             await conn.execute('CREATE INDEX IF NOT EXISTS idx_resume_data_candidate_email ON resume_data(candidate_email)')
             await conn.execute('CREATE INDEX IF NOT EXISTS idx_resume_data_is_unique ON resume_data(is_unique)')
+            # Partial indexes for the embedding backfill, which reads rows without one newest first,
+            # across all companies or within one
+            await conn.execute('CREATE INDEX IF NOT EXISTS idx_resume_data_missing_embedding_created ON resume_data(created_at DESC) WHERE embedding IS NULL')
+            await conn.execute('CREATE INDEX IF NOT EXISTS idx_resume_data_missing_embedding_company ON resume_data(company_id, created_at DESC) WHERE embedding IS NULL')
+            # Lookup of an existing embedding for identical embedding text
+            await conn.execute('CREATE INDEX IF NOT EXISTS idx_resume_data_embedding_text_hash ON resume_data(embedding_text_hash) WHERE embedding_text_hash IS NOT NULL')
+            
+            # Company-scoped failed resume lookups (re-upload prefetch); the table is owned by the main backend
+            try:
+                await conn.execute('CREATE INDEX IF NOT EXISTS idx_failed_resumes_company_id_id ON failed_resumes(company_id, id)')
+            except Exception as e:
+                logger.warning(f"Could not create index on failed_resumes(company_id, id): {str(e)}")
             
 
             
@@ -254,6 +268,18 @@ class DatabaseService:
                 await conn.execute('ALTER TABLE resume_data ADD COLUMN embedding JSONB')
                 logger.info("Added missing embedding column")
             
+            # Check if embedding_text_hash column exists
+            columns = await conn.fetch('''
+                SELECT column_name 
+                FROM information_schema.columns 
+                WHERE table_name = 'resume_data' AND column_name = 'embedding_text_hash'
+            ''')
+            
+            if not columns:
+                # SHA-256 of the text an embedding was generated from, so identical text can reuse it
+                await conn.execute('ALTER TABLE resume_data ADD COLUMN embedding_text_hash CHAR(64)')
+                logger.info("Added missing embedding_text_hash column")
+            
             # Migration will be handled via API endpoint when needed
                 
         except Exception as e:
@@ -442,45 +468,34 @@ class DatabaseService:
         Args:
             resume_data_list (List[Dict[str, Any]]): List of resume data dictionaries
                 Each dict should contain: filename, file_path, file_type, file_size, processing_time, parsed_data
+                and may contain an embedding, which is stored in the same write
             company_id (int): Company ID for data isolation
         
         Returns:
             List[int]: List of IDs of the saved records
         """
         try:
-            print(f"🔍 Debug - save_batch_resume_data called with {len(resume_data_list)} items, company_id: {company_id}")
+            logger.debug(f"save_batch_resume_data called with {len(resume_data_list)} items, company_id: {company_id}")
             pool = await self._get_pool()
-            
+
             async with pool.acquire() as conn:
-                # Start transaction
+                # Large batches go through binary COPY instead of executemany
+                if len(resume_data_list) >= settings.DB_COPY_THRESHOLD:
+                    async with conn.transaction():
+                        record_ids = await self._copy_batch_resume_data(conn, resume_data_list, company_id)
+                    logger.info(f"Batch saved {len(record_ids)} resume records via COPY for company: {company_id}")
+                    return record_ids
+
+                # Reserve ids and write every row in one pipelined executemany instead of a round trip per resume
                 async with conn.transaction():
-                    record_ids = []
-                    
-                    for i, resume_data in enumerate(resume_data_list):
-                        print(f"🔍 Debug - Processing item {i+1}: {resume_data.get('filename', 'Unknown')}")
-                        print(f"🔍 Debug - Parsed data keys: {list(resume_data.get('parsed_data', {}).keys())}")
-                        # Extract key information from parsed data
-                        candidate_name = resume_data['parsed_data'].get("Name", "")
-                        candidate_email = resume_data['parsed_data'].get("Email", "")
-                        candidate_phone = resume_data['parsed_data'].get("Phone", "")
-                        total_experience = resume_data['parsed_data'].get("TotalExperience", "")
-                        
-                        # ALWAYS INSERT new resume data with company isolation
-                        print(f"🔍 Debug - About to insert record for {resume_data['filename']}")
-                        print(f"🔍 Debug - Values: filename={resume_data['filename']}, company_id={company_id}")
-                        record = await conn.fetchrow('''
-                            INSERT INTO resume_data 
-                            (filename, file_path, file_type, file_size, processing_time, parsed_data, 
-                             candidate_name, candidate_email, candidate_phone, total_experience, company_id, created_at, updated_at)
-                            VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, NOW(), NOW())
-                            RETURNING id
-                        ''', resume_data['filename'], resume_data['file_path'], 
-                             resume_data['file_type'], resume_data['file_size'], 
-                             resume_data['processing_time'], json.dumps(resume_data['parsed_data']), 
-                             candidate_name, candidate_email, candidate_phone, total_experience, company_id)
-                        
-                        print(f"🔍 Debug - Insert successful, got ID: {record['id']}")
-                        record_ids.append(record['id'])
+                    record_ids = await self._reserve_resume_ids(conn, len(resume_data_list))
+                    await conn.executemany('''
+                        INSERT INTO resume_data 
+                        (id, filename, file_path, file_type, file_size, processing_time, parsed_data, 
+                         candidate_name, candidate_email, candidate_phone, total_experience, company_id, embedding,
+                         created_at, updated_at)
+                        VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12, $13, NOW(), NOW())
+                    ''', self._resume_records(record_ids, resume_data_list, company_id))
                     
                     logger.info(f"Batch saved {len(record_ids)} resume records to database for company: {company_id}")
                     return record_ids
@@ -489,6 +504,63 @@ class DatabaseService:
             logger.error(f"Error saving batch resume data: {str(e)}")
             raise Exception(f"Failed to save batch resume data: {str(e)}")
 
+    async def _copy_batch_resume_data(self, conn, resume_data_list: List[Dict[str, Any]], company_id: int = None) -> List[int]:
+        """
+        Stream resume rows into resume_data with binary COPY.
+
+        Ids are reserved from the table sequence up front so the returned list
+        lines up with resume_data_list, matching the executemany path.
+        Must be called inside a transaction.
+        """
+        record_ids = await self._reserve_resume_ids(conn, len(resume_data_list))
+        records = self._resume_records(record_ids, resume_data_list, company_id)
+
+        await conn.copy_records_to_table(
+            'resume_data',
+            records=records,
+            columns=[
+                'id', 'filename', 'file_path', 'file_type', 'file_size', 'processing_time', 'parsed_data',
+                'candidate_name', 'candidate_email', 'candidate_phone', 'total_experience', 'company_id', 'embedding'
+            ]
+        )
+        return record_ids
+
+    async def _reserve_resume_ids(self, conn, count: int) -> List[int]:
+        """Reserve count ids from the resume_data sequence, in order."""
+        id_rows = await conn.fetch('''
+            SELECT nextval(pg_get_serial_sequence('resume_data', 'id')) AS id
+            FROM generate_series(1, $1)
+        ''', count)
+        return [row['id'] for row in id_rows]
+
+    def _resume_records(self, record_ids: List[int], resume_data_list: List[Dict[str, Any]], company_id: int = None) -> List[tuple]:
+        """
+        Build resume_data rows (with pre-reserved ids) for the batch save paths.
+
+        The embedding is written with the row when present, so callers don't
+        need a follow-up UPDATE once the batch is saved.
+        """
+        records = []
+        for record_id, resume_data in zip(record_ids, resume_data_list):
+            parsed_data = resume_data['parsed_data']
+            embedding = resume_data.get('embedding')
+            records.append((
+                record_id,
+                resume_data['filename'],
+                resume_data['file_path'],
+                resume_data['file_type'],
+                resume_data['file_size'],
+                resume_data['processing_time'],
+                json.dumps(parsed_data),
+                parsed_data.get("Name", ""),
+                parsed_data.get("Email", ""),
+                parsed_data.get("Phone", ""),
+                parsed_data.get("TotalExperience", ""),
+                company_id,
+                json.dumps(embedding) if embedding else None
+            ))
+        return records
+
     async def save_batch_resume_data_ultra_fast(self, batch_data: List[Dict], company_id: int) -> List[int]:
         """Ultra-fast batch insert with optimized performance."""
         if not batch_data:
@@ -746,6 +818,137 @@ class DatabaseService:
             logger.error(f"Full error details: {e.__class__.__name__}: {str(e)}")
             raise Exception(f"Failed to get resume data: {str(e)}")
 
+    async def get_resume_listing(self, company_id: int, limit: int = 1000, dedupe_by: str = "email") -> Dict[str, Any]:
+        """
+        Get a company's newest resumes for the resume list, deduplicated in SQL.
+        
+        The newest `limit` rows are taken first and then, for the "email"
+        strategy, collapsed with DISTINCT ON to the newest row per normalized
+        email (rows without an email are kept, keyed by id), so duplicates
+        never leave the database. Only whether a resume has a (non-empty)
+        embedding is returned, never the vector itself.
+        
+        Args:
+            company_id (int): Company ID for data isolation
+            limit (int): Number of newest resumes to consider
+            dedupe_by (str): "email" to keep one resume per email; "id" or "none" keep every row
+            
+        Returns:
+            Dict[str, Any]: "resumes" (newest first) and "total", the row count before deduplication
+        """
+        if dedupe_by == "email":
+            dedupe_key = "CASE WHEN TRIM(COALESCE(candidate_email, '')) <> '' THEN LOWER(TRIM(candidate_email)) ELSE id::text END"
+        else:
+            dedupe_key = "id::text"
+        
+        try:
+            pool = await self._get_pool()
+            async with pool.acquire() as conn:
+                # The window count runs before DISTINCT ON, so it reports the pre-dedupe row count
+                records = await conn.fetch(f'''
+                    SELECT * FROM (
+                        SELECT DISTINCT ON (dedupe_key)
+                               id, filename, candidate_name, candidate_email, candidate_phone,
+                               total_experience, file_type, file_size, created_at, has_embedding,
+                               parsed_data, COUNT(*) OVER () AS total_rows
+                        FROM (
+                            SELECT id, filename, candidate_name, candidate_email, candidate_phone,
+                                   total_experience, file_type, file_size, created_at, parsed_data,
+                                   CASE WHEN jsonb_typeof(embedding) = 'array'
+                                        THEN jsonb_array_length(embedding) > 0
+                                        ELSE FALSE END AS has_embedding,
+                                   {dedupe_key} AS dedupe_key
+                            FROM resume_data
+                            WHERE company_id = $1
+                            ORDER BY created_at DESC
+                            LIMIT $2
+                        ) recent
+                        ORDER BY dedupe_key, created_at DESC
+                    ) unique_resumes
+                    ORDER BY created_at DESC
+                ''', company_id, limit)
+                
+                resumes = []
+                for record in records:
+                    resume = dict(record)
+                    resume.pop('total_rows')
+                    resume['created_at'] = record['created_at'].isoformat() if record['created_at'] else None
+                    resumes.append(resume)
+                return {
+                    "resumes": resumes,
+                    "total": records[0]['total_rows'] if records else 0
+                }
+        except Exception as e:
+            logger.error(f"Error getting resume listing: {str(e)}")
+            raise Exception(f"Failed to get resume listing: {str(e)}")
+
+    async def get_resumes_missing_embedding(self, limit: int = 1000, company_id: int = None) -> List[Dict[str, Any]]:
+        """
+        Get the resumes that still need an embedding, newest first.
+        
+        A resume needs one when its embedding column is NULL and its parsed_data
+        carries no (legacy) non-empty "embedding" either; the filter runs in SQL
+        so only rows that need work, and only the columns the backfill uses, are fetched.
+        
+        Args:
+            limit (int): Maximum number of records to return
+            company_id (int): Optional company ID for data isolation
+            
+        Returns:
+            List[Dict[str, Any]]: id, filename, candidate_name and parsed_data of each resume
+        """
+        # Separate statements for the scoped and unscoped reads, so each plans onto its own partial index
+        params = [limit]
+        company_filter = ""
+        if company_id is not None:
+            company_filter = "AND company_id = $2"
+            params.append(company_id)
+        
+        try:
+            pool = await self._get_pool()
+            async with pool.acquire() as conn:
+                records = await conn.fetch(f'''
+                    SELECT id, filename, candidate_name, parsed_data
+                    FROM resume_data
+                    WHERE embedding IS NULL
+                      AND COALESCE(parsed_data->'embedding', 'null'::jsonb)
+                          IN ('null'::jsonb, '[]'::jsonb, '""'::jsonb, '{{}}'::jsonb, 'false'::jsonb, '0'::jsonb)
+                      {company_filter}
+                    ORDER BY created_at DESC
+                    LIMIT $1
+                ''', *params)
+                return [dict(record) for record in records]
+        except Exception as e:
+            logger.error(f"Error getting resumes missing embeddings: {str(e)}")
+            raise Exception(f"Failed to get resumes missing embeddings: {str(e)}")
+
+    async def get_embeddings_by_text_hash(self, text_hashes: List[str]) -> Dict[str, str]:
+        """
+        Find stored embeddings generated from exactly the given embedding texts.
+        
+        Args:
+            text_hashes (List[str]): SHA-256 hex digests of embedding texts
+            
+        Returns:
+            Dict[str, str]: Text hash -> embedding (JSON-encoded, as stored) for every hash already embedded
+        """
+        if not text_hashes:
+            return {}
+        
+        try:
+            pool = await self._get_pool()
+            async with pool.acquire() as conn:
+                records = await conn.fetch('''
+                    SELECT DISTINCT ON (embedding_text_hash) embedding_text_hash, embedding
+                    FROM resume_data
+                    WHERE embedding_text_hash = ANY($1::char(64)[])
+                      AND embedding IS NOT NULL
+                ''', text_hashes)
+                return {record['embedding_text_hash']: record['embedding'] for record in records}
+        except Exception as e:
+            logger.error(f"Error looking up embeddings by text hash: {str(e)}")
+            raise Exception(f"Failed to look up embeddings by text hash: {str(e)}")
+
     async def get_all_resumes_with_embeddings(self, limit: int = 100, offset: int = 0, company_id: int = None) -> List[Dict[str, Any]]:
         """
         Get all resume records with embeddings for semantic matching.
@@ -1429,6 +1632,48 @@ class DatabaseService:
             logger.error(f"Error updating resume embedding column for resume {resume_id}: {str(e)}")
             raise Exception(f"Failed to update resume embedding column: {str(e)}")
 
+    async def update_resume_embeddings_bulk(self, rows: List[tuple], batch_size: int = 1000) -> List[int]:
+        """
+        Update the separate embedding column for many resumes at once.
+
+        Args:
+            rows (List[tuple]): (resume_id, embedding, embedding_text_hash) tuples; the embedding
+                may be a list or already JSON-encoded (e.g. reused from another row)
+            batch_size (int): Rows per UPDATE statement (keeps bind params under the protocol limit)
+
+        Returns:
+            List[int]: IDs of the resumes that were updated
+        """
+        if not rows:
+            return []
+
+        try:
+            pool = await self._get_pool()
+            updated = []
+            async with pool.acquire() as conn:
+                for start in range(0, len(rows), batch_size):
+                    chunk = rows[start:start + batch_size]
+                    placeholders = []
+                    values = []
+                    for i, (resume_id, embedding, text_hash) in enumerate(chunk):
+                        placeholders.append(f"(${i * 3 + 1}::int, ${i * 3 + 2}::jsonb, ${i * 3 + 3}::char(64))")
+                        values.extend((resume_id, embedding if isinstance(embedding, str) else json.dumps(embedding), text_hash))
+
+                    records = await conn.fetch(f'''
+                        UPDATE resume_data
+                        SET embedding = data.emb, embedding_text_hash = data.text_hash
+                        FROM (VALUES {', '.join(placeholders)}) AS data(id, emb, text_hash)
+                        WHERE resume_data.id = data.id
+                        RETURNING resume_data.id
+                    ''', *values)
+                    updated.extend(record['id'] for record in records)
+
+            logger.info(f"Bulk updated embeddings for {len(updated)}/{len(rows)} resumes")
+            return updated
+        except Exception as e:
+            logger.error(f"Error bulk updating resume embeddings: {str(e)}")
+            raise Exception(f"Failed to bulk update resume embeddings: {str(e)}")
+
     async def update_resume_embedding_error(self, resume_id: int, error_message: str) -> bool:
         """Update the embedding error column in the resume table."""
         try:
@@ -1776,6 +2021,55 @@ class DatabaseService:
             logger.error(f"Error getting failed resume by ID {resume_id}: {str(e)}")
             return None
 
+    async def get_failed_resumes_by_ids(self, resume_ids: List[str], company_id: int, include_content: bool = False) -> Dict[str, Dict[str, Any]]:
+        """
+        Get many failed resumes of a company with one query.
+        
+        Args:
+            resume_ids: The resume IDs to look up
+            company_id: The company ID for isolation
+            include_content: Also return each record's stored file_content (callers bound len(resume_ids))
+            
+        Returns:
+            Dict mapping resume ID to its newest failed resume record; missing IDs are absent
+            
+        Raises:
+            Exception: If the records could not be read (after one retry on a dropped connection)
+        """
+        if not resume_ids:
+            return {}
+        
+        query = f"""
+            SELECT DISTINCT ON (id) id, filename, file_path, error_message, created_at,
+                   parsed_data, company_id, user_id{', file_content' if include_content else ''}
+            FROM failed_resumes 
+            WHERE id = ANY($1) AND company_id = $2
+            ORDER BY id, created_at DESC
+        """
+        
+        async def fetch_records():
+            pool = await self._get_pool()
+            async with pool.acquire() as conn:
+                return await conn.fetch(query, resume_ids, company_id)
+        
+        # A failed lookup is raised, never returned as "no records": callers would report every ID as missing
+        try:
+            try:
+                records = await fetch_records()
+            except (RuntimeError, InterfaceError, ConnectionDoesNotExistError) as e:
+                # Handle loop/connection issues: reinitialize pool and retry once
+                logger.warning(f"Transient DB error in get_failed_resumes_by_ids: {e.__class__.__name__}: {str(e)} - reinitializing and retrying once")
+                async with self._init_lock:
+                    self._init_done = False
+                    self.pool = None
+                    await self._initialize()
+                records = await fetch_records()
+        except Exception as e:
+            logger.error(f"Error getting {len(resume_ids)} failed resumes by ID: {str(e)}")
+            raise
+        
+        return {str(record['id']): dict(record) for record in records}
+
     async def get_failed_resume_file_content(self, resume_id: str, company_id: int) -> Optional[bytes]:
         """
         Get the actual file content of a failed resume.
@@ -1801,22 +2095,23 @@ class DatabaseService:
                 """
                 
                 record = await conn.fetchrow(query, resume_id, company_id)
-                
-                if record:
-                    # Try to get content from database first
-                    if record['file_content']:
-                        return record['file_content']
-                    
-                    # Fallback: try to read from file path
-                    if record['file_path']:
-                        import os
-                        if os.path.exists(record['file_path']):
-                            with open(record['file_path'], 'rb') as f:
-                                return f.read()
-                    
-                    return None
-                else:
+            
+            if not record:
+                return None
+            
+            # Try to get content from database first
+            if record['file_content']:
+                return record['file_content']
+            
+            # Fallback: read from file path (after releasing the connection, without blocking the loop)
+            if record['file_path']:
+                try:
+                    async with aiofiles.open(record['file_path'], 'rb') as f:
+                        return await f.read()
+                except FileNotFoundError:
                     return None
+            
+            return None
                     
         except Exception as e:
             logger.error(f"Error getting failed resume file content {resume_id}: {str(e)}")
@@ -1841,60 +2136,104 @@ class DatabaseService:
             async with pool.acquire() as conn:
                 # Start transaction
                 async with conn.transaction():
-                    # Insert into resumes table
-                    resume_query = """
-                        INSERT INTO resumes (filename, parsed_data, company_id, user_id, created_at, updated_at)
-                        VALUES ($1, $2, $3, $4, NOW(), NOW())
-                        RETURNING id
-                    """
-                    
-                    resume_id = await conn.fetchval(
-                        resume_query,
-                        original_filename,
-                        json.dumps(parsed_data),
-                        company_id,
-                        user_id
-                    )
-                    
-                    # Insert into candidates table
-                    candidate_query = """
-                        INSERT INTO candidates (
-                            first_name, last_name, email, phone, location, 
-                            skills, experience_years, resume_id, company_id, 
-                            created_at, updated_at
-                        ) VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, NOW(), NOW())
-                        RETURNING id
-                    """
-                    
-                    # Extract data from parsed_data
-                    first_name = parsed_data.get('name', '').split(' ')[0] if parsed_data.get('name') else ''
-                    last_name = ' '.join(parsed_data.get('name', '').split(' ')[1:]) if parsed_data.get('name') and len(parsed_data.get('name', '').split(' ')) > 1 else ''
-                    email = parsed_data.get('email', '')
-                    phone = parsed_data.get('phone', '')
-                    location = parsed_data.get('location', '')
-                    skills = json.dumps(parsed_data.get('skills', []))
-                    experience_years = parsed_data.get('experience_years', 0)
-                    
-                    candidate_id = await conn.fetchval(
-                        candidate_query,
-                        first_name,
-                        last_name,
-                        email,
-                        phone,
-                        location,
-                        skills,
-                        experience_years,
-                        resume_id,
-                        company_id
-                    )
-                    
-                    logger.info(f"Successfully saved processed resume: candidate_id={candidate_id}, resume_id={resume_id}")
+                    candidate_id = await self._insert_processed_resume(conn, parsed_data, company_id, user_id, original_filename)
                     return candidate_id
                     
         except Exception as e:
             logger.error(f"Error saving processed resume: {str(e)}")
             return None
 
+    async def save_processed_resumes_bulk(self, items: List[tuple], company_id: int, user_id: int) -> Dict[str, tuple]:
+        """
+        Save many re-parsed failed resumes and remove their failed records in one transaction.
+        
+        Args:
+            items: (failed_resume_id, parsed_data, original_filename) tuples
+            company_id: The company ID
+            user_id: The user ID
+            
+        Returns:
+            Dict mapping failed resume ID to (candidate_id, failed_record_cleaned)
+            
+        Raises:
+            Exception: If the batch could not be saved (nothing is committed)
+        """
+        if not items:
+            return {}
+        
+        pool = await self._get_pool()
+        async with pool.acquire() as conn:
+            async with conn.transaction():
+                candidate_ids = {}
+                for failed_resume_id, parsed_data, original_filename in items:
+                    candidate_ids[failed_resume_id] = await self._insert_processed_resume(conn, parsed_data, company_id, user_id, original_filename)
+                
+                # Remove every failed resume record that is now successfully processed with one DELETE
+                removed = await conn.fetch("""
+                    DELETE FROM failed_resumes 
+                    WHERE company_id = $1 AND id = ANY($2)
+                    RETURNING id
+                """, company_id, list(candidate_ids))
+        
+        cleaned = {str(record['id']) for record in removed}
+        logger.info(f"Saved {len(candidate_ids)} processed resumes and removed {len(cleaned)} failed records")
+        return {
+            failed_resume_id: (candidate_id, failed_resume_id in cleaned)
+            for failed_resume_id, candidate_id in candidate_ids.items()
+        }
+
+    async def _insert_processed_resume(self, conn, parsed_data: Dict[str, Any], company_id: int, user_id: int, original_filename: str) -> int:
+        """Insert a processed resume and its candidate on conn (inside the caller's transaction)."""
+        # Insert into resumes table
+        resume_query = """
+            INSERT INTO resumes (filename, parsed_data, company_id, user_id, created_at, updated_at)
+            VALUES ($1, $2, $3, $4, NOW(), NOW())
+            RETURNING id
+        """
+        
+        resume_id = await conn.fetchval(
+            resume_query,
+            original_filename,
+            json.dumps(parsed_data),
+            company_id,
+            user_id
+        )
+        
+        # Insert into candidates table
+        candidate_query = """
+            INSERT INTO candidates (
+                first_name, last_name, email, phone, location, 
+                skills, experience_years, resume_id, company_id, 
+                created_at, updated_at
+            ) VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, NOW(), NOW())
+            RETURNING id
+        """
+        
+        # Extract data from parsed_data
+        first_name = parsed_data.get('name', '').split(' ')[0] if parsed_data.get('name') else ''
+        last_name = ' '.join(parsed_data.get('name', '').split(' ')[1:]) if parsed_data.get('name') and len(parsed_data.get('name', '').split(' ')) > 1 else ''
+        email = parsed_data.get('email', '')
+        phone = parsed_data.get('phone', '')
+        location = parsed_data.get('location', '')
+        skills = json.dumps(parsed_data.get('skills', []))
+        experience_years = parsed_data.get('experience_years', 0)
+        
+        candidate_id = await conn.fetchval(
+            candidate_query,
+            first_name,
+            last_name,
+            email,
+            phone,
+            location,
+            skills,
+            experience_years,
+            resume_id,
+            company_id
+        )
+        
+        logger.info(f"Successfully saved processed resume: candidate_id={candidate_id}, resume_id={resume_id}")
+        return candidate_id
+
     async def remove_failed_resume(self, resume_id: str, company_id: int) -> bool:
         """
         Remove a successfully re-parsed resume from failed_resumes table
@@ -5,11 +5,14 @@ Extracts text content from various file types including PDF, DOCX, images, etc.
 
 import io
 import os
+import asyncio
 import tempfile
 import subprocess
 import shutil
 import logging
-from typing import Optional, List
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional, List, Tuple
 
 # Import file processing libraries
 import fitz  # PyMuPDF
@@ -24,6 +27,69 @@ from app.config.settings import settings
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Worker processes for extracting text from large files, created on first use (per app process)
+_PROCESS_POOL: Optional[ProcessPoolExecutor] = None
+
+def _get_process_pool() -> ProcessPoolExecutor:
+    """Return the shared extraction process pool, creating it on first use."""
+    global _PROCESS_POOL
+    if _PROCESS_POOL is None:
+        # Not fork: the app process already runs the event loop and OCR threads. Not spawn either where
+        # forkserver exists, since spawned children re-import __main__ (building the whole app under
+        # `python -m app.main`); forkserver children only load this module, once, in the server process.
+        if "forkserver" in multiprocessing.get_all_start_methods():
+            context = multiprocessing.get_context("forkserver")
+            context.set_forkserver_preload([__name__])
+        else:
+            context = multiprocessing.get_context("spawn")
+        _PROCESS_POOL = ProcessPoolExecutor(max_workers=settings.EXTRACTION_PROCESSES, mp_context=context)
+    return _PROCESS_POOL
+
+def shutdown_process_pool() -> None:
+    """Shut down the extraction process pool (application shutdown)."""
+    global _PROCESS_POOL
+    if _PROCESS_POOL is not None:
+        _PROCESS_POOL.shutdown(wait=False, cancel_futures=True)
+        _PROCESS_POOL = None
+
+async def _run_extraction(func, file_content: bytes):
+    """
+    Run a module-level extraction function off the event loop.
+    
+    Large files go to the extraction process pool; smaller ones, which PyMuPDF or
+    docx2txt handle in milliseconds, run in a thread rather than paying to pickle
+    the file across processes.
+    """
+    if settings.EXTRACTION_PROCESSES > 0 and len(file_content) >= settings.EXTRACTION_PROCESS_MIN_BYTES:
+        return await asyncio.get_running_loop().run_in_executor(_get_process_pool(), func, file_content)
+    return await asyncio.to_thread(func, file_content)
+
+def _extract_pdf_page_texts(file_content: bytes) -> Tuple[int, List[str]]:
+    """
+    Extract the raw text of every page of a PDF (runs in a worker thread or process).
+    
+    Args:
+        file_content (bytes): PDF file content
+        
+    Returns:
+        Tuple[int, List[str]]: Page count and the non-blank page texts in page order
+    """
+    page_texts = []
+    with fitz.open(stream=file_content, filetype="pdf") as pdf_document:
+        page_count = len(pdf_document)
+        for page_num in range(page_count):
+            try:
+                page_text = pdf_document.load_page(page_num).get_text()
+                if page_text.strip():
+                    page_texts.append(page_text)
+            except Exception as e:
+                logger.warning(f"Error processing page {page_num + 1}: {str(e)}")
+    return page_count, page_texts
+
+def _extract_docx_text(file_content: bytes) -> str:
+    """Extract the raw text of a DOCX file (runs in a worker thread or process)."""
+    return docx2txt.process(io.BytesIO(file_content))
+
 class FileProcessor:
     """Service for processing different file formats and extracting text content."""
     
@@ -112,47 +178,39 @@ class FileProcessor:
         try:
             logger.info(f"Processing PDF file: {len(file_content)} bytes")
             
-            # Open PDF with PyMuPDF from bytes
-            with fitz.open(stream=file_content, filetype="pdf") as pdf_document:
-                logger.info(f"PDF opened successfully: {len(pdf_document)} pages")
-                
-                # Extract text from all pages
-                text_content = []
-                for page_num in range(len(pdf_document)):
-                    try:
-                        page = pdf_document.load_page(page_num)
-                        page_text = page.get_text()
-                        
-                        if page_text.strip():
-                            cleaned_text = self._clean_and_normalize_text(page_text)
-                            if cleaned_text:
-                                text_content.append(cleaned_text)
-                                logger.debug(f"Page {page_num + 1}: {len(cleaned_text)} characters")
-                    except Exception as e:
-                        logger.warning(f"Error processing page {page_num + 1}: {str(e)}")
-                        continue
-                
-                # Join all page content
-                full_text = "\n".join(text_content)
-                logger.info(f"Initial text extraction: {len(full_text)} characters")
-                
-                # If text is too sparse, try OCR on first few pages
-                if len(full_text.strip()) < settings.MIN_TEXT_LENGTH_FOR_OCR:
-                    logger.warning(f"PDF text too sparse ({len(full_text)} chars), attempting OCR on first pages")
-                    if self.ocr_available:
+            # Parse the PDF with PyMuPDF off the event loop (in a worker process for large files)
+            page_count, page_texts = await _run_extraction(_extract_pdf_page_texts, file_content)
+            logger.info(f"PDF opened successfully: {page_count} pages")
+            
+            # Clean the text of every page
+            text_content = []
+            for page_text in page_texts:
+                cleaned_text = self._clean_and_normalize_text(page_text)
+                if cleaned_text:
+                    text_content.append(cleaned_text)
+            
+            # Join all page content
+            full_text = "\n".join(text_content)
+            logger.info(f"Initial text extraction: {len(full_text)} characters")
+            
+            # If text is too sparse, try OCR on first few pages
+            if len(full_text.strip()) < settings.MIN_TEXT_LENGTH_FOR_OCR:
+                logger.warning(f"PDF text too sparse ({len(full_text)} chars), attempting OCR on first pages")
+                if self.ocr_available:
+                    with fitz.open(stream=file_content, filetype="pdf") as pdf_document:
                         ocr_text = await self._process_pdf_with_ocr(file_content, pdf_document)
-                        if ocr_text and len(ocr_text.strip()) > len(full_text.strip()):
-                            full_text = ocr_text
-                            logger.info(f"OCR improved text extraction: {len(full_text)} characters")
-                        else:
-                            logger.warning("OCR did not improve text extraction")
+                    if ocr_text and len(ocr_text.strip()) > len(full_text.strip()):
+                        full_text = ocr_text
+                        logger.info(f"OCR improved text extraction: {len(full_text)} characters")
                     else:
-                        logger.warning("OCR not available, returning sparse text")
-                
-                # Final cleanup and deduplication
-                final_text = self._finalize_text_content(full_text)
-                logger.info(f"Successfully processed PDF: {len(final_text)} characters")
-                return final_text
+                        logger.warning("OCR did not improve text extraction")
+                else:
+                    logger.warning("OCR not available, returning sparse text")
+            
+            # Final cleanup and deduplication
+            final_text = self._finalize_text_content(full_text)
+            logger.info(f"Successfully processed PDF: {len(final_text)} characters")
+            return final_text
                 
         except Exception as e:
             logger.error(f"Error processing PDF: {str(e)}")
@@ -169,11 +227,8 @@ class FileProcessor:
             str: Extracted text content
         """
         try:
-            # Create a temporary file-like object
-            file_stream = io.BytesIO(file_content)
-            
-            # Extract text using docx2txt
-            text_content = docx2txt.process(file_stream)
+            # Extract text using docx2txt off the event loop (in a worker process for large files)
+            text_content = await _run_extraction(_extract_docx_text, file_content)
             
             if not text_content or not text_content.strip():
                 raise Exception("No text content found in the document")
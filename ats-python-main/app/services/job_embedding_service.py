@@ -119,9 +119,8 @@ class JobEmbeddingService:
             logger.info(f"   🏢 Company: {job_data.get('company', 'Unknown')}")
             logger.info(f"   🆔 Job ID: {job_data.get('id', 'Unknown')}")
             
-            # Generate embedding using OpenAI API (same model as resume embeddings)
-            from app.services.openai_service import OpenAIService
-            openai_service = OpenAIService()
+            # Generate embedding using OpenAI API (same model as resume embeddings), on the shared service
+            from app.services.openai_service import openai_service
             embedding = await openai_service.generate_embedding(embedding_text)
             
             if embedding:
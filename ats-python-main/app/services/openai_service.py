@@ -7,12 +7,47 @@ import json
 import logging
 from typing import Dict, Any, Optional, List
 from datetime import datetime
+import httpx
 import openai
 from app.config.settings import settings
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Inputs sent per embeddings request by generate_embeddings_batch
+EMBEDDING_BATCH_SIZE = 96
+
+# Async client shared by every OpenAIService for embeddings, over one pooled HTTP/2 connection set
+_async_client: Optional[openai.AsyncOpenAI] = None
+
+
+def get_async_client() -> openai.AsyncOpenAI:
+    """
+    Return the process-wide async OpenAI client, creating it on first use.
+    
+    Returns:
+        openai.AsyncOpenAI: Client whose keep-alive HTTP/2 connections are reused across calls
+    """
+    global _async_client
+    if _async_client is None:
+        _async_client = openai.AsyncOpenAI(
+            api_key=settings.OPENAI_API_KEY,
+            http_client=httpx.AsyncClient(
+                http2=True,
+                limits=httpx.Limits(max_connections=64, max_keepalive_connections=32),
+                timeout=httpx.Timeout(60.0, connect=5.0)
+            )
+        )
+    return _async_client
+
+
+async def close_async_client() -> None:
+    """Close the shared async OpenAI client and its connection pool (application shutdown)."""
+    global _async_client
+    if _async_client is not None:
+        await _async_client.close()
+        _async_client = None
+
 class OpenAIService:
     """Service for OpenAI API integration and resume parsing."""
     
@@ -49,7 +84,7 @@ class OpenAIService:
             
             # Call OpenAI API (with compact-and-retry on context overflow)
             try:
-                response = self._call_openai_api(prompt)
+                response = await self._call_openai_api(prompt)
             except Exception as e:
                 msg = str(e).lower()
                 if "context_length_exceeded" in msg or "maximum context length" in msg or "too long" in msg:
@@ -57,7 +92,7 @@ class OpenAIService:
                     # Further shrink input and retry once
                     reduced_text = resume_text[: max(10000, int(len(resume_text) * 0.5))]
                     reduced_prompt = self._create_resume_parsing_prompt(reduced_text)
-                    response = self._call_openai_api(reduced_prompt)
+                    response = await self._call_openai_api(reduced_prompt)
                 else:
                     raise
             
@@ -174,9 +209,9 @@ Return the parsed data in this exact JSON format:
 """
         return prompt.strip()
     
-    def _call_openai_api(self, prompt: str) -> str:
+    async def _call_openai_api(self, prompt: str) -> str:
         """
-        Make API call to OpenAI.
+        Make API call to OpenAI on the shared async client, so the event loop keeps serving while it waits.
         
         Args:
             prompt (str): The prompt to send to OpenAI
@@ -189,7 +224,7 @@ Return the parsed data in this exact JSON format:
         """
         try:
             # Make the API call
-            response = self.client.chat.completions.create(
+            response = await get_async_client().chat.completions.create(
                 model=settings.OPENAI_MODEL,
                 messages=[
                     {
@@ -697,8 +732,8 @@ Return the parsed data in this exact JSON format:
                 cleaned_text = cleaned_text[:8191]
                 logger.info("Text truncated to 8191 characters for embedding generation")
             
-            # Generate embedding using OpenAI API
-            response = self.client.embeddings.create(
+            # Generate embedding using OpenAI API over the shared pooled async client
+            response = await get_async_client().embeddings.create(
                 model="text-embedding-3-small",
                 input=cleaned_text
             )
@@ -713,6 +748,44 @@ Return the parsed data in this exact JSON format:
             logger.error(f"Error generating embedding: {str(e)}")
             return None
 
+    async def generate_embeddings_batch(self, texts: List[str]) -> List[Optional[List[float]]]:
+        """
+        Generate embeddings for many texts with multi-input requests.
+        
+        Texts are sent EMBEDDING_BATCH_SIZE per request, so N texts cost
+        ceil(N / EMBEDDING_BATCH_SIZE) round trips instead of N.
+        
+        Args:
+            texts (List[str]): Texts to generate embeddings for
+            
+        Returns:
+            List[Optional[List[float]]]: Embeddings aligned with texts; None for empty
+            texts and for every text of a request that failed
+        """
+        embeddings: List[Optional[List[float]]] = [None] * len(texts)
+        # Same cleaning as generate_embedding; empty texts are never sent
+        pending = [
+            (position, text.strip()[:8191])
+            for position, text in enumerate(texts)
+            if text and text.strip()
+        ]
+        
+        for start in range(0, len(pending), EMBEDDING_BATCH_SIZE):
+            batch = pending[start:start + EMBEDDING_BATCH_SIZE]
+            try:
+                response = await get_async_client().embeddings.create(
+                    model="text-embedding-3-small",
+                    input=[text for _, text in batch]
+                )
+                # Each item carries the index of its input within the request
+                for item in response.data:
+                    embeddings[batch[item.index][0]] = item.embedding
+            except Exception as e:
+                logger.error(f"Error generating embeddings for a batch of {len(batch)} texts: {str(e)}")
+        
+        logger.info(f"Successfully generated {sum(1 for embedding in embeddings if embedding)}/{len(texts)} embeddings")
+        return embeddings
+
     async def parse_resume_text_parallel(self, texts: List[str]) -> List[Dict]:
         """Parse multiple resumes in parallel for ultra-fast processing."""
         import asyncio
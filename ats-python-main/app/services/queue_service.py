@@ -4,35 +4,65 @@ Uses Redis for job queuing and async processing.
 """
 
 import json
+import os
+import socket
 import uuid
 import logging
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, List, Tuple
 from datetime import datetime, timedelta
 import redis
+import redis.asyncio as aioredis
 from app.config.settings import settings
+from app.services.redis_pool import QUEUE_DB, get_redis_pool, get_async_redis_pool
 
 logger = logging.getLogger(__name__)
 
+# Commands sent per pipeline flush when bulk-enqueueing (each job is SET + LPUSH + HSET + EXPIRE)
+PIPELINE_MAX_COMMANDS = 10000
+COMMANDS_PER_JOB = 4
+# Queued resume files are stored as raw bytes under their own key, kept as long as the job status
+JOB_FILE_TTL_SECONDS = 86400
+
+
+def job_file_key(job_id: str) -> str:
+    """Redis key holding the raw file bytes of a queued resume job."""
+    return f"jobfile:{job_id}"
+
+# Redis list of failed-resume re-upload jobs waiting for a worker
+REUPLOAD_QUEUE = "reupload_processing_queue"
+# A worker moves each re-upload job it takes into its own processing list until the job is finished;
+# the list is handed back to the queue if the worker's heartbeat key expires (it died or restarted)
+REUPLOAD_HEARTBEAT_TTL_SECONDS = 30
+
+
+def reupload_processing_key(worker_id: str) -> str:
+    """Redis list of re-upload jobs taken by a worker and not yet finished."""
+    return f"reupload_processing:{worker_id}"
+
+
+def reupload_heartbeat_key(worker_id: str) -> str:
+    """Redis key that exists while a re-upload worker is alive."""
+    return f"reupload_worker:{worker_id}"
+
 class QueueService:
     """Service for managing resume processing queue."""
     
     def __init__(self):
         """Initialize Redis connection."""
+        # Identifies this process's re-upload processing list
+        self.worker_id = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
         try:
-            self.redis_client = redis.Redis(
-                host='147.93.155.233',  # Change to your Redis server
-                port=6379,
-                db=0,
-                decode_responses=True,
-                socket_connect_timeout=5,
-                socket_timeout=5
-            )
-            # Test connection
-            self.redis_client.ping()
+            # Test connection (synchronously, since there is no event loop at import time)
+            redis.Redis(connection_pool=get_redis_pool(QUEUE_DB)).ping()
+            # Requests use the asyncio client so Redis round trips never block the event loop
+            self.redis_client = aioredis.Redis(connection_pool=get_async_redis_pool(QUEUE_DB))
+            # Queued file bytes are read back undecoded
+            self.binary_client = aioredis.Redis(connection_pool=get_async_redis_pool(QUEUE_DB, decode_responses=False))
             logger.info("✅ Redis connection established successfully")
         except Exception as e:
             logger.error(f"❌ Redis connection failed: {str(e)}")
             self.redis_client = None
+            self.binary_client = None
     
     async def add_resume_job(self, file_data: bytes, filename: str, user_id: str = None) -> str:
         """
@@ -53,7 +83,6 @@ class QueueService:
         job_data = {
             "job_id": job_id,
             "filename": filename,
-            "file_data": file_data.hex(),  # Convert bytes to hex string
             "user_id": user_id,
             "created_at": datetime.now().isoformat(),
             "status": "queued",
@@ -61,18 +90,25 @@ class QueueService:
         }
         
         try:
+            pipe = self.redis_client.pipeline(transaction=False)
+            
+            # Store the file bytes as-is; the queue entry only carries metadata
+            pipe.set(job_file_key(job_id), file_data, ex=JOB_FILE_TTL_SECONDS)
+            
             # Add to processing queue
-            self.redis_client.lpush("resume_processing_queue", json.dumps(job_data))
+            pipe.lpush("resume_processing_queue", json.dumps(job_data))
             
             # Set job status
-            self.redis_client.hset(f"job_status:{job_id}", mapping={
+            pipe.hset(f"job_status:{job_id}", mapping={
                 "status": "queued",
                 "created_at": job_data["created_at"],
                 "filename": filename
             })
             
             # Set expiration (24 hours)
-            self.redis_client.expire(f"job_status:{job_id}", 86400)
+            pipe.expire(f"job_status:{job_id}", 86400)
+            
+            await pipe.execute()
             
             logger.info(f"✅ Job {job_id} added to queue for file: {filename}")
             return job_id
@@ -81,6 +117,156 @@ class QueueService:
             logger.error(f"❌ Failed to add job to queue: {str(e)}")
             raise Exception(f"Failed to queue resume processing: {str(e)}")
     
+    async def get_job_file(self, job_data: Dict[str, Any]) -> Optional[bytes]:
+        """
+        Fetch the file bytes of a queued resume job.
+        
+        Args:
+            job_data: Queue entry as popped from resume_processing_queue
+            
+        Returns:
+            Optional[bytes]: File content, or None if it expired or was never stored
+        """
+        # Entries queued before files moved to their own key still carry them hex-encoded
+        if "file_data" in job_data:
+            return bytes.fromhex(job_data["file_data"])
+        if not self.binary_client:
+            return None
+        return await self.binary_client.get(job_file_key(job_data["job_id"]))
+    
+    async def delete_job_file(self, job_id: str) -> None:
+        """Drop the stored file bytes of a finished resume job."""
+        if self.redis_client:
+            await self.redis_client.delete(job_file_key(job_id))
+    
+    async def add_reupload_job(self, job_id: str, failed_resume_ids: List[str], company_id: int) -> None:
+        """
+        Queue a failed-resume re-upload job for whichever worker is free.
+        
+        Args:
+            job_id: Re-upload job identifier (its state is tracked as a bulk job)
+            failed_resume_ids: Failed resume IDs to re-process
+            company_id: Company the resumes belong to
+        """
+        if not self.redis_client:
+            raise Exception("Redis connection not available")
+        
+        await self.redis_client.lpush(REUPLOAD_QUEUE, json.dumps({
+            "job_id": job_id,
+            "failed_resume_ids": failed_resume_ids,
+            "company_id": company_id
+        }))
+        logger.info(f"✅ Re-upload job {job_id} queued with {len(failed_resume_ids)} resumes")
+    
+    async def pop_reupload_job(self, timeout: int = 2) -> Optional[Tuple[Dict[str, Any], str]]:
+        """
+        Wait briefly for the next queued re-upload job and claim it for this worker.
+        
+        The job is moved atomically into this worker's processing list, so it is
+        not lost if the worker dies before finishing it; call ack_reupload_job
+        once it is done.
+        
+        Args:
+            timeout: Seconds to block (kept below the client's socket timeout)
+            
+        Returns:
+            Optional[Tuple[Dict[str, Any], str]]: The job (job_id, failed_resume_ids, company_id)
+            and its raw queue entry, or None if the queue stayed empty
+        """
+        if not self.redis_client:
+            return None
+        
+        raw = await self.redis_client.blmove(
+            REUPLOAD_QUEUE, reupload_processing_key(self.worker_id), timeout, src="RIGHT", dest="LEFT"
+        )
+        return (json.loads(raw), raw) if raw else None
+    
+    async def ack_reupload_job(self, raw: str) -> None:
+        """Drop a finished re-upload job from this worker's processing list."""
+        if self.redis_client:
+            await self.redis_client.lrem(reupload_processing_key(self.worker_id), 1, raw)
+    
+    async def heartbeat_reupload_worker(self) -> None:
+        """Mark this re-upload worker alive for REUPLOAD_HEARTBEAT_TTL_SECONDS."""
+        if self.redis_client:
+            await self.redis_client.set(reupload_heartbeat_key(self.worker_id), "1", ex=REUPLOAD_HEARTBEAT_TTL_SECONDS)
+    
+    async def requeue_orphaned_reupload_jobs(self) -> int:
+        """
+        Hand re-upload jobs claimed by workers that are no longer alive back to the queue.
+        
+        Returns:
+            int: Number of jobs requeued
+        """
+        if not self.redis_client:
+            return 0
+        
+        prefix = reupload_processing_key("")
+        requeued = 0
+        async for key in self.redis_client.scan_iter(match=f"{prefix}*"):
+            worker_id = key[len(prefix):]
+            if worker_id == self.worker_id or await self.redis_client.exists(reupload_heartbeat_key(worker_id)):
+                continue
+            # Oldest claim first, onto the end the workers pop from
+            while await self.redis_client.lmove(key, REUPLOAD_QUEUE, src="RIGHT", dest="RIGHT"):
+                requeued += 1
+        if requeued:
+            logger.info(f"♻️ Requeued {requeued} re-upload jobs from workers that stopped")
+        return requeued
+    
+    async def add_resume_jobs_pipeline(self, payloads: List[Tuple[bytes, str]], user_id: str = None) -> List[Optional[str]]:
+        """
+        Add many resume processing jobs to the queue using pipelined Redis writes.
+        
+        Jobs are flushed in chunks of up to PIPELINE_MAX_COMMANDS commands, so a
+        large upload costs a handful of round trips instead of three per file.
+        
+        Args:
+            payloads: (file_data, filename) tuples to enqueue
+            user_id: Optional user identifier
+            
+        Returns:
+            List[Optional[str]]: Job IDs aligned with payloads; None where the chunk failed to enqueue
+        """
+        if not self.redis_client:
+            raise Exception("Redis connection not available")
+        
+        job_ids: List[Optional[str]] = []
+        jobs_per_flush = max(1, PIPELINE_MAX_COMMANDS // COMMANDS_PER_JOB)
+        
+        for start in range(0, len(payloads), jobs_per_flush):
+            chunk = payloads[start:start + jobs_per_flush]
+            chunk_ids = [str(uuid.uuid4()) for _ in chunk]
+            created_at = datetime.now().isoformat()
+            
+            pipe = self.redis_client.pipeline(transaction=False)
+            for job_id, (file_data, filename) in zip(chunk_ids, chunk):
+                pipe.set(job_file_key(job_id), file_data, ex=JOB_FILE_TTL_SECONDS)
+                pipe.lpush("resume_processing_queue", json.dumps({
+                    "job_id": job_id,
+                    "filename": filename,
+                    "user_id": user_id,
+                    "created_at": created_at,
+                    "status": "queued",
+                    "retry_count": 0
+                }))
+                pipe.hset(f"job_status:{job_id}", mapping={
+                    "status": "queued",
+                    "created_at": created_at,
+                    "filename": filename
+                })
+                pipe.expire(f"job_status:{job_id}", 86400)
+            
+            try:
+                await pipe.execute()
+                job_ids.extend(chunk_ids)
+            except Exception as e:
+                logger.error(f"❌ Failed to add {len(chunk)} jobs to queue: {str(e)}")
+                job_ids.extend([None] * len(chunk))
+        
+        logger.info(f"✅ {sum(1 for job_id in job_ids if job_id)}/{len(payloads)} jobs added to queue")
+        return job_ids
+    
     async def get_job_status(self, job_id: str) -> Dict[str, Any]:
         """
         Get job processing status.
@@ -95,7 +281,7 @@ class QueueService:
             return {"error": "Redis connection not available"}
         
         try:
-            status_data = self.redis_client.hgetall(f"job_status:{job_id}")
+            status_data = await self.redis_client.hgetall(f"job_status:{job_id}")
             
             if not status_data:
                 return {"error": "Job not found"}
@@ -122,6 +308,35 @@ class QueueService:
             logger.error(f"❌ Failed to get job status: {str(e)}")
             return {"error": f"Failed to get job status: {str(e)}"}
     
+    async def scan_job_statuses(self, scan_count: int = 1000) -> List[Tuple[str, Dict[str, str]]]:
+        """
+        Load every job status hash without blocking Redis.
+        
+        Keys are walked with SCAN (instead of KEYS) and all hashes are fetched
+        with one pipelined HGETALL flush.
+        
+        Args:
+            scan_count: SCAN batch size hint
+            
+        Returns:
+            List[Tuple[str, Dict[str, str]]]: (job_id, status hash) pairs for jobs that still exist
+        """
+        if not self.redis_client:
+            return []
+        
+        job_keys = [job_key async for job_key in self.redis_client.scan_iter(match="job_status:*", count=scan_count)]
+        if not job_keys:
+            return []
+        
+        pipe = self.redis_client.pipeline(transaction=False)
+        for job_key in job_keys:
+            pipe.hgetall(job_key)
+        return [
+            (job_key[len("job_status:"):], job_data)
+            for job_key, job_data in zip(job_keys, await pipe.execute())
+            if job_data
+        ]
+    
     async def update_job_status(self, job_id: str, status: str, progress: str = None, 
                                result: Dict[str, Any] = None, error: str = None):
         """
@@ -152,7 +367,7 @@ class QueueService:
             if error is not None:
                 update_data["error"] = error
             
-            self.redis_client.hset(f"job_status:{job_id}", mapping=update_data)
+            await self.redis_client.hset(f"job_status:{job_id}", mapping=update_data)
             
             logger.info(f"📊 Job {job_id} status updated: {status}")
             
@@ -165,7 +380,7 @@ class QueueService:
             return 0
         
         try:
-            return self.redis_client.llen("resume_processing_queue")
+            return await self.redis_client.llen("resume_processing_queue")
         except Exception as e:
             logger.error(f"❌ Failed to get queue length: {str(e)}")
             return 0
@@ -185,7 +400,7 @@ class QueueService:
         
         try:
             # Check if job exists
-            job_data = self.redis_client.hgetall(f"job_status:{job_id}")
+            job_data = await self.redis_client.hgetall(f"job_status:{job_id}")
             if not job_data:
                 return False
             
@@ -216,13 +431,9 @@ class QueueService:
         
         try:
             cancelled_count = 0
-            job_keys = self.redis_client.keys("job_status:*")
             
-            for job_key in job_keys:
-                job_id = job_key.replace("job_status:", "")
-                job_data = self.redis_client.hgetall(job_key)
-                
-                if job_data and job_data.get("status") in ["queued", "processing"]:
+            for job_id, job_data in await self.scan_job_statuses():
+                if job_data.get("status") in ["queued", "processing"]:
                     # If user_id specified, only cancel jobs for that user
                     if user_id and job_data.get("user_id") != user_id:
                         continue
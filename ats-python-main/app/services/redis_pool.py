@@ -0,0 +1,81 @@
+"""
+Shared Redis connection pools.
+One bounded, blocking pool per database and response decoding, reused by every Redis client in the process.
+"""
+
+import logging
+from typing import Dict, Tuple
+import redis
+import redis.asyncio as aioredis
+from app.config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+# Redis databases: 0 holds the job queues and job state, 1 the rate-limit counters
+QUEUE_DB = 0
+RATE_LIMIT_DB = 1
+
+_pools: Dict[Tuple[int, bool], redis.BlockingConnectionPool] = {}
+_async_pools: Dict[Tuple[int, bool], aioredis.BlockingConnectionPool] = {}
+
+
+def _pool_kwargs(db: int, decode_responses: bool) -> Dict:
+    """Connection settings shared by the sync and asyncio pools."""
+    return dict(
+        host=settings.REDIS_HOST,
+        port=settings.REDIS_PORT,
+        db=db,
+        decode_responses=decode_responses,
+        max_connections=settings.REDIS_MAX_CONNECTIONS,
+        # At the cap, wait this long for a free connection instead of failing
+        timeout=settings.REDIS_POOL_TIMEOUT,
+        socket_connect_timeout=5,
+        socket_timeout=5,
+        socket_keepalive=True,
+        retry_on_timeout=True,
+        health_check_interval=30
+    )
+
+
+def get_redis_pool(db: int, decode_responses: bool = True) -> redis.BlockingConnectionPool:
+    """
+    Return the process-wide sync connection pool for a Redis database, creating it on first use.
+    
+    Args:
+        db: Redis database number
+        decode_responses: Whether clients on this pool decode replies to str
+        
+    Returns:
+        redis.BlockingConnectionPool: Pool whose connections are reused across clients
+    """
+    key = (db, decode_responses)
+    if key not in _pools:
+        _pools[key] = redis.BlockingConnectionPool(**_pool_kwargs(db, decode_responses))
+    return _pools[key]
+
+
+def get_async_redis_pool(db: int, decode_responses: bool = True) -> aioredis.BlockingConnectionPool:
+    """
+    Return the process-wide asyncio connection pool for a Redis database, creating it on first use.
+    
+    Args:
+        db: Redis database number
+        decode_responses: Whether clients on this pool decode replies to str
+        
+    Returns:
+        redis.asyncio.BlockingConnectionPool: Pool whose connections are reused across clients
+    """
+    key = (db, decode_responses)
+    if key not in _async_pools:
+        _async_pools[key] = aioredis.BlockingConnectionPool(**_pool_kwargs(db, decode_responses))
+    return _async_pools[key]
+
+
+async def close_redis_pools() -> None:
+    """Disconnect every shared Redis pool (application shutdown)."""
+    for pool in _async_pools.values():
+        await pool.disconnect()
+    for pool in _pools.values():
+        pool.disconnect()
+    _async_pools.clear()
+    _pools.clear()